@@ -26,7 +26,8 @@ class PredictionRequest(BaseModel):
 @router.post("/validate-signal")
 async def validate_signal(request: SignalValidationRequest):
     """Validate a trading signal."""
-    is_valid, confidence = signal_validator.validate_signal(
+    # Concurrent requests share one model call
+    is_valid, confidence = await signal_validator.validate_signal_batched(
         request.signal, request.market_features
     )
     return {"is_valid": is_valid, "confidence": confidence}
@@ -53,7 +54,9 @@ async def list_models():
     return {
         "signal_validator": {
             "loaded": signal_validator.model is not None,
-            "path": signal_validator.model_path
+            "path": signal_validator.model_path,
+            "cache_hits": signal_validator.cache_hits,
+            "cache_misses": signal_validator.cache_misses,
         },
         "price_predictor": {
             "loaded": price_predictor.model is not None,
@@ -18,6 +18,15 @@ from loguru import logger
 from api.auth_manager import AuthManager
 from config.settings import Settings
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 ResponseData = Union[Dict[str, Any], List[Any]]
 
 
@@ -155,7 +164,8 @@ class TopstepXClient:
                             return {"success": False, "error": error_text, "status": response.status}
 
                     response.raise_for_status()
-                    result = await response.json()
+                    # aiohttp's checks (empty body -> None, content type) with the faster decoder
+                    result = await response.json(loads=_json_loads)
                     logger.debug(f"API Response data: {str(result)[:200]}...")
                     return result
 
@@ -8,9 +8,9 @@ import os
 import random
 import re
 from datetime import datetime, timedelta
-import pytz
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect, Query
 from fastapi.responses import JSONResponse
@@ -525,7 +525,7 @@ def _is_trading_hours() -> bool:
     This covers the overnight session and regular trading hours.
     """
     try:
-        ct = pytz.timezone("America/Chicago")
+        ct = ZoneInfo("America/Chicago")
         now = datetime.now(ct)
         hour = now.hour
         minute = now.minute
@@ -911,6 +911,23 @@ async def get_bot_activity(account_id: str, limit: int = 50):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/accounts/{account_id}/bot-positions")
+async def get_bot_positions(account_id: str):
+    """Get the positions tracked by an account's running bot."""
+    if not account_manager:
+        raise HTTPException(status_code=503, detail="Account manager not initialized")
+
+    bot = account_manager.bots.get(account_id)
+    if not bot or not bot.position_tracker:
+        raise HTTPException(status_code=404, detail=f"No running bot for account {account_id}")
+
+    # Served pre-serialized; the tracker re-encodes only when positions change
+    return Response(
+        content=bot.position_tracker.get_open_positions_json(),
+        media_type="application/json",
+    )
+
+
 @app.post("/api/accounts/add")
 async def add_account(account_data: dict):
     """Add an account to the bot manager configuration."""
@@ -1551,7 +1568,7 @@ async def place_order(order: ManualOrderRequest):
     is_market_open = _is_trading_hours()
     market_warning = None
     if not is_market_open:
-        ct = pytz.timezone("America/Chicago")
+        ct = ZoneInfo("America/Chicago")
         now = datetime.now(ct)
         market_warning = (
             f"Warning: Markets are currently closed. "
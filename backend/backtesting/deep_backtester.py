@@ -1,10 +1,10 @@
 """Deep backtesting engine with ProjectX API integration."""
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
 import polars as pl
-import pytz
 from loguru import logger
 
 from backtesting.historical_data_service import HistoricalDataService
@@ -34,6 +34,8 @@ class DeepBacktester:
         self.backtest_engine = BacktestEngine(settings)
         self.simulator = TopstepSimulator(settings)
         self.reporter = BacktestReporter()
+        # Bounds how many account backtests fetch from the API at once
+        self._api_sem = asyncio.Semaphore(max(1, settings.projectx_concurrency))
         
         # Initialize ML components
         self.signal_validator = SignalValidator()
@@ -106,9 +108,9 @@ class DeepBacktester:
             initial_balance=account_config.profile.account_size,
         )
 
-        # Simulate Topstep rules with account profile
+        # Simulate Topstep rules with account profile, over every replayed day at once
         simulator = TopstepSimulator(self.settings, account_config.profile)
-        rule_simulation = simulator.simulate_trading_day(
+        rule_simulation = simulator.simulate_replay(
             trades=result.trades,
             initial_balance=account_config.profile.account_size,
         )
@@ -122,6 +124,9 @@ class DeepBacktester:
             "daily_loss_violation_msg": rule_simulation["daily_violation_msg"],
             "drawdown_violation": rule_simulation["drawdown_violation"],
             "drawdown_violation_msg": rule_simulation["drawdown_violation_msg"],
+            "consistency_violation": rule_simulation["consistency_violation"],
+            "consistency_violation_msg": rule_simulation["consistency_violation_msg"],
+            "trading_days": rule_simulation["trading_days"],
         }
 
         # Add account-specific metrics
@@ -206,7 +211,7 @@ class DeepBacktester:
                         signal = await strategy.analyze(symbol, slice_bars)
 
                         if signal:
-                            signal_dict = signal.to_dict()
+                            signal_dict = signal.as_dict()
                             signal_dict["timestamp"] = slice_bars["timestamp"][-1]
                             signal_dict["quantity"] = 1
                             signals.append(signal_dict)
@@ -260,11 +265,35 @@ class DeepBacktester:
         start_date: datetime,
         end_date: datetime,
     ) -> Dict[str, Dict]:
-        """Run backtests for multiple accounts."""
-        results = {}
-        for account_config in account_configs:
+        """
+        Run backtests for multiple accounts concurrently.
+
+        At most ``settings.projectx_concurrency`` run at a time. A failed
+        account maps to ``{"error": ...}`` without affecting the others.
+        """
+        results = await asyncio.gather(
+            *(
+                self._run_one(account_config, symbols, timeframe, start_date, end_date)
+                for account_config in account_configs
+            )
+        )
+        return {
+            account_config.account_id: result
+            for account_config, result in zip(account_configs, results)
+        }
+
+    async def _run_one(
+        self,
+        account_config: AccountConfig,
+        symbols: List[str],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict:
+        """Backtest one account under the API semaphore."""
+        async with self._api_sem:
             try:
-                result = await self.run_backtest(
+                return await self.run_backtest(
                     account_config=account_config,
                     symbols=symbols,
                     timeframe=timeframe,
@@ -272,8 +301,6 @@ class DeepBacktester:
                     end_date=end_date,
                     strategies=account_config.enabled_strategies,
                 )
-                results[account_config.account_id] = result
             except Exception as e:
                 logger.error(f"Error backtesting {account_config.account_id}: {e}")
-                results[account_config.account_id] = {"error": str(e)}
-        return results
+                return {"error": str(e)}
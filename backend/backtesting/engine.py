@@ -81,30 +81,35 @@ class BacktestEngine:
             # (Simplified - in reality, need to check each bar)
             exit_price = None
             exit_reason = None
+            exit_time = None
 
             # Find exit bar (simplified logic)
             signal_time = signal.get("timestamp")
             if signal_time:
                 future_bars = bars.filter(pl.col("timestamp") > signal_time)
 
-                for _, bar in future_bars.iter_rows(named=True):
+                for bar in future_bars.iter_rows(named=True):
                     if side == "BUY":
                         if bar["low"] <= stop_loss:
                             exit_price = stop_loss
                             exit_reason = "STOP_LOSS"
+                            exit_time = bar["timestamp"]
                             break
                         elif bar["high"] >= take_profit:
                             exit_price = take_profit
                             exit_reason = "TAKE_PROFIT"
+                            exit_time = bar["timestamp"]
                             break
                     else:  # SELL
                         if bar["high"] >= stop_loss:
                             exit_price = stop_loss
                             exit_reason = "STOP_LOSS"
+                            exit_time = bar["timestamp"]
                             break
                         elif bar["low"] <= take_profit:
                             exit_price = take_profit
                             exit_reason = "TAKE_PROFIT"
+                            exit_time = bar["timestamp"]
                             break
 
             if exit_price:
@@ -128,6 +133,7 @@ class BacktestEngine:
                     "quantity": quantity,
                     "pnl": pnl,
                     "exit_reason": exit_reason,
+                    "exit_time": exit_time,
                 }
 
                 result.trades.append(trade)
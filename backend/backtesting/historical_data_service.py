@@ -4,9 +4,9 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import polars as pl
-import pytz
 from loguru import logger
 
 from api.topstepx_client import TopstepXClient
@@ -161,7 +161,7 @@ class HistoricalDataService:
         # Try to fetch a small sample to determine range
         try:
             # Try recent data first
-            end_date = datetime.now(pytz.timezone(self.settings.timezone))
+            end_date = datetime.now(ZoneInfo(self.settings.timezone))
             start_date = end_date - timedelta(days=7)
 
             sample = await self.fetch_bars(symbol, timeframe, start_date, end_date, use_cache=False)
@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Optional
 
+import numpy as np
 from loguru import logger
 
 from config.settings import Settings
@@ -22,6 +23,9 @@ class TopstepSimulator:
             self.max_drawdown_limit = settings.max_drawdown_limit
             self.consistency_threshold = settings.consistency_threshold
 
+        # Daily loss checks trip at 95% of the limit
+        self._daily_loss_threshold = 0.95 * self.daily_loss_limit
+
     def check_daily_loss_limit(
         self, daily_pnl: float, trades_today: List[Dict]
     ) -> tuple[bool, str]:
@@ -31,7 +35,7 @@ class TopstepSimulator:
         Returns:
             (would_violate, message)
         """
-        if abs(daily_pnl) >= self.daily_loss_limit * 0.95:
+        if abs(daily_pnl) >= self._daily_loss_threshold:
             return True, f"Daily loss limit would be violated: ${abs(daily_pnl):.2f}"
 
         return False, ""
@@ -75,6 +79,117 @@ class TopstepSimulator:
 
         return False, ""
 
+    def vectorized_checks(
+        self,
+        daily_pnls: np.ndarray,
+        balances: np.ndarray,
+        high_water_marks: np.ndarray,
+        best_day_profits: np.ndarray,
+        total_profits: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluate the daily loss, trailing drawdown and consistency rules for a
+        whole replay at once (one element per day).
+
+        Returns:
+            Dictionary of boolean violation arrays keyed by rule
+        """
+        daily_pnls = np.asarray(daily_pnls, dtype=np.float64)
+        balances = np.asarray(balances, dtype=np.float64)
+        high_water_marks = np.asarray(high_water_marks, dtype=np.float64)
+        best_day_profits = np.asarray(best_day_profits, dtype=np.float64)
+        total_profits = np.asarray(total_profits, dtype=np.float64)
+
+        daily_violation = np.abs(daily_pnls) >= self._daily_loss_threshold
+        drawdown_violation = balances - (high_water_marks - self.max_drawdown_limit) <= 0
+        consistency_violation = np.where(
+            total_profits > 0,
+            best_day_profits / np.maximum(total_profits, 1e-12) > self.consistency_threshold,
+            False,
+        )
+
+        return {
+            "daily_violation": daily_violation,
+            "drawdown_violation": drawdown_violation,
+            "consistency_violation": consistency_violation,
+        }
+
+    def run_equity_curve(
+        self, daily_pnls: np.ndarray, initial_balance: float
+    ) -> tuple[np.ndarray, np.ndarray, int]:
+        """
+        Build the balance and high-water-mark series for a sequence of daily P&Ls.
+
+        Returns:
+            (balances, high_water_marks, index of first drawdown violation or -1)
+        """
+        daily_pnls = np.asarray(daily_pnls, dtype=np.float64)
+        balances = initial_balance + np.cumsum(daily_pnls)
+        high_water = np.maximum.accumulate(np.concatenate(([initial_balance], balances)))[1:]
+        violated = balances <= high_water - self.max_drawdown_limit
+        first_violation = int(np.argmax(violated)) if violated.any() else -1
+        return balances, high_water, first_violation
+
+    def simulate_replay(self, trades: List[Dict], initial_balance: float) -> Dict:
+        """
+        Apply the Topstep rules to a whole replay in one pass.
+
+        Trades are bucketed into days by ``exit_time`` (trades without one
+        share a single bucket), then ``run_equity_curve`` and
+        ``vectorized_checks`` evaluate every day at once.
+
+        Returns:
+            Dictionary with replay-wide violations, the first offending day's
+            message per rule, and the per-day series and checks
+        """
+        days: Dict = {}
+        for trade in trades:
+            exit_time = trade.get("exit_time")
+            day = exit_time.date() if exit_time is not None else None
+            days[day] = days.get(day, 0.0) + trade.get("pnl", 0.0)
+        order = sorted(days, key=lambda d: (d is not None, d))
+        daily_pnls = np.fromiter((days[d] for d in order), dtype=np.float64, count=len(order))
+
+        balances, high_water, first_drawdown = self.run_equity_curve(daily_pnls, initial_balance)
+        total_profits = np.cumsum(daily_pnls)
+        best_day_profits = np.maximum.accumulate(np.maximum(daily_pnls, 0.0))
+        checks = self.vectorized_checks(
+            daily_pnls, balances, high_water, best_day_profits, total_profits
+        )
+
+        # Messages come from the scalar checks on the first offending day
+        daily_hits = np.flatnonzero(checks["daily_violation"])
+        daily_msg = (
+            self.check_daily_loss_limit(daily_pnls[daily_hits[0]], [])[1] if daily_hits.size else ""
+        )
+        drawdown_msg = (
+            self.check_trailing_drawdown(balances[first_drawdown], high_water[first_drawdown])[1]
+            if first_drawdown >= 0
+            else ""
+        )
+        # Consistency is judged on the final totals
+        consistency_violation, consistency_msg = (
+            self.check_consistency_rule(best_day_profits[-1], total_profits[-1])
+            if daily_pnls.size
+            else (False, "")
+        )
+
+        return {
+            "total_pnl": float(daily_pnls.sum()),
+            "final_balance": float(balances[-1]) if balances.size else initial_balance,
+            "trading_days": len(order),
+            "daily_violation": bool(daily_hits.size),
+            "daily_violation_msg": daily_msg,
+            "drawdown_violation": first_drawdown >= 0,
+            "drawdown_violation_msg": drawdown_msg,
+            "consistency_violation": consistency_violation,
+            "consistency_violation_msg": consistency_msg,
+            "daily_pnls": daily_pnls,
+            "balances": balances,
+            "high_water_marks": high_water,
+            "checks": checks,
+        }
+
     def simulate_trading_day(
         self, trades: List[Dict], initial_balance: float
     ) -> Dict:
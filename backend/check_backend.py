@@ -6,6 +6,22 @@ import asyncio
 import aiohttp
 from datetime import datetime
 
+async def probe(session, path, headers=None):
+    """GET an endpoint and capture status, CORS header and body (or the error)."""
+    result = {"status": None, "cors": None, "data": None, "text": None, "error": None}
+    try:
+        async with session.get(path, headers=headers) as resp:
+            result["status"] = resp.status
+            result["cors"] = resp.headers.get("Access-Control-Allow-Origin")
+            if resp.status == 200 or resp.content_type == "application/json":
+                result["data"] = await resp.json()
+            else:
+                result["text"] = await resp.text()
+    except Exception as e:
+        result["error"] = e
+    return result
+
+
 async def check_backend():
     """Check if backend is running and responding correctly."""
     base_url = "http://localhost:8000"
@@ -17,97 +33,94 @@ async def check_backend():
     print()
     
     timeout = aiohttp.ClientTimeout(total=10)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
-        all_checks_passed = True
-        # Test 1: Root endpoint
-        print("1. Testing root endpoint (/)...")
-        try:
-            async with session.get(f"{base_url}/") as resp:
-                print(f"   Status: {resp.status}")
-                data = await resp.json()
-                print(f"   Response: {data}")
-                cors_header = resp.headers.get("Access-Control-Allow-Origin")
-                print(f"   CORS Header: {cors_header or 'MISSING'}")
-        except aiohttp.ClientConnectorError as e:
-            print(f"   [X] ERROR: Backend is not running! ({e})")
-            print("   Start it with: cd backend && uvicorn app:app --reload")
-            return False
-        except aiohttp.ServerDisconnectedError as e:
-            print(f"   [X] ERROR: Server disconnected - backend may have crashed! ({e})")
-            print("   Check backend logs for errors")
-            return False
-        except Exception as e:
-            print(f"   [X] ERROR: {type(e).__name__}: {e}")
-            return False
-        
-        print()
-        
-        # Test 2: CORS test endpoint
-        print("2. Testing CORS endpoint (/api/test/cors)...")
-        try:
-            async with session.get(f"{base_url}/api/test/cors") as resp:
-                print(f"   Status: {resp.status}")
-                data = await resp.json()
-                print(f"   Response: {data}")
-                cors_header = resp.headers.get("Access-Control-Allow-Origin")
-                print(f"   CORS Header: {cors_header or 'MISSING'}")
-                if cors_header:
-                    print("   [OK] CORS is configured")
-                else:
-                    print("   [X] CORS header missing!")
-                    all_checks_passed = False
-        except Exception as e:
-            print(f"   [X] ERROR: {e}")
+    async with aiohttp.ClientSession(base_url=base_url, timeout=timeout) as session:
+        # Run all probes concurrently, then report them in order
+        root, cors, contracts, health = await asyncio.gather(
+            probe(session, "/"),
+            probe(session, "/api/test/cors"),
+            probe(session, "/api/market/contracts?live=true", {"Origin": "http://localhost:3000"}),
+            probe(session, "/health"),
+        )
+
+    all_checks_passed = True
+    # Test 1: Root endpoint
+    print("1. Testing root endpoint (/)...")
+    e = root["error"]
+    if isinstance(e, aiohttp.ClientConnectorError):
+        print(f"   [X] ERROR: Backend is not running! ({e})")
+        print("   Start it with: cd backend && uvicorn app:app --reload")
+        return False
+    if isinstance(e, aiohttp.ServerDisconnectedError):
+        print(f"   [X] ERROR: Server disconnected - backend may have crashed! ({e})")
+        print("   Check backend logs for errors")
+        return False
+    if e is not None:
+        print(f"   [X] ERROR: {type(e).__name__}: {e}")
+        return False
+    print(f"   Status: {root['status']}")
+    print(f"   Response: {root['data'] if root['data'] is not None else root['text']}")
+    print(f"   CORS Header: {root['cors'] or 'MISSING'}")
+    
+    print()
+    
+    # Test 2: CORS test endpoint
+    print("2. Testing CORS endpoint (/api/test/cors)...")
+    if cors["error"] is not None:
+        print(f"   [X] ERROR: {cors['error']}")
+        all_checks_passed = False
+    else:
+        print(f"   Status: {cors['status']}")
+        print(f"   Response: {cors['data'] if cors['data'] is not None else cors['text']}")
+        print(f"   CORS Header: {cors['cors'] or 'MISSING'}")
+        if cors["cors"]:
+            print("   [OK] CORS is configured")
+        else:
+            print("   [X] CORS header missing!")
+            all_checks_passed = False
+    
+    print()
+    
+    # Test 3: Contracts endpoint
+    print("3. Testing contracts endpoint (/api/market/contracts)...")
+    if contracts["error"] is not None:
+        print(f"   [X] ERROR: {contracts['error']}")
+        all_checks_passed = False
+    else:
+        status = contracts["status"]
+        print(f"   Status: {status}")
+        print(f"   CORS Header: {contracts['cors'] or 'MISSING'}")
+        if not contracts["cors"]:
+            print("   [X] Missing CORS header on contracts response!")
             all_checks_passed = False
-        
-        print()
-        
-        # Test 3: Contracts endpoint
-        print("3. Testing contracts endpoint (/api/market/contracts)...")
-        try:
-            async with session.get(
-                f"{base_url}/api/market/contracts?live=true",
-                headers={"Origin": "http://localhost:3000"}
-            ) as resp:
-                print(f"   Status: {resp.status}")
-                cors_header = resp.headers.get("Access-Control-Allow-Origin")
-                print(f"   CORS Header: {cors_header or 'MISSING'}")
-                if not cors_header:
-                    print("   [X] Missing CORS header on contracts response!")
-                    all_checks_passed = False
-                if resp.status == 200:
-                    data = await resp.json()
-                    contract_count = len(data.get("contracts", []))
-                    print(f"   [OK] Success! Found {contract_count} contracts")
-                elif resp.status >= 500:
-                    text = await resp.text()
-                    print(f"   [X] Backend error: {text[:200]}")
-                    all_checks_passed = False
-                else:
-                    text = await resp.text()
-                    print(f"   [WARN] Non-200 response (expected during startup): {text[:200]}")
-        except Exception as e:
-            print(f"   [X] ERROR: {e}")
+        if status == 200:
+            contract_count = len(contracts["data"].get("contracts", []))
+            print(f"   [OK] Success! Found {contract_count} contracts")
+        elif status >= 500:
+            print(f"   [X] Backend error: {str(contracts['text'] or contracts['data'])[:200]}")
             all_checks_passed = False
-        
-        print()
-        
-        # Test 4: Health endpoint
-        print("4. Testing health endpoint (/health)...")
-        try:
-            async with session.get(f"{base_url}/health") as resp:
-                print(f"   Status: {resp.status}")
-                data = await resp.json()
-                print(f"   Auth Status: {data.get('auth', {}).get('status', 'unknown')}")
-                if data.get('auth', {}).get('error'):
-                    print(f"   [WARN] Auth Error: {data['auth']['error']}")
-        except Exception as e:
-            print(f"   [X] ERROR: {e}")
-        
-        print()
-        print("=" * 60)
-        print("Diagnostic complete!")
-        print("=" * 60)
+        else:
+            print(
+                "   [WARN] Non-200 response (expected during startup): "
+                f"{str(contracts['text'] or contracts['data'])[:200]}"
+            )
+    
+    print()
+    
+    # Test 4: Health endpoint
+    print("4. Testing health endpoint (/health)...")
+    if health["error"] is not None:
+        print(f"   [X] ERROR: {health['error']}")
+    else:
+        print(f"   Status: {health['status']}")
+        data = health["data"] or {}
+        print(f"   Auth Status: {data.get('auth', {}).get('status', 'unknown')}")
+        if data.get('auth', {}).get('error'):
+            print(f"   [WARN] Auth Error: {data['auth']['error']}")
+    
+    print()
+    print("=" * 60)
+    print("Diagnostic complete!")
+    print("=" * 60)
     
     return all_checks_passed
 
@@ -50,6 +50,8 @@ class Settings(BaseSettings):
     topstepx_app_device_id: Optional[str] = "algox-client"
     
     topstepx_validate_tokens: bool = True
+    # Max concurrent per-account backtests hitting the ProjectX API
+    projectx_concurrency: int = 4
     
     def validate_credentials(self) -> None:
         """Validate that required credentials are present based on auth mode."""
@@ -135,6 +137,7 @@ class Settings(BaseSettings):
     # ML/AI
     ml_enabled: bool = False  # Start with rule-based, enable ML later
     ml_model_path: str = "models/"
+    ml_quantize_cpu_models: bool = True  # int8 dynamic quantization for CPU inference
 
     # Paper Trading
     paper_trading_mode: bool = True  # Start in paper trading mode
@@ -146,5 +149,6 @@ class Settings(BaseSettings):
     alert_email_username: str = ""
     alert_email_password: str = ""
     alert_email_to: str = ""
+    alert_history_size: int = 10_000  # Most recent alerts kept in memory
     alert_sms_enabled: bool = False  # SMS requires external service (Twilio, etc.)
 
@@ -3,25 +3,54 @@
 import asyncio
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 import polars as pl
-import pytz
 from loguru import logger
 
 from config.settings import Settings
 
+# Bar widths in microseconds (the resolution of pl.Datetime("us"))
+TIMEFRAME_US: Dict[str, int] = {
+    "1m": 60_000_000,
+    "5m": 5 * 60_000_000,
+    "15m": 15 * 60_000_000,
+    "1h": 60 * 60_000_000,
+}
+
+# Expressions used on every tick batch, built once. Polars expressions are
+# immutable, so one instance can be reused across queries.
+_TS_EXPRS = (
+    pl.col("timestamp").cast(pl.Datetime("us")),
+    pl.col("timestamp").cast(pl.Datetime("us")).to_physical().alias("ts_us"),
+)
+# Start of the bar each tick falls in, per timeframe, by integer arithmetic
+_BAR_TIME_EXPRS: Dict[str, pl.Expr] = {
+    timeframe: (pl.col("ts_us") - pl.col("ts_us") % width).cast(pl.Datetime("us")).alias("bar_time")
+    for timeframe, width in TIMEFRAME_US.items()
+}
+_OHLCV_AGGS = (
+    pl.first("price").alias("open"),
+    pl.max("price").alias("high"),
+    pl.min("price").alias("low"),
+    pl.last("price").alias("close"),
+    pl.len().alias("volume"),
+)
+
 
 class DataManager:
     """Manages market data ingestion and bar generation."""
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.ct_tz = pytz.timezone(settings.timezone)
+        self.ct_tz = ZoneInfo(settings.timezone)
         self.tick_buffers: Dict[str, List[Dict]] = defaultdict(list)
         self.bars: Dict[str, Dict[str, pl.DataFrame]] = defaultdict(
             lambda: defaultdict(lambda: pl.DataFrame())
         )
+        # (symbol, timeframe, limit) -> tail of bars; dropped when new bars are written
+        self._tail_cache: Dict[Tuple[str, str, int], pl.DataFrame] = {}
         self.running = False
         self._lock = asyncio.Lock()
 
@@ -45,7 +74,14 @@ class DataManager:
         async with self._lock:
             df = self.bars[symbol][timeframe]
             if limit:
-                return df.tail(limit)
+                key = (symbol, timeframe, limit)
+                tail = self._tail_cache.get(key)
+                if tail is None:
+                    # One contiguous chunk, so every strategy's column to_numpy()
+                    # this bar is a zero-copy view rather than a fresh gather
+                    tail = df.tail(limit).rechunk()
+                    self._tail_cache[key] = tail
+                return tail
             return df
 
     async def _bar_generation_loop(self) -> None:
@@ -78,8 +114,11 @@ class DataManager:
                 pl.lit(datetime.now(self.ct_tz)).alias("timestamp")
             )
 
+        # Parse timestamps once and keep their integer microsecond value for bucketing
+        df = df.with_columns(*_TS_EXPRS)
+
         # Generate bars for different timeframes
-        for timeframe in ["1m", "5m", "15m", "1h"]:
+        for timeframe in TIMEFRAME_US:
             await self._resample_to_bars(symbol, df, timeframe)
 
         # Clear processed ticks
@@ -92,40 +131,11 @@ class DataManager:
         if tick_df.is_empty():
             return
 
-        # Parse timeframe
-        timeframe_minutes = {
-            "1m": 1,
-            "5m": 5,
-            "15m": 15,
-            "1h": 60,
-        }.get(timeframe, 1)
-
-        # Ensure timestamp is datetime
-        tick_df = tick_df.with_columns(
-            pl.col("timestamp").cast(pl.Datetime)
-        )
-
-        # Round timestamps to timeframe boundaries
-        tick_df = tick_df.with_columns(
-            pl.col("timestamp")
-            .dt.truncate(f"{timeframe_minutes}m")
-            .alias("bar_time")
-        )
+        # Round timestamps down to timeframe boundaries with integer arithmetic
+        tick_df = tick_df.with_columns(_BAR_TIME_EXPRS.get(timeframe, _BAR_TIME_EXPRS["1m"]))
 
         # Group by bar_time and aggregate
-        bars = (
-            tick_df.group_by("bar_time")
-            .agg(
-                [
-                    pl.first("price").alias("open"),
-                    pl.max("price").alias("high"),
-                    pl.min("price").alias("low"),
-                    pl.last("price").alias("close"),
-                    pl.count().alias("volume"),
-                ]
-            )
-            .sort("bar_time")
-        )
+        bars = tick_df.group_by("bar_time").agg(*_OHLCV_AGGS).sort("bar_time")
 
         # Merge with existing bars
         existing_bars = self.bars[symbol][timeframe]
@@ -137,6 +147,11 @@ class DataManager:
         else:
             self.bars[symbol][timeframe] = bars
 
+        # Invalidate cached tails for this series
+        stale = [k for k in self._tail_cache if k[0] == symbol and k[1] == timeframe]
+        for key in stale:
+            del self._tail_cache[key]
+
         logger.debug(
             f"Generated {len(bars)} {timeframe} bars for {symbol}"
         )
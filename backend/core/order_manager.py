@@ -1,9 +1,11 @@
 """Order management and execution."""
 
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
+import numpy as np
 from loguru import logger
 
 from api.topstepx_client import TopstepXClient
@@ -13,10 +15,111 @@ from risk.risk_manager import RiskManager
 from ml.rl_agent import RLAgent
 
 
-class Order:
-    """Represents a trading order."""
+@dataclass(slots=True, frozen=True)
+class OrderSignal:
+    """The fields of a trading signal that order placement needs."""
 
-    def __init__(
+    symbol: str
+    side: str
+    order_type: str = "MARKET"
+    entry_price: Optional[float] = None
+    stop_loss: Optional[float] = None
+    current_price: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, signal: Dict) -> "OrderSignal":
+        """Build from a signal payload dict (e.g. ``dataclasses.asdict`` of a TradingSignal)."""
+        return cls(
+            symbol=signal["symbol"],
+            side=signal["side"],
+            order_type=signal.get("order_type", "MARKET"),
+            entry_price=signal.get("entry_price"),
+            stop_loss=signal.get("stop_loss"),
+            current_price=signal.get("current_price"),
+        )
+
+    @classmethod
+    def from_signal(cls, signal) -> "OrderSignal":
+        """Build from a strategy ``TradingSignal`` (or any object with its fields)."""
+        return cls(
+            symbol=signal.symbol,
+            side=signal.side,
+            order_type=signal.order_type,
+            entry_price=signal.entry_price,
+            stop_loss=signal.stop_loss,
+            current_price=getattr(signal, "current_price", None),
+        )
+
+
+# Small integer codes for the categorical order columns
+SIDE_CODES: Dict[str, int] = {"BUY": 0, "SELL": 1}
+ORDER_TYPE_CODES: Dict[str, int] = {"MARKET": 0, "LIMIT": 1, "STOP_MARKET": 2}
+STATUS_CODES: Dict[str, int] = {"PENDING": 0, "FILLED": 1, "CANCELLED": 2, "REJECTED": 3}
+
+
+class OrderTable:
+    """Column store for orders (one NumPy array per field, one row per order)."""
+
+    def __init__(self, capacity: int = 256):
+        self._capacity = capacity
+        self._size = 0
+        self.order_ids: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self._symbol_codes: Dict[str, int] = {}
+        self._sides: List[str] = list(SIDE_CODES)
+        self._side_codes: Dict[str, int] = dict(SIDE_CODES)
+        self._order_types: List[str] = list(ORDER_TYPE_CODES)
+        self._order_type_codes: Dict[str, int] = dict(ORDER_TYPE_CODES)
+        self._statuses: List[str] = list(STATUS_CODES)
+        self._status_codes: Dict[str, int] = dict(STATUS_CODES)
+
+        self.symbol_idx = np.zeros(capacity, dtype=np.int16)
+        self.side = np.zeros(capacity, dtype=np.int8)
+        self.order_type = np.zeros(capacity, dtype=np.int8)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.quantity = np.zeros(capacity, dtype=np.int32)
+        self.filled_quantity = np.zeros(capacity, dtype=np.int32)
+        self.price = np.full(capacity, np.nan, dtype=np.float64)
+        self.stop_price = np.full(capacity, np.nan, dtype=np.float64)
+        self.fill_price = np.full(capacity, np.nan, dtype=np.float64)
+        self.created_at: List[datetime] = []
+        self.updated_at: List[datetime] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self.row_of
+
+    @staticmethod
+    def _code(value: str, codes: Dict[str, int], names: List[str]) -> int:
+        """Return the int code for a categorical value, registering new values."""
+        code = codes.get(value)
+        if code is None:
+            code = len(names)
+            codes[value] = code
+            names.append(value)
+        return code
+
+    def _grow(self) -> None:
+        """Double the capacity of every numeric column."""
+        new_capacity = self._capacity * 2
+        for name in (
+            "symbol_idx", "side", "order_type", "status", "quantity", "filled_quantity",
+        ):
+            column = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[: self._capacity] = column
+            setattr(self, name, grown)
+        for name in ("price", "stop_price", "fill_price"):
+            column = getattr(self, name)
+            grown = np.full(new_capacity, np.nan, dtype=column.dtype)
+            grown[: self._capacity] = column
+            setattr(self, name, grown)
+        self._capacity = new_capacity
+
+    def add(
         self,
         order_id: str,
         symbol: str,
@@ -25,19 +128,163 @@ class Order:
         quantity: int,
         price: Optional[float] = None,
         stop_price: Optional[float] = None,
-    ):
-        self.order_id = order_id
-        self.symbol = symbol
-        self.side = side  # "BUY" or "SELL"
-        self.order_type = order_type  # "MARKET", "LIMIT", "STOP_MARKET"
-        self.quantity = quantity
-        self.price = price
-        self.stop_price = stop_price
-        self.status = "PENDING"
-        self.fill_price: Optional[float] = None
-        self.filled_quantity = 0
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        status: str = "PENDING",
+        now: Optional[datetime] = None,
+    ) -> int:
+        """Append an order and return its row index."""
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        self.order_ids.append(order_id)
+        self.row_of[order_id] = row
+        self.symbol_idx[row] = self._code(symbol, self._symbol_codes, self.symbols)
+        self.side[row] = self._code(side, self._side_codes, self._sides)
+        self.order_type[row] = self._code(order_type, self._order_type_codes, self._order_types)
+        self.status[row] = self._code(status, self._status_codes, self._statuses)
+        self.quantity[row] = quantity
+        self.price[row] = np.nan if price is None else price
+        self.stop_price[row] = np.nan if stop_price is None else stop_price
+        if now is None:
+            now = datetime.now()
+        self.created_at.append(now)
+        self.updated_at.append(now)
+        self._size = row + 1
+        return row
+
+    def get_row(self, order_id: str) -> Optional["Order"]:
+        """Return a view over the row for order_id."""
+        row = self.row_of.get(order_id)
+        if row is None:
+            return None
+        return Order(self, row)
+
+    def set_status(self, row: int, status: str) -> None:
+        """Store a new status code for a row."""
+        self.status[row] = self._code(status, self._status_codes, self._statuses)
+
+    def status_name(self, row: int) -> str:
+        return self._statuses[self.status[row]]
+
+    def side_name(self, row: int) -> str:
+        return self._sides[self.side[row]]
+
+    def order_type_name(self, row: int) -> str:
+        return self._order_types[self.order_type[row]]
+
+    def cancel(self, order_id: str, now: Optional[datetime] = None) -> bool:
+        """Mark an order as cancelled."""
+        row = self.row_of.get(order_id)
+        if row is None:
+            return False
+        self.status[row] = STATUS_CODES["CANCELLED"]
+        self.updated_at[row] = now if now is not None else datetime.now()
+        return True
+
+    def filter_status(self, status: str) -> np.ndarray:
+        """Boolean mask of rows having the given status."""
+        code = self._status_codes.get(status)
+        if code is None:
+            return np.zeros(self._size, dtype=bool)
+        return self.status[: self._size] == code
+
+    def filter_symbol(self, symbol: str) -> np.ndarray:
+        """Boolean mask of rows for the given symbol."""
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            return np.zeros(self._size, dtype=bool)
+        return self.symbol_idx[: self._size] == code
+
+    def rows(self, mask: Optional[np.ndarray] = None) -> List["Order"]:
+        """Return views for all rows, or for the rows selected by mask."""
+        if mask is None:
+            return [Order(self, row) for row in range(self._size)]
+        return [Order(self, int(row)) for row in np.flatnonzero(mask)]
+
+
+def _optional_float(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+class Order:
+    """Represents a trading order (a view over one row of an OrderTable)."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: OrderTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def order_id(self) -> str:
+        return self._table.order_ids[self._row]
+
+    @property
+    def symbol(self) -> str:
+        return self._table.symbols[self._table.symbol_idx[self._row]]
+
+    @property
+    def side(self) -> str:
+        return self._table.side_name(self._row)  # "BUY" or "SELL"
+
+    @property
+    def order_type(self) -> str:
+        return self._table.order_type_name(self._row)  # "MARKET", "LIMIT", "STOP_MARKET"
+
+    @property
+    def quantity(self) -> int:
+        return int(self._table.quantity[self._row])
+
+    @quantity.setter
+    def quantity(self, value: int) -> None:
+        self._table.quantity[self._row] = value
+
+    @property
+    def price(self) -> Optional[float]:
+        return _optional_float(self._table.price[self._row])
+
+    @price.setter
+    def price(self, value: Optional[float]) -> None:
+        self._table.price[self._row] = np.nan if value is None else value
+
+    @property
+    def stop_price(self) -> Optional[float]:
+        return _optional_float(self._table.stop_price[self._row])
+
+    @property
+    def status(self) -> str:
+        return self._table.status_name(self._row)
+
+    @status.setter
+    def status(self, value: str) -> None:
+        self._table.set_status(self._row, value)
+
+    @property
+    def fill_price(self) -> Optional[float]:
+        return _optional_float(self._table.fill_price[self._row])
+
+    @fill_price.setter
+    def fill_price(self, value: Optional[float]) -> None:
+        self._table.fill_price[self._row] = np.nan if value is None else value
+
+    @property
+    def filled_quantity(self) -> int:
+        return int(self._table.filled_quantity[self._row])
+
+    @filled_quantity.setter
+    def filled_quantity(self, value: int) -> None:
+        self._table.filled_quantity[self._row] = value
+
+    @property
+    def created_at(self) -> datetime:
+        return self._table.created_at[self._row]
+
+    @property
+    def updated_at(self) -> datetime:
+        return self._table.updated_at[self._row]
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._table.updated_at[self._row] = value
 
 
 class OrderManager:
@@ -50,18 +297,39 @@ class OrderManager:
         risk_manager: RiskManager,
         position_tracker: PositionTracker,
         rl_agent: Optional[RLAgent] = None,
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         self.settings = settings
         self.api_client = api_client
         self.risk_manager = risk_manager
         self.position_tracker = position_tracker
         self.rl_agent = rl_agent
-        self.orders: Dict[str, Order] = {}
+        self.orders = OrderTable()
+        # Injectable clock so replays can supply simulated time instead of the wall clock
+        self._now = clock or datetime.now
         self._lock = asyncio.Lock()
 
-    async def execute_signal(self, signal: Dict, skip_risk_check: bool = False) -> Optional[str]:
+        # Resolve paper vs. live execution once instead of on every call
+        if settings.paper_trading_mode:
+            self._place_order = self._place_paper_order
+            self._cancel_order = self._cancel_paper_order
+            self._modify_order = self._modify_paper_order
+            self._close_position = self._close_paper_position
+        else:
+            self._place_order = self._place_live_order
+            self._cancel_order = self._cancel_live_order
+            self._modify_order = self._modify_live_order
+            self._close_position = self._close_live_position
+
+    async def execute_signal(
+        self, signal: Union[OrderSignal, Dict], skip_risk_check: bool = False
+    ) -> Optional[str]:
         """Execute a trading signal."""
         try:
+            # The risk manager reads OrderSignal fields directly, so no dict is built
+            if not isinstance(signal, OrderSignal):
+                signal = OrderSignal.from_dict(signal)
+
             # Check risk before executing
             if not skip_risk_check and not await self.risk_manager.check_trade_risk(signal):
                 logger.warning(f"Signal rejected by risk manager: {signal}")
@@ -83,70 +351,67 @@ class OrderManager:
                 logger.warning(f"Invalid position size: {quantity}")
                 return None
 
-            # Determine order type
-            order_type = signal.get("order_type", "MARKET")
-            price = signal.get("entry_price")
-            stop_price = signal.get("stop_loss")
-
-            # Place order
-            if self.settings.paper_trading_mode:
-                logger.info(
-                    f"[PAPER] Would place {order_type} {signal['side']} "
-                    f"{quantity} {signal['symbol']} @ {price}"
-                )
-                # In paper trading, simulate order
-                order_id = f"PAPER-{datetime.now().timestamp()}"
-                order = Order(
-                    order_id=order_id,
-                    symbol=signal["symbol"],
-                    side=signal["side"],
-                    order_type=order_type,
-                    quantity=quantity,
-                    price=price,
-                    stop_price=stop_price,
-                )
-                order.status = "FILLED"
-                order.fill_price = price or signal.get("current_price", 0)
-                self.orders[order_id] = order
-                return order_id
-            else:
-                # Live trading
-                response = await self.api_client.place_order(
-                    symbol=signal["symbol"],
-                    side=signal["side"],
-                    order_type=order_type,
-                    quantity=quantity,
-                    price=price,
-                    stop_price=stop_price,
-                )
-
-                order_id = response.get("order_id")
-                if order_id:
-                    order = Order(
-                        order_id=order_id,
-                        symbol=signal["symbol"],
-                        side=signal["side"],
-                        order_type=order_type,
-                        quantity=quantity,
-                        price=price,
-                        stop_price=stop_price,
-                    )
-                    self.orders[order_id] = order
-                    logger.info(f"Order placed: {order_id}")
-                    return order_id
+            return await self._place_order(signal, quantity)
 
         except Exception as e:
             logger.error(f"Error executing signal: {e}", exc_info=True)
             return None
 
+    async def _place_paper_order(self, signal: OrderSignal, quantity: int) -> Optional[str]:
+        """Simulate an order fill in paper trading mode."""
+        logger.info(
+            f"[PAPER] Would place {signal.order_type} {signal.side} "
+            f"{quantity} {signal.symbol} @ {signal.entry_price}"
+        )
+        now = self._now()
+        order_id = f"PAPER-{now.timestamp()}"
+        row = self.orders.add(
+            order_id=order_id,
+            symbol=signal.symbol,
+            side=signal.side,
+            order_type=signal.order_type,
+            quantity=quantity,
+            price=signal.entry_price,
+            stop_price=signal.stop_loss,
+            status="FILLED",
+            now=now,
+        )
+        self.orders.fill_price[row] = signal.entry_price or signal.current_price or 0
+        return order_id
+
+    async def _place_live_order(self, signal: OrderSignal, quantity: int) -> Optional[str]:
+        """Send an order to the broker API."""
+        response = await self.api_client.place_order(
+            symbol=signal.symbol,
+            side=signal.side,
+            order_type=signal.order_type,
+            quantity=quantity,
+            price=signal.entry_price,
+            stop_price=signal.stop_loss,
+        )
+
+        order_id = response.get("order_id")
+        if order_id:
+            self.orders.add(
+                order_id=order_id,
+                symbol=signal.symbol,
+                side=signal.side,
+                order_type=signal.order_type,
+                quantity=quantity,
+                price=signal.entry_price,
+                stop_price=signal.stop_loss,
+                now=self._now(),
+            )
+            logger.info(f"Order placed: {order_id}")
+            return order_id
+        return None
+
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an order."""
         try:
             if order_id in self.orders:
-                if not self.settings.paper_trading_mode:
-                    await self.api_client.cancel_order(order_id)
-                self.orders[order_id].status = "CANCELLED"
-                self.orders[order_id].updated_at = datetime.now()
+                await self._cancel_order(order_id)
+                self.orders.cancel(order_id, self._now())
                 logger.info(f"Order cancelled: {order_id}")
                 return True
             return False
@@ -154,6 +419,12 @@ class OrderManager:
             logger.error(f"Error cancelling order: {e}", exc_info=True)
             return False
 
+    async def _cancel_paper_order(self, order_id: str) -> None:
+        """Paper orders have nothing to cancel upstream."""
+
+    async def _cancel_live_order(self, order_id: str) -> None:
+        await self.api_client.cancel_order(order_id)
+
     async def modify_order(
         self, order_id: str, quantity: Optional[int] = None, price: Optional[float] = None
     ) -> bool:
@@ -162,15 +433,14 @@ class OrderManager:
             if order_id not in self.orders:
                 return False
 
-            if not self.settings.paper_trading_mode:
-                await self.api_client.modify_order(order_id, quantity, price)
+            await self._modify_order(order_id, quantity, price)
 
-            order = self.orders[order_id]
+            row = self.orders.row_of[order_id]
             if quantity:
-                order.quantity = quantity
+                self.orders.quantity[row] = quantity
             if price:
-                order.price = price
-            order.updated_at = datetime.now()
+                self.orders.price[row] = price
+            self.orders.updated_at[row] = self._now()
 
             logger.info(f"Order modified: {order_id}")
             return True
@@ -178,25 +448,47 @@ class OrderManager:
             logger.error(f"Error modifying order: {e}", exc_info=True)
             return False
 
+    async def _modify_paper_order(
+        self, order_id: str, quantity: Optional[int], price: Optional[float]
+    ) -> None:
+        """Paper orders are only modified locally."""
+
+    async def _modify_live_order(
+        self, order_id: str, quantity: Optional[int], price: Optional[float]
+    ) -> None:
+        await self.api_client.modify_order(order_id, quantity, price)
+
     async def close_all_positions(self) -> None:
         """Close all open positions."""
         try:
             positions = await self.position_tracker.get_open_positions()
-            for position in positions:
-                position_id = position.get("position_id")
-                if position_id:
-                    if self.settings.paper_trading_mode:
-                        logger.info(f"[PAPER] Would close position: {position_id}")
-                    else:
-                        await self.api_client.close_position(position_id)
-                        logger.info(f"Position closed: {position_id}")
+            position_ids = [p["position_id"] for p in positions if p.get("position_id")]
+            # Fire the closes concurrently; the client's rate limiter bounds the request rate
+            results = await asyncio.gather(
+                *(self._close_position(position_id) for position_id in position_ids),
+                return_exceptions=True,
+            )
+            for position_id, result in zip(position_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error closing position {position_id}: {result}")
         except Exception as e:
             logger.error(f"Error closing positions: {e}", exc_info=True)
 
+    async def _close_paper_position(self, position_id: str) -> None:
+        logger.info(f"[PAPER] Would close position: {position_id}")
+
+    async def _close_live_position(self, position_id: str) -> None:
+        await self.api_client.close_position(position_id)
+        logger.info(f"Position closed: {position_id}")
+
     def get_order(self, order_id: str) -> Optional[Order]:
         """Get an order by ID."""
-        return self.orders.get(order_id)
+        return self.orders.get_row(order_id)
 
     def get_all_orders(self) -> List[Order]:
         """Get all orders."""
-        return list(self.orders.values())
+        return self.orders.rows()
+
+    def get_orders_by_status(self, status: str) -> List[Order]:
+        """Get all orders with the given status."""
+        return self.orders.rows(self.orders.filter_status(status))
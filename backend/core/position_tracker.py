@@ -1,47 +1,109 @@
 """Position tracking and P&L calculation."""
 
 import asyncio
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from loguru import logger
+import numpy as np
 
 from api.topstepx_client import TopstepXClient
 from config.settings import Settings
+from monitoring.error_throttle import ErrorThrottle
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# One packed record per open position; ``cur`` is NaN until a price is known
+_POS_DTYPE = np.dtype([
+    ("qty", "i4"),
+    ("entry", "f8"),
+    ("cur", "f8"),
+    ("unreal", "f8"),
+    ("realized", "f8"),
+    ("sign", "i1"),
+    ("sym_id", "u2"),
+])
 
 
 class Position:
-    """Represents an open trading position."""
-
-    def __init__(
-        self,
-        position_id: str,
-        symbol: str,
-        side: str,
-        quantity: int,
-        entry_price: float,
-    ):
-        self.position_id = position_id
-        self.symbol = symbol
-        self.side = side  # "LONG" or "SHORT"
-        self.quantity = quantity
-        self.entry_price = entry_price
-        self.current_price: Optional[float] = None
-        self.unrealized_pnl: float = 0.0
-        self.realized_pnl: float = 0.0
-        self.opened_at = datetime.now()
-        self.updated_at = datetime.now()
+    """View of one open position, backed by a record of the tracker's position array."""
+
+    __slots__ = ("_tracker", "_row")
+
+    def __init__(self, tracker: "PositionTracker", row: int):
+        self._tracker = tracker
+        self._row = row
+
+    @property
+    def position_id(self) -> str:
+        return self._tracker._pos_ids[self._row]
+
+    @property
+    def symbol(self) -> str:
+        tracker = self._tracker
+        return tracker._id_to_sym[tracker._arr["sym_id"][self._row]]
+
+    @property
+    def side(self) -> str:
+        return "LONG" if self._tracker._arr["sign"][self._row] > 0 else "SHORT"
+
+    @property
+    def sign(self) -> int:
+        return int(self._tracker._arr["sign"][self._row])
+
+    @property
+    def quantity(self) -> int:
+        return int(self._tracker._arr["qty"][self._row])
+
+    @property
+    def entry_price(self) -> float:
+        return float(self._tracker._arr["entry"][self._row])
+
+    @property
+    def current_price(self) -> Optional[float]:
+        price = self._tracker._arr["cur"][self._row]
+        return None if np.isnan(price) else float(price)
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return float(self._tracker._arr["unreal"][self._row])
+
+    @property
+    def realized_pnl(self) -> float:
+        return float(self._tracker._arr["realized"][self._row])
+
+    @property
+    def opened_at(self) -> datetime:
+        return self._tracker._opened_at[self._row]
+
+    @property
+    def updated_at(self) -> datetime:
+        return self._tracker._updated_at[self._row]
 
 
 class PositionTracker:
     """Tracks open positions and calculates P&L."""
 
+    # Seconds between API syncs after a cycle that did / didn't change positions
+    SYNC_INTERVAL_ACTIVE = 1.0
+    SYNC_INTERVAL_IDLE = 5.0
+
     def __init__(self, settings: Settings, api_client: TopstepXClient):
         self.settings = settings
         self.api_client = api_client
-        self.positions: Dict[str, Position] = {}
         self.running = False
-        self._lock = asyncio.Lock()
+        self._sync_task: Optional[asyncio.Task] = None
+        self._sync_errors = ErrorThrottle()
+        self._last_structure_hash: Optional[int] = None
+        self._last_full_hash: Optional[int] = None
 
         # Tick values per contract
         self.tick_values = {
@@ -50,110 +112,223 @@ class PositionTracker:
             "MGC": 1.0,  # $1 per tick
         }
 
+        # Positions live in one structured array (rebuilt on every sync);
+        # self.positions maps position_id to a Position view over one record
+        self.positions: Dict[str, Position] = {}
+        # Called with no arguments whenever positions or marks change
+        self._change_listeners: List[Callable[[], None]] = []
+        self._id_to_sym: List[str] = []
+        self._rebuild_arrays()
+
     async def start(self) -> None:
         """Start position tracking."""
+        if self._sync_task is not None:
+            return
         self.running = True
-        asyncio.create_task(self._sync_loop())
+        self._sync_task = asyncio.create_task(self._sync_loop())
 
     async def stop(self) -> None:
         """Stop position tracking."""
         self.running = False
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+            self._sync_task = None
 
     async def _sync_loop(self) -> None:
         """Periodically sync positions from API."""
         while self.running:
             try:
-                await self.sync_positions()
-                await asyncio.sleep(5)  # Sync every 5 seconds
+                changed = await self.sync_positions()
+                # Poll faster while positions are moving, back off when idle
+                await asyncio.sleep(
+                    self.SYNC_INTERVAL_ACTIVE if changed else self.SYNC_INTERVAL_IDLE
+                )
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error in position sync loop: {e}", exc_info=True)
+                self._sync_errors.error(f"Error in position sync loop: {e}", e)
                 await asyncio.sleep(10)
 
-    async def sync_positions(self) -> None:
-        """Sync positions from API."""
+    async def sync_positions(self) -> bool:
+        """
+        Sync positions from API.
+
+        Returns:
+            True if positions were opened, closed or resized since the last sync
+        """
         try:
             api_positions = await self.api_client.get_open_positions()
+            self._sync_errors.reset()
+
+            # No lock: everything below runs without awaiting, so readers on the
+            # event loop never observe a half-reconciled state
+            latest = {p["position_id"]: p for p in api_positions if p.get("position_id")}
+
+            # Order-independent fingerprints of the response: which positions
+            # exist at what size, and additionally their marks
+            structure_hash = 0
+            full_hash = 0
+            for pos_id, p in latest.items():
+                quantity = p.get("quantity")
+                structure_hash ^= hash((pos_id, quantity))
+                full_hash ^= hash((pos_id, quantity, p.get("current_price"), p.get("unrealized_pnl")))
+
+            if full_hash == self._last_full_hash:
+                return False
+            self._last_full_hash = full_hash
 
-            async with self._lock:
-                # Update existing positions
-                for api_pos in api_positions:
-                    pos_id = api_pos.get("position_id")
-                    if pos_id:
-                        if pos_id in self.positions:
-                            # Update existing
-                            pos = self.positions[pos_id]
-                            pos.current_price = api_pos.get("current_price")
-                            pos.quantity = api_pos.get("quantity", pos.quantity)
-                            pos.unrealized_pnl = api_pos.get("unrealized_pnl", 0.0)
-                            pos.updated_at = datetime.now()
-                        else:
-                            # New position
-                            pos = Position(
-                                position_id=pos_id,
-                                symbol=api_pos.get("symbol", ""),
-                                side=api_pos.get("side", "LONG"),
-                                quantity=api_pos.get("quantity", 0),
-                                entry_price=api_pos.get("entry_price", 0.0),
-                            )
-                            pos.current_price = api_pos.get("current_price")
-                            pos.unrealized_pnl = api_pos.get("unrealized_pnl", 0.0)
-                            self.positions[pos_id] = pos
-
-                # Remove closed positions
-                api_pos_ids = {p.get("position_id") for p in api_positions if p.get("position_id")}
-                closed_positions = [
-                    pos_id for pos_id in self.positions.keys() if pos_id not in api_pos_ids
-                ]
-                for pos_id in closed_positions:
-                    del self.positions[pos_id]
+            if structure_hash == self._last_structure_hash:
+                # Same positions, new marks: patch prices in place
+                self._apply_marks(latest)
+                return False
+            self._last_structure_hash = structure_hash
+
+            self._rebuild_arrays(latest)
+            return True
 
         except Exception as e:
-            logger.error(f"Error syncing positions: {e}", exc_info=True)
+            self._sync_errors.error(f"Error syncing positions: {e}", e)
+            return False
 
-    def update_price(self, symbol: str, price: float) -> None:
-        """Update current price for positions."""
-        for position in self.positions.values():
-            if position.symbol == symbol:
-                position.current_price = price
-                position.unrealized_pnl = self._calculate_unrealized_pnl(position)
-                position.updated_at = datetime.now()
+    def _rebuild_arrays(self, api_positions: Optional[Dict[str, Dict]] = None) -> None:
+        """
+        Rebuild the position records (one per open position) from API data.
 
-    def _calculate_unrealized_pnl(self, position: Position) -> float:
-        """Calculate unrealized P&L for a position."""
-        if not position.current_price:
-            return 0.0
+        Positions already being tracked keep their symbol, side, entry price,
+        realized P&L and open time; quantity, price and unrealized P&L come
+        from the API. Positions missing from ``api_positions`` are dropped.
+        Symbol IDs are reassigned over the open positions only, so symbols
+        seen before (e.g. rolled contracts) don't use up IDs.
+        """
+        api_positions = api_positions or {}
+        n = len(api_positions)
+        old_index = getattr(self, "_index", {})
+        old_arr = getattr(self, "_arr", None)
+        now = datetime.now()
 
-        tick_value = self.tick_values.get(position.symbol, 1.0)
-        price_diff = position.current_price - position.entry_price
+        pos_ids: List[str] = list(api_positions)
+        arr = np.zeros(n, dtype=_POS_DTYPE)
+        opened_at: List[datetime] = []
+        sym_to_id: Dict[str, int] = {}
+        id_to_sym: List[str] = []
 
-        if position.side == "LONG":
-            pnl = price_diff * tick_value * position.quantity
-        else:  # SHORT
-            pnl = -price_diff * tick_value * position.quantity
+        for i, pos_id in enumerate(pos_ids):
+            api_pos = api_positions[pos_id]
+            rec = arr[i]
+            old = old_index.get(pos_id)
+            if old is not None:
+                rec = old_arr[old].copy()
+                symbol = self._id_to_sym[rec["sym_id"]]
+                rec["qty"] = api_pos.get("quantity", rec["qty"])
+                opened_at.append(self._opened_at[old])
+            else:
+                symbol = api_pos.get("symbol", "")
+                rec["sign"] = 1 if api_pos.get("side", "LONG") == "LONG" else -1
+                rec["qty"] = api_pos.get("quantity", 0)
+                rec["entry"] = api_pos.get("entry_price", 0.0)
+                opened_at.append(now)
+            sym_id = sym_to_id.get(symbol)
+            if sym_id is None:
+                sym_id = sym_to_id[symbol] = len(id_to_sym)
+                id_to_sym.append(symbol)
+            rec["sym_id"] = sym_id
+            current_price = api_pos.get("current_price")
+            rec["cur"] = np.nan if current_price is None else current_price
+            rec["unreal"] = api_pos.get("unrealized_pnl") or 0.0
+            arr[i] = rec
 
-        return pnl
+        self._arr = arr
+        self._id_to_sym = id_to_sym
+        self._pos_ids = pos_ids
+        self._opened_at = opened_at
+        self._updated_at: List[datetime] = [now] * n
+        self._index: Dict[str, int] = {pos_id: i for i, pos_id in enumerate(pos_ids)}
+        self.positions = {pos_id: Position(self, i) for i, pos_id in enumerate(pos_ids)}
+        rows_by_symbol: Dict[str, List[int]] = defaultdict(list)
+        for i, sym_id in enumerate(arr["sym_id"].tolist()):
+            rows_by_symbol[self._id_to_sym[sym_id]].append(i)
+        self._rows_by_symbol: Dict[str, np.ndarray] = {
+            symbol: np.array(rows, dtype=np.intp) for symbol, rows in rows_by_symbol.items()
+        }
+        self._changed()
 
-    async def get_open_positions(self) -> List[Dict]:
-        """Get all open positions as dictionaries."""
-        async with self._lock:
-            return [
+    def _apply_marks(self, api_positions: Dict[str, Dict]) -> None:
+        """Copy current price and unrealized P&L from API data into existing records."""
+        arr = self._arr
+        now = datetime.now()
+        for pos_id, api_pos in api_positions.items():
+            row = self._index[pos_id]
+            current_price = api_pos.get("current_price")
+            arr["cur"][row] = np.nan if current_price is None else current_price
+            arr["unreal"][row] = api_pos.get("unrealized_pnl") or 0.0
+            self._updated_at[row] = now
+        self._changed()
+
+    def update_price(self, symbol: str, price: float) -> None:
+        """Update current price for positions."""
+        rows = self._rows_by_symbol.get(symbol)
+        if rows is None:
+            return
+        arr = self._arr
+        # Every row shares the symbol, so the tick value and timestamp are scalars
+        tick_value = self.tick_values.get(symbol, 1.0)
+        now = datetime.now()
+        arr["cur"][rows] = price
+        if price:
+            arr["unreal"][rows] = (
+                arr["sign"][rows] * (price - arr["entry"][rows]) * (tick_value * arr["qty"][rows])
+            )
+        else:
+            arr["unreal"][rows] = 0.0
+        for row in rows:
+            self._updated_at[row] = now
+        self._changed()
+
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """Call ``callback()`` after every position or mark-to-market change."""
+        self._change_listeners.append(callback)
+
+    def _changed(self) -> None:
+        """Drop the cached snapshots and notify listeners."""
+        self._snapshot: Optional[Tuple[Dict, ...]] = None
+        self._snapshot_json: Optional[bytes] = None
+        for callback in self._change_listeners:
+            callback()
+
+    def _build_snapshot(self) -> Tuple[Dict, ...]:
+        """Position dicts for the current records, built once per change."""
+        if self._snapshot is None:
+            self._snapshot = tuple(
                 {
-                    "position_id": pos.position_id,
-                    "symbol": pos.symbol,
-                    "side": pos.side,
-                    "quantity": pos.quantity,
-                    "entry_price": pos.entry_price,
-                    "current_price": pos.current_price,
-                    "unrealized_pnl": pos.unrealized_pnl,
+                    "position_id": pos_id,
+                    "symbol": self._id_to_sym[sym_id],
+                    "side": "LONG" if side > 0 else "SHORT",
+                    "quantity": qty,
+                    "entry_price": entry_price,
+                    "current_price": None if np.isnan(current_price) else current_price,
+                    "unrealized_pnl": unrealized_pnl,
                 }
-                for pos in self.positions.values()
-            ]
+                for pos_id, (qty, entry_price, current_price, unrealized_pnl, _, side, sym_id) in zip(
+                    self._pos_ids, self._arr.tolist()
+                )
+            )
+        return self._snapshot
+
+    async def get_open_positions(self) -> List[Dict]:
+        """Get all open positions as dictionaries (copies; the snapshot is shared)."""
+        return [dict(p) for p in self._build_snapshot()]
+
+    def get_open_positions_json(self) -> bytes:
+        """Get all open positions as a JSON array, serialized once per change."""
+        if self._snapshot_json is None:
+            self._snapshot_json = _json_dumps(self._build_snapshot())
+        return self._snapshot_json
 
     def get_total_unrealized_pnl(self) -> float:
         """Get total unrealized P&L across all positions."""
-        return sum(pos.unrealized_pnl for pos in self.positions.values())
+        return float(self._arr["unreal"].sum())
 
     def get_total_realized_pnl(self) -> float:
         """Get total realized P&L."""
-        return sum(pos.realized_pnl for pos in self.positions.values())
-
+        return float(self._arr["realized"].sum())
@@ -2,9 +2,11 @@
 
 import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Optional
+from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI
 from loguru import logger
@@ -15,10 +17,12 @@ from api.topstepx_client import TopstepXClient
 from api.websocket_handler import WebSocketHandler
 from config.settings import Settings
 from core.data_manager import DataManager
-from core.order_manager import OrderManager
+from core.order_manager import OrderManager, OrderSignal
 from core.position_tracker import PositionTracker
+from monitoring.error_throttle import ErrorThrottle
 from monitoring.performance_tracker import PerformanceTracker
 from risk.risk_manager import RiskManager
+from strategies.base_strategy import TradingSignal
 from strategies.strategy_selector import StrategySelector
 
 # ML Components
@@ -26,9 +30,16 @@ from ml.rl_agent import RLAgent
 from ml.signal_validator import SignalValidator
 from ml.price_predictor import PricePredictor
 
+_CT_TZ = ZoneInfo("America/Chicago")
+
+
 class TradingBot:
     """Main trading bot orchestrator."""
 
+    # Trading-hours result cache (monotonic timestamp, value)
+    _th_cache_ts: float = float("-inf")
+    _th_cache_val: bool = False
+
     def __init__(
         self,
         settings: Optional[Settings] = None,
@@ -62,7 +73,7 @@ class TradingBot:
         # Initialize ML Components
         self.rl_agent = RLAgent()
         self.signal_validator = SignalValidator()
-        self.price_predictor = PricePredictor()
+        self.price_predictor = PricePredictor(quantize_cpu=self.settings.ml_quantize_cpu_models)
         
         # Load Models
         # Non-blocking loading or async if possible, but simple for now
@@ -98,6 +109,12 @@ class TradingBot:
             self.api_client
         )
 
+        # Set by market data callbacks to wake the trading loop
+        self._tick_event = asyncio.Event()
+        self._loop_errors = ErrorThrottle()
+        self.ws_handler.register_callback("quote_update", self._on_market_data)
+        self.ws_handler.register_callback("trade_update", self._on_market_data)
+
     async def start(self) -> None:
         """Start the trading bot."""
         logger.info("Starting ALGOX Trading Bot...")
@@ -128,6 +145,10 @@ class TradingBot:
         logger.info("Trading bot stopped")
         await self._log_activity({"type": "bot_stopped", "message": "Bot stopped via API."})
 
+    def _on_market_data(self, payload: Dict[str, Any]) -> None:
+        """Wake the trading loop when a quote or trade arrives."""
+        self._tick_event.set()
+
     async def _log_activity(self, activity: Dict[str, Any]) -> None:
         """Forward bot activity details to the account manager (if available)."""
         if not self.activity_logger:
@@ -162,84 +183,96 @@ class TradingBot:
                 # Get strategy signals
                 signals = await self.strategy_selector.get_signals()
 
-                # Process signals
-                for signal in signals:
-                    signal_payload = signal.to_dict() if hasattr(signal, "to_dict") else dict(signal)
-                    market_features = {}
-                    if hasattr(signal, "metadata") and "market_features" in signal.metadata:
-                        market_features = signal.metadata["market_features"]
-                    
-                    is_valid, conf = self.signal_validator.validate_signal(signal_payload, market_features)
-                    if not is_valid:
-                        logger.info(f"Signal rejected by ML Validator: {signal_payload.get('symbol')} {signal_payload.get('side')} ({conf:.2f})")
-                        await self._log_activity(
-                            {
-                                "type": "signal_rejected_ml",
-                                "symbol": signal_payload.get("symbol"),
-                                "side": signal_payload.get("side"),
-                                "confidence": conf,
-                            }
-                        )
-                        continue
-                    
-                    if not await self.risk_manager.check_trade_risk(signal_payload):
-                        await self._log_activity(
-                            {
-                                "type": "signal_rejected_risk",
-                                "symbol": signal_payload.get("symbol"),
-                                "side": signal_payload.get("side"),
-                            }
-                        )
-                        continue
-
-                    order_id = await self.order_manager.execute_signal(signal_payload, skip_risk_check=True)
-                    if order_id:
-                        await self._log_activity(
-                            {
-                                "type": "order_submitted",
-                                "symbol": signal_payload.get("symbol"),
-                                "side": signal_payload.get("side"),
-                                "order_id": order_id,
-                                "quantity": signal_payload.get("quantity"),
-                            }
-                        )
-                    else:
-                        await self._log_activity(
-                            {
-                                "type": "order_failed",
-                                "symbol": signal_payload.get("symbol"),
-                                "side": signal_payload.get("side"),
-                                "message": "Order execution returned no ID",
-                            }
+                # Process signals: validate in one batch, then run the risk/execute chains concurrently
+                if signals:
+                    # The validator reads TradingSignal fields directly, so no payload dicts
+                    features = [signal.metadata.get("market_features", {}) for signal in signals]
+                    validations = self.signal_validator.validate_batch(signals, features)
+                    await asyncio.gather(
+                        *(
+                            self._process_one_signal(signal, is_valid, conf)
+                            for signal, (is_valid, conf) in zip(signals, validations)
                         )
+                    )
 
                 # Update performance metrics
                 await self.performance_tracker.update()
+                self._loop_errors.reset()
 
-                # Small delay to prevent CPU spinning
-                await asyncio.sleep(0.1)
+                # Wait for new market data, with a 1s heartbeat
+                try:
+                    await asyncio.wait_for(self._tick_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    self._tick_event.clear()
 
             except Exception as e:
-                logger.error(f"Error in trading loop: {e}", exc_info=True)
+                self._loop_errors.error(f"Error in trading loop: {e}", e)
                 await asyncio.sleep(5)  # Wait before retrying
 
+    async def _process_one_signal(
+        self, signal: TradingSignal, is_valid: bool, conf: float
+    ) -> None:
+        """Risk-check and execute a single ML-validated signal."""
+        if not is_valid:
+            logger.info(f"Signal rejected by ML Validator: {signal.symbol} {signal.side} ({conf:.2f})")
+            await self._log_activity(
+                {
+                    "type": "signal_rejected_ml",
+                    "symbol": signal.symbol,
+                    "side": signal.side,
+                    "confidence": conf,
+                }
+            )
+            return
+
+        order_signal = OrderSignal.from_signal(signal)
+        if not await self.risk_manager.check_trade_risk(order_signal):
+            await self._log_activity(
+                {
+                    "type": "signal_rejected_risk",
+                    "symbol": signal.symbol,
+                    "side": signal.side,
+                }
+            )
+            return
+
+        order_id = await self.order_manager.execute_signal(order_signal, skip_risk_check=True)
+        if order_id:
+            await self._log_activity(
+                {
+                    "type": "order_submitted",
+                    "symbol": signal.symbol,
+                    "side": signal.side,
+                    "order_id": order_id,
+                    "quantity": signal.quantity,
+                }
+            )
+        else:
+            await self._log_activity(
+                {
+                    "type": "order_failed",
+                    "symbol": signal.symbol,
+                    "side": signal.side,
+                    "message": "Order execution returned no ID",
+                }
+            )
+
     def _is_trading_hours(self) -> bool:
-        """Check if current time is within trading hours."""
-        from datetime import datetime
-        import pytz
+        """Check if current time is within trading hours (cached for 1 second)."""
+        t = time.monotonic()
+        if t - self._th_cache_ts < 1.0:
+            return self._th_cache_val
 
-        ct = pytz.timezone("America/Chicago")
-        now = datetime.now(ct)
-        hour = now.hour
-        minute = now.minute
+        now = datetime.now(_CT_TZ)
+        hhmm = now.hour * 100 + now.minute
 
         # Trading hours: 5:00 PM CT (previous day) to 3:10 PM CT (current day)
         # This is 17:00 to 15:10 in 24-hour format
-        if hour >= 17 or hour < 15:
-            return True
-        if hour == 15 and minute <= 10:
-            return True
-        return False
+        self._th_cache_val = hhmm >= 1700 or hhmm <= 1510
+        self._th_cache_ts = t
+        return self._th_cache_val
 
 
 @asynccontextmanager
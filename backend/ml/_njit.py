@@ -0,0 +1,18 @@
+"""Optional Numba JIT decorator shared by the ML kernels."""
+
+from loguru import logger
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.warning("numba not installed. Numerical kernels will run as plain Python.")
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
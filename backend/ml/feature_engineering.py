@@ -1,10 +1,19 @@
 """Feature engineering for ML models."""
 
-from typing import Dict, List
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
 
 import polars as pl
 import numpy as np
 
+from ml.indicator_kernels import (
+    compute_indicators,
+    compute_indicators_batch,
+    compute_volume_indicators,
+    rsi_wilder,
+)
+
 
 class FeatureEngineer:
     """Generates features from market data for ML models."""
@@ -17,107 +26,150 @@ class FeatureEngineer:
         Returns:
             DataFrame with added indicator columns
         """
-        df = bars.clone()
-
-        # Moving Averages
-        df = df.with_columns([
-            pl.col("close").ewm_mean(span=10).alias("sma_10"),
-            pl.col("close").ewm_mean(span=20).alias("sma_20"),
-            pl.col("close").ewm_mean(span=50).alias("sma_50"),
-            pl.col("close").ewm_mean(span=200).alias("sma_200"),
-        ])
-
-        # RSI
-        df = df.with_columns([
-            FeatureEngineer._calculate_rsi(df["close"], 14).alias("rsi_14"),
-        ])
-
-        # MACD
-        macd_line = df["close"].ewm_mean(span=12) - df["close"].ewm_mean(span=26)
-        signal_line = macd_line.ewm_mean(span=9)
-        df = df.with_columns([
-            macd_line.alias("macd"),
-            signal_line.alias("macd_signal"),
-            (macd_line - signal_line).alias("macd_histogram"),
-        ])
-
-        # ATR
-        df = df.with_columns([
-            FeatureEngineer._calculate_atr(df, 14).alias("atr_14"),
-        ])
+        df = bars
 
-        # Bollinger Bands
-        sma_20 = df["close"].ewm_mean(span=20)
-        std_20 = df["close"].rolling_std(20)
-        df = df.with_columns([
-            sma_20.alias("bb_middle"),
-            (sma_20 + 2 * std_20).alias("bb_upper"),
-            (sma_20 - 2 * std_20).alias("bb_lower"),
-            ((pl.col("close") - (sma_20 - 2 * std_20)) / (4 * std_20)).alias("bb_percent_b")
-        ])
-
-        # VWAP
-        typical_price = (df["high"] + df["low"] + df["close"]) / 3
+        # SMAs, RSI, MACD, Bollinger std and ATR in one fused kernel pass
+        close = df["close"].cast(pl.Float64).to_numpy()
+        high = df["high"].cast(pl.Float64).to_numpy()
+        low = df["low"].cast(pl.Float64).to_numpy()
+        indicators = compute_indicators(close, high, low)
+
+        # VWAP and OBV (On Balance Volume) in one cumulative sweep
+        volume_indicators = None
         if "volume" in df.columns:
-            vwap = (typical_price * df["volume"]).cumsum() / df["volume"].cumsum()
-            df = df.with_columns([vwap.alias("vwap")])
-            
-            # OBV (On Balance Volume)
-            price_change = df["close"].diff().fill_null(0)
-            direction = pl.when(price_change > 0).then(1).when(price_change < 0).then(-1).otherwise(0)
-            obv = (direction * df["volume"]).cumsum()
-            df = df.with_columns([obv.alias("obv")])
+            volume_indicators = compute_volume_indicators(
+                close, high, low, df["volume"].cast(pl.Float64).to_numpy()
+            )
+
+        return FeatureEngineer._with_indicators(df, close, indicators, volume_indicators)
+
+    @staticmethod
+    def calculate_indicators_batch(bars_by_symbol: Dict[str, pl.DataFrame]) -> Dict[str, pl.DataFrame]:
+        """
+        Calculate technical indicators for several symbols at once.
+
+        All symbols go through one kernel call that computes them in parallel;
+        each result matches ``calculate_indicators`` on that symbol's bars.
+
+        Returns:
+            Dict of symbol -> DataFrame with added indicator columns
+        """
+        if not bars_by_symbol:
+            return {}
+
+        symbols = list(bars_by_symbol)
+        frames = list(bars_by_symbol.values())
+        offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+        np.cumsum([len(bars) for bars in frames], out=offsets[1:])
+
+        def column(name: str) -> np.ndarray:
+            return np.concatenate([
+                bars[name].cast(pl.Float64).to_numpy()
+                if name in bars.columns else np.zeros(len(bars))
+                for bars in frames
+            ])
+
+        close = column("close")
+        out = compute_indicators_batch(close, column("high"), column("low"), column("volume"), offsets)
+
+        results = {}
+        for s, (symbol, bars) in enumerate(zip(symbols, frames)):
+            a, b = offsets[s], offsets[s + 1]
+            segment = out[:, a:b]
+            volume_indicators = (segment[9], segment[10]) if "volume" in bars.columns else None
+            results[symbol] = FeatureEngineer._with_indicators(
+                bars, close[a:b], tuple(segment[:9]), volume_indicators
+            )
+        return results
+
+    @staticmethod
+    def _with_indicators(df: pl.DataFrame, close: np.ndarray, indicators, volume_indicators) -> pl.DataFrame:
+        """Attach kernel outputs and the expression-based features to ``df``."""
+        (
+            sma_10, sma_20, sma_50, sma_200, macd, macd_signal, rsi, bb_std, atr
+        ) = indicators
+
+        # Bollinger Bands
+        bb_upper = sma_20 + 2 * bb_std
+        bb_lower = sma_20 - 2 * bb_std
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bb_percent_b = (close - bb_lower) / (4 * bb_std)
+
+        columns = [
+            pl.Series("sma_10", sma_10, nan_to_null=True),
+            pl.Series("sma_20", sma_20, nan_to_null=True),
+            pl.Series("sma_50", sma_50, nan_to_null=True),
+            pl.Series("sma_200", sma_200, nan_to_null=True),
+            pl.Series("rsi_14", rsi, nan_to_null=True),
+            pl.Series("macd", macd),
+            pl.Series("macd_signal", macd_signal),
+            pl.Series("macd_histogram", macd - macd_signal),
+            pl.Series("atr_14", atr, nan_to_null=True),
+            pl.Series("bb_middle", sma_20, nan_to_null=True),
+            pl.Series("bb_upper", bb_upper, nan_to_null=True),
+            pl.Series("bb_lower", bb_lower, nan_to_null=True),
+            pl.Series("bb_percent_b", bb_percent_b, nan_to_null=True),
+        ]
+
+        if volume_indicators is not None:
+            vwap, obv = volume_indicators
+            columns += [pl.Series("vwap", vwap), pl.Series("obv", obv)]
 
         # Price Action Features
-        body_size = (df["close"] - df["open"]).abs()
-        upper_shadow = df["high"] - pl.max_horizontal(df["open"], df["close"])
-        lower_shadow = pl.min_horizontal(df["open"], df["close"]) - df["low"]
-        candle_range = df["high"] - df["low"]
-        
-        df = df.with_columns([
+        body_size = (pl.col("close") - pl.col("open")).abs()
+        upper_shadow = pl.col("high") - pl.max_horizontal("open", "close")
+        lower_shadow = pl.min_horizontal("open", "close") - pl.col("low")
+        candle_range = pl.col("high") - pl.col("low")
+        columns += [
             body_size.alias("candle_body_size"),
             upper_shadow.alias("candle_upper_shadow"),
             lower_shadow.alias("candle_lower_shadow"),
             candle_range.alias("candle_range"),
             (body_size / (candle_range + 1e-9)).alias("body_to_range_ratio"),
             (upper_shadow / (body_size + 1e-9)).alias("upper_shadow_ratio"),
-            (lower_shadow / (body_size + 1e-9)).alias("lower_shadow_ratio")
-        ])
+            (lower_shadow / (body_size + 1e-9)).alias("lower_shadow_ratio"),
+        ]
 
         # Momentum / ROC
-        df = df.with_columns([
+        columns += [
             (pl.col("close") / pl.col("close").shift(10) - 1).alias("roc_10"),
-            (pl.col("close") / pl.col("close").shift(20) - 1).alias("roc_20")
-        ])
-
-        return df
+            (pl.col("close") / pl.col("close").shift(20) - 1).alias("roc_20"),
+        ]
 
-    @staticmethod
-    def _calculate_rsi(prices: pl.Series, period: int = 14) -> pl.Series:
-        """Calculate RSI."""
-        delta = prices.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-
-        avg_gain = gain.rolling_mean(period)
-        avg_loss = loss.rolling_mean(period)
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        # One query plan: Polars dedupes the shared sub-expressions and evaluates in parallel
+        df = df.lazy().with_columns(columns).collect()
 
-        return rsi
+        return df
 
     @staticmethod
-    def _calculate_atr(bars: pl.DataFrame, period: int = 14) -> pl.Series:
-        """Calculate ATR."""
-        high_low = bars["high"] - bars["low"]
-        high_close = (bars["high"] - bars["close"].shift(1)).abs()
-        low_close = (bars["low"] - bars["close"].shift(1)).abs()
+    def update_indicators(
+        prev_df: pl.DataFrame, new_bars: pl.DataFrame, state: "StreamingFeatureState"
+    ) -> pl.DataFrame:
+        """
+        Append completed bars to an indicator frame without recomputing history.
 
-        tr = pl.concat([high_low, high_close, low_close], how="horizontal").max(axis=1)
-        atr = tr.rolling_mean(period)
+        ``prev_df`` is the output of ``calculate_indicators`` (or of a previous
+        update) and ``state`` the ``StreamingFeatureState`` built from the same
+        bars (``StreamingFeatureState.from_bars`` at cold start); ``state`` is
+        advanced in place. Use ``calculate_indicators`` for training and cold
+        start.
 
-        return atr
+        Returns:
+            ``prev_df`` with one indicator row appended per new bar
+        """
+        has_volume = "volume" in new_bars.columns
+        rows = []
+        for bar in new_bars.iter_rows(named=True):
+            values = state.update(
+                bar["open"], bar["high"], bar["low"], bar["close"],
+                bar["volume"] if has_volume else 0.0,
+            )
+            rows.append({**bar, **values})
+        if not rows:
+            return prev_df
+        appended = pl.DataFrame(rows, schema=prev_df.schema, strict=False)
+        # vstack links the new chunk instead of copying the existing columns
+        return prev_df.vstack(appended)
 
     @staticmethod
     def extract_features(bars: pl.DataFrame) -> Dict:
@@ -125,19 +177,26 @@ class FeatureEngineer:
         if bars.is_empty():
             return {}
 
-        latest = bars.tail(1)
+        # One extraction of the last row instead of a column lookup per feature
+        latest = bars.row(-1, named=True)
 
         # Helper to safely get value or default
         def get_val(col, default=0.0):
-            return float(latest.get(col, [default])[0]) if col in latest.columns else default
+            value = latest.get(col)
+            # Indicators are null until their lookback window is filled
+            return default if value is None else float(value)
+
+        # SMAs default to the close (zero distance) until their window is filled
+        close = get_val("close")
+        volume_mean = float(bars["volume"].tail(100).mean() or 0.0) if "volume" in bars.columns else 0.0
 
         features = {
             # Price & Trend
-            "current_price": get_val("close"),
-            "sma_10_dist": (get_val("close") - get_val("sma_10")) / (get_val("sma_10") + 1e-9),
-            "sma_20_dist": (get_val("close") - get_val("sma_20")) / (get_val("sma_20") + 1e-9),
-            "sma_50_dist": (get_val("close") - get_val("sma_50")) / (get_val("sma_50") + 1e-9),
-            "sma_200_dist": (get_val("close") - get_val("sma_200")) / (get_val("sma_200") + 1e-9),
+            "current_price": close,
+            "sma_10_dist": (close - get_val("sma_10", close)) / (get_val("sma_10", close) + 1e-9),
+            "sma_20_dist": (close - get_val("sma_20", close)) / (get_val("sma_20", close) + 1e-9),
+            "sma_50_dist": (close - get_val("sma_50", close)) / (get_val("sma_50", close) + 1e-9),
+            "sma_200_dist": (close - get_val("sma_200", close)) / (get_val("sma_200", close) + 1e-9),
             
             # Momentum
             "rsi_14": get_val("rsi_14", 50.0),
@@ -155,7 +214,7 @@ class FeatureEngineer:
             # Volume
             "vwap_dist": (get_val("close") - get_val("vwap")) / (get_val("vwap") + 1e-9),
             "obv": get_val("obv"),
-            "volume_ratio": get_val("volume") / (latest["volume"].mean() + 1e-9), # simplified relative volume
+            "volume_ratio": get_val("volume") / (volume_mean + 1e-9), # relative to the recent average
             
             # Price Action
             "body_size_norm": get_val("body_to_range_ratio"),
@@ -164,3 +223,260 @@ class FeatureEngineer:
         }
 
         return features
+
+
+class LazyFeatures(Mapping):
+    """
+    Read-only ``extract_features(bars)`` that is only computed on first access.
+
+    Signals carry one of these in ``metadata["market_features"]``, so signals
+    dropped before any ML consumer reads them never pay for the extraction.
+    """
+
+    __slots__ = ("_bars", "_features")
+
+    def __init__(self, bars: pl.DataFrame):
+        self._bars = bars
+        self._features: Optional[Dict] = None
+
+    def _load(self) -> Dict:
+        if self._features is None:
+            self._features = FeatureEngineer.extract_features(self._bars)
+            self._bars = None
+        return self._features
+
+    def __getitem__(self, key: str):
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __deepcopy__(self, memo) -> "LazyFeatures":
+        # Immutable once built, so copies (e.g. dataclasses.asdict) can share it
+        return self
+
+    def __repr__(self) -> str:
+        state = "pending" if self._features is None else repr(self._features)
+        return f"LazyFeatures({state})"
+
+
+class StreamingFeatureState:
+    """
+    Incremental indicator state for one symbol.
+
+    Warm up once from historical bars with ``from_bars`` (a single kernel
+    pass), then feed each completed bar to ``update``, which advances every
+    indicator in O(1) instead of recomputing the whole history. The values
+    match the last row of ``FeatureEngineer.calculate_indicators`` over the
+    same bars.
+    """
+
+    RSI_PERIOD = 14
+    BB_PERIOD = 20
+    ATR_PERIOD = 14
+    SMA_WINDOWS = (10, 20, 50, 200)
+
+    # (1 - alpha) decay factors for the MACD spans 12, 26 and 9
+    _D12 = 1.0 - 2.0 / 13.0
+    _D26 = 1.0 - 2.0 / 27.0
+    _D9 = 1.0 - 2.0 / 10.0
+
+    def __init__(self):
+        self.count = 0
+        # Enough history for the longest window plus the bar leaving it
+        self.closes: deque = deque(maxlen=max(self.SMA_WINDOWS) + 1)
+        self.sma_sums = {window: 0.0 for window in self.SMA_WINDOWS}
+        self.n12 = self.w12 = self.n26 = self.w26 = self.n9 = self.w9 = 0.0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.bb_sum = 0.0
+        self.bb_sumsq = 0.0
+        self.atr = 0.0
+        self.pv_sum = 0.0
+        self.v_sum = 0.0
+        self.obv = 0.0
+
+    @classmethod
+    def from_bars(cls, bars: pl.DataFrame) -> "StreamingFeatureState":
+        """Build the state as of the last row of ``bars`` using the indicator kernels."""
+        state = cls()
+        n = len(bars)
+        if n == 0:
+            return state
+
+        close = bars["close"].cast(pl.Float64).to_numpy()
+        high = bars["high"].cast(pl.Float64).to_numpy()
+        low = bars["low"].cast(pl.Float64).to_numpy()
+        _, _, _, _, macd, macd_signal, _, _, atr = compute_indicators(close, high, low)
+
+        state.count = n
+        state.closes.extend(close[-state.closes.maxlen:].tolist())
+        for window in cls.SMA_WINDOWS:
+            state.sma_sums[window] = float(close[-window:].sum())
+
+        # Adjusted EMA: the weight total after n bars is a geometric series
+        state.w12 = (1.0 - cls._D12 ** n) / (1.0 - cls._D12)
+        state.w26 = (1.0 - cls._D26 ** n) / (1.0 - cls._D26)
+        state.w9 = (1.0 - cls._D9 ** n) / (1.0 - cls._D9)
+        # The kernel only returns their difference, so recover one EMA and derive the other
+        ema12 = cls._replay_ema(close, cls._D12)
+        ema26 = ema12 - float(macd[-1])
+        state.n12 = ema12 * state.w12
+        state.n26 = ema26 * state.w26
+        state.n9 = float(macd_signal[-1]) * state.w9
+
+        _, avg_gain, avg_loss = rsi_wilder(close, cls.RSI_PERIOD)
+        state.avg_gain = float(avg_gain)
+        state.avg_loss = float(avg_loss)
+
+        window = close[-cls.BB_PERIOD:]
+        state.bb_sum = float(window.sum())
+        state.bb_sumsq = float((window * window).sum())
+
+        if n >= cls.ATR_PERIOD:
+            state.atr = float(atr[-1])
+        else:
+            # Still seeding: the kernel holds the plain sum of true ranges so far
+            prev_close = np.concatenate(([close[0]], close[:-1]))
+            tr = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+            tr[0] = high[0] - low[0]
+            state.atr = float(tr.sum())
+
+        if "volume" in bars.columns:
+            volume = bars["volume"].cast(pl.Float64).to_numpy()
+            state.pv_sum = float(np.dot((high + low + close) / 3.0, volume))
+            state.v_sum = float(volume.sum())
+            direction = np.sign(np.diff(close))
+            state.obv = float(np.dot(direction, volume[1:]))
+
+        return state
+
+    @staticmethod
+    def _replay_ema(close: np.ndarray, decay: float) -> float:
+        """Adjusted EMA of ``close`` at its last element."""
+        weights = decay ** np.arange(close.shape[0] - 1, -1, -1, dtype=np.float64)
+        return float(np.dot(weights, close) / weights.sum())
+
+    def _close_ago(self, k: int) -> Optional[float]:
+        """Close ``k`` bars before the latest, if it has been seen."""
+        return self.closes[-1 - k] if len(self.closes) > k else None
+
+    def update(self, open_: float, high: float, low: float, close: float, volume: float = 0.0) -> Dict:
+        """
+        Advance the state by one completed bar.
+
+        Returns:
+            Dict with the same indicator columns ``calculate_indicators`` adds,
+            with None where a lookback window isn't filled yet
+        """
+        i = self.count
+        prev_close = self._close_ago(0)
+        self.closes.append(close)
+        self.count += 1
+
+        result: Dict = {}
+
+        for window in self.SMA_WINDOWS:
+            self.sma_sums[window] += close
+            leaving = self._close_ago(window)
+            if leaving is not None:
+                self.sma_sums[window] -= leaving
+            result[f"sma_{window}"] = self.sma_sums[window] / window if i >= window - 1 else None
+
+        self.n12 = close + self._D12 * self.n12
+        self.w12 = 1.0 + self._D12 * self.w12
+        self.n26 = close + self._D26 * self.n26
+        self.w26 = 1.0 + self._D26 * self.w26
+        macd = self.n12 / self.w12 - self.n26 / self.w26
+        self.n9 = macd + self._D9 * self.n9
+        self.w9 = 1.0 + self._D9 * self.w9
+        macd_signal = self.n9 / self.w9
+        result["macd"] = macd
+        result["macd_signal"] = macd_signal
+        result["macd_histogram"] = macd - macd_signal
+
+        rsi = None
+        if prev_close is not None:
+            delta = close - prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            period = self.RSI_PERIOD
+            if i <= period:
+                self.avg_gain += gain
+                self.avg_loss += loss
+                if i == period:
+                    self.avg_gain /= period
+                    self.avg_loss /= period
+            else:
+                self.avg_gain = (self.avg_gain * (period - 1) + gain) / period
+                self.avg_loss = (self.avg_loss * (period - 1) + loss) / period
+            if i >= period:
+                if self.avg_loss > 0.0:
+                    rsi = 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+                elif self.avg_gain > 0.0:
+                    rsi = 100.0
+        result["rsi_14"] = rsi
+
+        tr = high - low
+        if prev_close is not None:
+            tr = max(tr, abs(high - prev_close), abs(low - prev_close))
+        atr = None
+        if i < self.ATR_PERIOD:
+            self.atr += tr
+            if i == self.ATR_PERIOD - 1:
+                self.atr /= self.ATR_PERIOD
+                atr = self.atr
+        else:
+            self.atr = ((self.ATR_PERIOD - 1) * self.atr + tr) / self.ATR_PERIOD
+            atr = self.atr
+        result["atr_14"] = atr
+
+        self.bb_sum += close
+        self.bb_sumsq += close * close
+        leaving = self._close_ago(self.BB_PERIOD)
+        if leaving is not None:
+            self.bb_sum -= leaving
+            self.bb_sumsq -= leaving * leaving
+        sma_20 = result["sma_20"]
+        if sma_20 is not None:
+            var = (self.bb_sumsq - self.bb_sum * self.bb_sum / self.BB_PERIOD) / (self.BB_PERIOD - 1)
+            bb_std = float(np.sqrt(var)) if var > 0.0 else 0.0
+            bb_lower = sma_20 - 2 * bb_std
+            result["bb_middle"] = sma_20
+            result["bb_upper"] = sma_20 + 2 * bb_std
+            result["bb_lower"] = bb_lower
+            result["bb_percent_b"] = (close - bb_lower) / (4 * bb_std) if bb_std > 0.0 else None
+        else:
+            result["bb_middle"] = result["bb_upper"] = result["bb_lower"] = None
+            result["bb_percent_b"] = None
+
+        self.pv_sum += (high + low + close) / 3.0 * volume
+        self.v_sum += volume
+        if prev_close is not None:
+            if close > prev_close:
+                self.obv += volume
+            elif close < prev_close:
+                self.obv -= volume
+        result["vwap"] = self.pv_sum / self.v_sum if self.v_sum > 0.0 else close
+        result["obv"] = self.obv
+
+        body_size = abs(close - open_)
+        upper_shadow = high - max(open_, close)
+        lower_shadow = min(open_, close) - low
+        candle_range = high - low
+        result["candle_body_size"] = body_size
+        result["candle_upper_shadow"] = upper_shadow
+        result["candle_lower_shadow"] = lower_shadow
+        result["candle_range"] = candle_range
+        result["body_to_range_ratio"] = body_size / (candle_range + 1e-9)
+        result["upper_shadow_ratio"] = upper_shadow / (body_size + 1e-9)
+        result["lower_shadow_ratio"] = lower_shadow / (body_size + 1e-9)
+
+        for lag in (10, 20):
+            base = self._close_ago(lag)
+            result[f"roc_{lag}"] = close / base - 1 if base is not None else None
+
+        return result
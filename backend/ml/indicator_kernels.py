@@ -0,0 +1,220 @@
+"""Numba kernels for technical indicators on raw OHLCV arrays."""
+
+import numpy as np
+
+from ml._njit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def rsi_wilder(close, period=14):
+    """
+    Wilder's RSI of ``close``.
+
+    Average gain/loss are seeded with the plain mean of the first ``period``
+    deltas and then smoothed recursively: avg = (avg * (period - 1) + x) / period.
+    RSI is NaN until the seed window is filled, and for a flat window.
+
+    Returns:
+        (rsi, avg_gain, avg_loss): the RSI series plus the final smoothing
+        state (still the running sums if fewer than ``period`` deltas were seen)
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if i < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss > 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            rsi[i] = 100.0
+
+    return rsi, avg_gain, avg_loss
+
+
+@njit(cache=True, fastmath=True)
+def compute_indicators(close, high, low, rsi_period=14, bb_period=20, atr_period=14):
+    """
+    Compute the close-based indicators in one pass over the bars (plus the
+    RSI recurrence).
+
+    SMAs are NaN until their window is full. MACD EMAs use the adjusted
+    (normalized-weight) form, matching Polars' ``ewm_mean(span=...)``. RSI
+    is Wilder's (see ``rsi_wilder``), the Bollinger width uses the
+    rolling sample standard deviation, and ATR is Wilder's running average
+    of the true range (seeded with the mean of the first ``atr_period``).
+
+    Returns:
+        (sma_10, sma_20, sma_50, sma_200, macd, macd_signal, rsi, bb_std, atr)
+    """
+    n = close.shape[0]
+    sma_10 = np.full(n, np.nan)
+    sma_20 = np.full(n, np.nan)
+    sma_50 = np.full(n, np.nan)
+    sma_200 = np.full(n, np.nan)
+    macd = np.empty(n)
+    macd_signal = np.empty(n)
+    bb_std = np.full(n, np.nan)
+    atr = np.full(n, np.nan)
+
+    # Decay factors (1 - alpha) for the MACD spans
+    d12 = 1.0 - 2.0 / 13.0
+    d26 = 1.0 - 2.0 / 27.0
+    d9 = 1.0 - 2.0 / 10.0
+
+    # Adjusted EMA state: weighted sum and weight total per span
+    n12 = w12 = n26 = w26 = n9 = w9 = 0.0
+
+    # Running window sums for the SMAs
+    s10 = s20 = s50 = s200 = 0.0
+
+    win_sum = 0.0
+    win_sumsq = 0.0
+    atr_state = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # SMAs: add the new close, drop the one leaving each window
+        s10 += c
+        s20 += c
+        s50 += c
+        s200 += c
+        if i >= 10:
+            s10 -= close[i - 10]
+        if i >= 20:
+            s20 -= close[i - 20]
+        if i >= 50:
+            s50 -= close[i - 50]
+        if i >= 200:
+            s200 -= close[i - 200]
+        if i >= 9:
+            sma_10[i] = s10 / 10.0
+        if i >= 19:
+            sma_20[i] = s20 / 20.0
+        if i >= 49:
+            sma_50[i] = s50 / 50.0
+        if i >= 199:
+            sma_200[i] = s200 / 200.0
+
+        n12 = c + d12 * n12
+        w12 = 1.0 + d12 * w12
+        n26 = c + d26 * n26
+        w26 = 1.0 + d26 * w26
+
+        m = n12 / w12 - n26 / w26
+        macd[i] = m
+        n9 = m + d9 * n9
+        w9 = 1.0 + d9 * w9
+        macd_signal[i] = n9 / w9
+
+        # ATR: true range folded into Wilder's running average
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            tr = max(tr, abs(high[i] - prev_close), abs(low[i] - prev_close))
+        if i < atr_period:
+            atr_state += tr
+            if i == atr_period - 1:
+                atr_state /= atr_period
+                atr[i] = atr_state
+        else:
+            atr_state = ((atr_period - 1) * atr_state + tr) / atr_period
+            atr[i] = atr_state
+
+        # Bollinger: rolling sample std of close
+        win_sum += c
+        win_sumsq += c * c
+        if i >= bb_period:
+            old_c = close[i - bb_period]
+            win_sum -= old_c
+            win_sumsq -= old_c * old_c
+        if i >= bb_period - 1:
+            var = (win_sumsq - win_sum * win_sum / bb_period) / (bb_period - 1)
+            bb_std[i] = np.sqrt(var) if var > 0.0 else 0.0
+
+    rsi, _, _ = rsi_wilder(close, rsi_period)
+
+    return sma_10, sma_20, sma_50, sma_200, macd, macd_signal, rsi, bb_std, atr
+
+
+@njit(cache=True, fastmath=True)
+def compute_volume_indicators(close, high, low, volume):
+    """
+    Compute cumulative VWAP and OBV in one sweep.
+
+    Returns:
+        (vwap, obv)
+    """
+    n = close.shape[0]
+    vwap = np.empty(n)
+    obv = np.empty(n)
+    pv_sum = 0.0
+    v_sum = 0.0
+    obv_state = 0.0
+
+    for i in range(n):
+        v = volume[i]
+        pv_sum += (high[i] + low[i] + close[i]) / 3.0 * v
+        v_sum += v
+        vwap[i] = pv_sum / v_sum if v_sum > 0.0 else close[i]
+
+        if i > 0:
+            if close[i] > close[i - 1]:
+                obv_state += v
+            elif close[i] < close[i - 1]:
+                obv_state -= v
+        obv[i] = obv_state
+
+    return vwap, obv
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def compute_indicators_batch(close, high, low, volume, offsets):
+    """
+    Run both indicator kernels over several symbols in parallel.
+
+    The inputs are the symbols' bars concatenated end to end; symbol ``s``
+    occupies ``[offsets[s], offsets[s + 1])``. Each segment is computed
+    independently (on its own thread under Numba), so symbols with
+    different bar counts can share one call.
+
+    Returns:
+        2D array of shape (11, n_bars): the nine ``compute_indicators``
+        outputs followed by vwap and obv, in the same column layout as the
+        inputs.
+    """
+    out = np.empty((11, close.shape[0]))
+    for s in prange(offsets.shape[0] - 1):
+        a = offsets[s]
+        b = offsets[s + 1]
+        indicators = compute_indicators(close[a:b], high[a:b], low[a:b])
+        for k in range(9):
+            out[k, a:b] = indicators[k]
+        vwap, obv = compute_volume_indicators(close[a:b], high[a:b], low[a:b], volume[a:b])
+        out[9, a:b] = vwap
+        out[10, a:b] = obv
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import so the first live call doesn't pay for it
+    compute_indicators(np.zeros(2), np.zeros(2), np.zeros(2))
+    compute_volume_indicators(np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(2))
+    compute_indicators_batch(
+        np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(2), np.array([0, 2], dtype=np.int64)
+    )
@@ -1,103 +1,199 @@
 """Model management system."""
 
 import os
-import json
 import datetime
 import shutil
+import sqlite3
+import threading
 from typing import Dict, List, Optional
 from loguru import logger
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request that makes dst share src's extents (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """
+    Copy ``src`` to ``dst`` as cheaply as the filesystem allows.
+
+    Tries a copy-on-write reflink first, then an in-kernel
+    ``copy_file_range`` (which reflinks itself where supported), and
+    finally ``shutil.copy2``. A hardlink is deliberately not used: retraining
+    usually rewrites the source file in place, which would silently change
+    the registered version too.
+    """
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                if fcntl is None:
+                    raise OSError("reflink unsupported")
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), min(remaining, 1 << 30))
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        shutil.copystat(src, dst)
+    except (AttributeError, OSError):
+        # copy_file_range missing (non-Linux) or refused (e.g. cross-filesystem on old kernels)
+        shutil.copy2(src, dst)
+
+
 class ModelManager:
     """
     Manages ML model lifecycle: registration, versioning, loading.
+
+    The registry is a SQLite database in WAL mode, so concurrent readers
+    never block on a writer and every mutation is a single atomic statement
+    or transaction.
     """
-    
-    REGISTRY_FILE = "models/registry.json"
-    
-    def __init__(self, models_dir: str = "models"):
+
+    REGISTRY_FILE = "registry.db"
+    LEGACY_REGISTRY_FILE = "registry.json"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS models (
+            name TEXT NOT NULL,
+            version TEXT NOT NULL,
+            path TEXT NOT NULL,
+            metrics TEXT NOT NULL DEFAULT '{}',
+            active INTEGER NOT NULL DEFAULT 0,
+            ts TEXT NOT NULL,
+            PRIMARY KEY (name, version)
+        );
+        CREATE INDEX IF NOT EXISTS models_name_active ON models (name, active);
+    """
+
+    def __init__(self, models_dir: str = "models", registry_path: Optional[str] = None):
         self.models_dir = models_dir
-        self.registry: Dict[str, List[Dict]] = self._load_registry()
+        self.registry_path = registry_path or os.path.join(models_dir, self.REGISTRY_FILE)
+        # Opened on first use so importing the module doesn't touch the filesystem
+        self._db: Optional[sqlite3.Connection] = None
+        # Guards the shared connection and the active-path memo across threads
+        self._lock = threading.RLock()
+        self._active_cache: Dict[str, Optional[str]] = {}
 
-    def _load_registry(self) -> Dict:
-        if os.path.exists(self.REGISTRY_FILE):
-            try:
-                with open(self.REGISTRY_FILE, "r") as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Failed to load model registry: {e}")
-        return {}
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.registry_path) or ".", exist_ok=True)
+            # Autocommit mode; multi-statement changes use explicit transactions
+            self._db = sqlite3.connect(
+                self.registry_path, isolation_level=None, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(self.SCHEMA)
+            self._import_legacy_registry()
+        return self._db
 
-    def _save_registry(self):
-        os.makedirs(os.path.dirname(self.REGISTRY_FILE), exist_ok=True)
-        with open(self.REGISTRY_FILE, "w") as f:
-            json.dump(self.registry, f, indent=2)
+    def _import_legacy_registry(self):
+        """Copy entries from an old JSON registry into an empty database."""
+        legacy_path = os.path.join(os.path.dirname(self.registry_path), self.LEGACY_REGISTRY_FILE)
+        if not os.path.exists(legacy_path):
+            return
+        if self._db.execute("SELECT 1 FROM models LIMIT 1").fetchone():
+            return
+        try:
+            with open(legacy_path, "rb") as f:
+                legacy = _json_loads(f.read())
+        except Exception as e:
+            logger.error(f"Failed to load model registry: {e}")
+            return
+        rows = [
+            (name, m["version"], m["path"], _json_dumps(m.get("metrics", {})), int(bool(m.get("active"))), m.get("timestamp", ""))
+            for name, entries in legacy.items()
+            for m in entries
+        ]
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany("INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?, ?, ?)", rows)
+        logger.info(f"Imported {len(rows)} model versions from {legacy_path}")
 
     def register_model(self, model_name: str, file_path: str, metrics: Dict = None, version: str = None):
         """Register a new model version."""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Model file {file_path} not found")
-            
+
         timestamp = datetime.datetime.utcnow().isoformat()
         if not version:
             version = f"v{timestamp.replace(':', '').replace('-', '')}"
-            
+
         # Copy to models dir with version
         ext = os.path.splitext(file_path)[1]
         target_filename = f"{model_name}_{version}{ext}"
         target_path = os.path.join(self.models_dir, target_filename)
-        
+
         os.makedirs(self.models_dir, exist_ok=True)
-        shutil.copy2(file_path, target_path)
-        
-        entry = {
-            "version": version,
-            "timestamp": timestamp,
-            "path": target_path,
-            "metrics": metrics or {},
-            "active": False
-        }
-        
-        if model_name not in self.registry:
-            self.registry[model_name] = []
-            
-        self.registry[model_name].append(entry)
-        self._save_registry()
+        _clone_file(file_path, target_path)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO models (name, version, path, metrics, active, ts) VALUES (?, ?, ?, ?, 0, ?)",
+                (model_name, version, target_path, _json_dumps(metrics or {}), timestamp),
+            )
+            self._active_cache.pop(model_name, None)
         logger.info(f"Registered model {model_name} version {version}")
 
     def set_active_version(self, model_name: str, version: str):
         """Set a specific version as active."""
-        if model_name not in self.registry:
-            raise ValueError(f"Model {model_name} not found")
-            
-        found = False
-        for entry in self.registry[model_name]:
-            if entry["version"] == version:
-                entry["active"] = True
-                found = True
-            else:
-                entry["active"] = False
-        
-        if not found:
-            raise ValueError(f"Version {version} not found for {model_name}")
-            
-        self._save_registry()
+        with self._lock, self._conn as conn:
+            self._active_cache.pop(model_name, None)
+            conn.execute("BEGIN IMMEDIATE")
+            if not conn.execute("SELECT 1 FROM models WHERE name = ? LIMIT 1", (model_name,)).fetchone():
+                raise ValueError(f"Model {model_name} not found")
+            if not conn.execute(
+                "SELECT 1 FROM models WHERE name = ? AND version = ?", (model_name, version)
+            ).fetchone():
+                raise ValueError(f"Version {version} not found for {model_name}")
+            conn.execute("UPDATE models SET active = 0 WHERE name = ? AND active = 1", (model_name,))
+            conn.execute("UPDATE models SET active = 1 WHERE name = ? AND version = ?", (model_name, version))
+
         # TODO: Trigger reload in services
-        
+
+    def list_versions(self, model_name: str) -> List[Dict]:
+        """All registered versions of a model, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT version, ts, path, metrics, active FROM models WHERE name = ? ORDER BY rowid",
+                (model_name,),
+            ).fetchall()
+        return [
+            {"version": v, "timestamp": ts, "path": path, "metrics": _json_loads(metrics), "active": bool(active)}
+            for v, ts, path, metrics, active in rows
+        ]
+
     def get_active_model_path(self, model_name: str) -> Optional[str]:
         """Get path to the active model version."""
-        if model_name not in self.registry:
-            return None
-            
-        # Return active, or latest if none active
-        active = next((m for m in self.registry[model_name] if m.get("active")), None)
-        if active:
-            return active["path"]
-            
-        if self.registry[model_name]:
-            # Default to latest
-            return self.registry[model_name][-1]["path"]
-            
-        return None
+        with self._lock:
+            if model_name in self._active_cache:
+                return self._active_cache[model_name]
+            # Return active, or latest if none active
+            row = self._conn.execute(
+                "SELECT path FROM models WHERE name = ? ORDER BY active DESC, rowid DESC LIMIT 1",
+                (model_name,),
+            ).fetchone()
+            path = row[0] if row else None
+            self._active_cache[model_name] = path
+            return path
 
 model_manager = ModelManager()
-
@@ -18,24 +18,30 @@ class LSTMModel(nn.Module):
         self.fc = nn.Linear(hidden_size, output_size)
 
     def forward(self, x):
-        h0 = torch.zeros(self.num_layers, x.size(0), self.hidden_size).to(x.device)
-        c0 = torch.zeros(self.num_layers, x.size(0), self.hidden_size).to(x.device)
-        
-        out, _ = self.lstm(x, (h0, c0))
+        # nn.LSTM starts from zero hidden/cell state when none is passed
+        out, _ = self.lstm(x)
         out = self.fc(out[:, -1, :])
         return out
 
 class PricePredictor:
     """LSTM-based price predictor."""
 
-    def __init__(self, model_path: str = "models/price_predictor.pth"):
+    def __init__(self, model_path: str = "models/price_predictor.pth", quantize_cpu: bool = True):
         self.model_path = model_path
+        self.quantize_cpu = quantize_cpu
         self.model = None
         self.scaler = None
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.input_size = 5 # Example: Close, High, Low, Volume, RSI
         self.sequence_length = 60 # Lookback
 
+        # Page-locked staging buffer so host-to-GPU input copies can be async
+        self._pinned_input: Optional[torch.Tensor] = None
+        if self.device.type == "cuda":
+            self._pinned_input = torch.empty(
+                (1, self.sequence_length, self.input_size), dtype=torch.float32, pin_memory=True
+            )
+
     def load_model(self):
         """Load trained model."""
         if not os.path.exists(self.model_path):
@@ -49,6 +55,12 @@ class PricePredictor:
             self.model.load_state_dict(checkpoint['model_state_dict'])
             self.model.to(self.device)
             self.model.eval()
+
+            if self.quantize_cpu and self.device.type == "cpu":
+                # int8 weights for the LSTM and output layer (FBGEMM kernels)
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {nn.LSTM, nn.Linear}, dtype=torch.qint8
+                )
             
             if 'scaler' in checkpoint:
                 self.scaler = checkpoint['scaler']
@@ -71,9 +83,15 @@ class PricePredictor:
                 # Assuming simple scaling, in production need robust pipeline
                 pass
             
-            x = torch.tensor(recent_data, dtype=torch.float32).unsqueeze(0).to(self.device)
-            
-            with torch.no_grad():
+            # Shares memory with recent_data when it's already float32 and contiguous
+            x = torch.from_numpy(np.ascontiguousarray(recent_data, dtype=np.float32)).unsqueeze(0)
+            if self._pinned_input is not None and x.shape == self._pinned_input.shape:
+                self._pinned_input.copy_(x)
+                x = self._pinned_input.to(self.device, non_blocking=True)
+            else:
+                x = x.to(self.device)
+
+            with torch.inference_mode():
                 prediction = self.model(x)
                 
             pred_val = prediction.item()
@@ -3,21 +3,65 @@
 import gymnasium as gym
 from gymnasium import spaces
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple, Optional
 
+from ml._njit import njit
 from ml.feature_engineering import FeatureEngineer
 
+
+# Largest absolute position (contracts) the action space can reach
+MAX_POSITION = 1
+
+
+@njit(cache=True)
+def _apply_action(action, price, position, entry_price):
+    """
+    Apply a discrete action at ``price``.
+
+    Returns:
+        (position, entry_price, realized_pnl)
+    """
+    pnl = 0.0
+    if action == 1:  # Buy: open long, reversing any short
+        if position <= 0:
+            if position < 0:
+                pnl = (entry_price - price) * -position
+            position = 1
+            entry_price = price
+    elif action == 2:  # Sell: open short, reversing any long
+        if position >= 0:
+            if position > 0:
+                pnl = (price - entry_price) * position
+            position = -1
+            entry_price = price
+    elif action == 3:  # Close all
+        if position != 0:
+            pnl = (price - entry_price) * position
+            position = 0
+            entry_price = 0.0
+    return position, entry_price, pnl
+
 class TradingEnvironment(gym.Env):
     """
     Custom Environment that follows gym interface.
     """
     metadata = {'render.modes': ['human']}
 
-    def __init__(self, df: pd.DataFrame, initial_balance: float = 50000.0):
+    def __init__(
+        self,
+        features: np.ndarray,
+        close: np.ndarray,
+        feature_names: List[str],
+        initial_balance: float = 50000.0,
+    ):
+        """
+        Args:
+            features: (n_bars, n_features) market feature matrix
+            close: (n_bars,) close prices
+            feature_names: Column name for each feature in ``features``
+        """
         super(TradingEnvironment, self).__init__()
 
-        self.df = df
         self.initial_balance = initial_balance
         self.current_step = 0
         
@@ -37,8 +81,7 @@ class TradingEnvironment(gym.Env):
         # Let's say we have 20 market features + 3 account features = 23
         # We need to determine feature count dynamically or fixed
         
-        feature_cols = [c for c in df.columns if c not in ['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-        self.market_features_count = len(feature_cols)
+        self.market_features_count = len(feature_names)
         self.account_features_count = 3
         
         self.observation_space = spaces.Box(
@@ -51,7 +94,14 @@ class TradingEnvironment(gym.Env):
         self.position = 0 # Number of contracts
         self.entry_price = 0.0
         self.total_pnl = 0.0
-        self.feature_cols = feature_cols
+        self.feature_cols = list(feature_names)
+
+        self._close = np.ascontiguousarray(close, dtype=np.float64)
+        self._features = np.ascontiguousarray(features, dtype=np.float32)
+        self._n_steps = len(self._close)
+        self._obs_buf = np.empty(
+            self.market_features_count + self.account_features_count, dtype=np.float32
+        )
 
     def reset(self, seed=None, options=None):
         super().reset(seed=seed)
@@ -65,71 +115,36 @@ class TradingEnvironment(gym.Env):
         return self._next_observation(), {}
 
     def _next_observation(self):
-        # Get market features
-        market_obs = self.df.iloc[self.current_step][self.feature_cols].values.astype(np.float32)
-        
         # Account state
         unrealized_pnl = 0.0
         if self.position != 0:
-            current_price = self.df.iloc[self.current_step]['close']
-            unrealized_pnl = (current_price - self.entry_price) * self.position
             # Multiplier for futures? Assuming 1:1 for now or handled in reward
-            
-        account_obs = np.array([
-            self.balance,
-            self.position,
-            unrealized_pnl
-        ], dtype=np.float32)
-        
-        return np.concatenate((market_obs, account_obs))
+            unrealized_pnl = (self._close[self.current_step] - self.entry_price) * self.position
+
+        # Written in place: SB3's vec envs copy observations into their own buffers
+        obs = self._obs_buf
+        obs[:self.market_features_count] = self._features[self.current_step]
+        # Account state scaled to O(1) so it doesn't swamp the indicator features
+        obs[-3] = self.balance / self.initial_balance
+        obs[-2] = self.position / MAX_POSITION
+        obs[-1] = unrealized_pnl / self.initial_balance
+        return obs
 
     def step(self, action):
         # Execute one time step within the environment
-        current_price = self.df.iloc[self.current_step]['close']
-        
-        reward = 0
+        current_price = self._close[self.current_step]
+
         terminated = False
         truncated = False
-        
-        # Action logic
-        if action == 1: # Buy
-            if self.position <= 0: # Open Long or Reverse Short
-                if self.position < 0:
-                    # Close short
-                    pnl = (self.entry_price - current_price) * abs(self.position)
-                    self.balance += pnl
-                    self.total_pnl += pnl
-                    reward += pnl # Reward for closing profitable trade?
-                
-                self.position = 1
-                self.entry_price = current_price
-                
-        elif action == 2: # Sell (Short or Close Long)
-             if self.position >= 0:
-                if self.position > 0:
-                    # Close long
-                    pnl = (current_price - self.entry_price) * self.position
-                    self.balance += pnl
-                    self.total_pnl += pnl
-                    reward += pnl
-                
-                self.position = -1
-                self.entry_price = current_price
-                
-        elif action == 3: # Close All
-            if self.position != 0:
-                pnl = 0
-                if self.position > 0:
-                    pnl = (current_price - self.entry_price) * self.position
-                else:
-                    pnl = (self.entry_price - current_price) * abs(self.position)
-                
-                self.balance += pnl
-                self.total_pnl += pnl
-                reward += pnl
-                self.position = 0
-                self.entry_price = 0
-        
+
+        # Action logic (0: hold, 1: buy, 2: sell, 3: close all)
+        self.position, self.entry_price, pnl = _apply_action(
+            int(action), current_price, self.position, self.entry_price
+        )
+        self.balance += pnl
+        self.total_pnl += pnl
+        reward = pnl  # Reward for closing profitable trade?
+
         # Calculate reward
         # Reward can be: Change in Portfolio Value (Realized + Unrealized)
         # Or Sharpe Ratio over window
@@ -140,7 +155,7 @@ class TradingEnvironment(gym.Env):
         
         self.current_step += 1
         
-        if self.current_step >= len(self.df) - 1:
+        if self.current_step >= self._n_steps - 1:
             terminated = True
             
         obs = self._next_observation()
@@ -1,13 +1,17 @@
 """Training script for RL Agent."""
 
 import os
+from typing import List, Optional, Tuple
+
 import pandas as pd
 import numpy as np
+import polars as pl
+import torch
 from loguru import logger
 
 try:
     from stable_baselines3 import PPO
-    from stable_baselines3.common.vec_env import DummyVecEnv
+    from stable_baselines3.common.vec_env import SubprocVecEnv
 except ImportError:
     logger.error("stable-baselines3 not installed.")
     exit(1)
@@ -15,6 +19,9 @@ except ImportError:
 from ml.rl_environment import TradingEnvironment
 from ml.feature_engineering import FeatureEngineer
 
+# Raw bar columns kept out of the observation vector
+NON_FEATURE_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
 class RLTrainer:
     """Trains the PPO agent."""
 
@@ -22,24 +29,26 @@ class RLTrainer:
         self.data_path = data_path
         self.model_output = model_output
 
-    def load_data(self) -> pd.DataFrame:
-        """Load and preprocess market data."""
+    def load_data(self) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Load market data and compute indicators.
+
+        Returns:
+            (features, close, feature_names) arrays for TradingEnvironment
+        """
         if not os.path.exists(self.data_path):
             logger.warning("Data file not found. Creating dummy data.")
-            return self._create_dummy_data()
-            
-        df = pd.read_csv(self.data_path)
-        # Calculate indicators
-        df = FeatureEngineer.calculate_indicators(pd.DataFrame(df) if not isinstance(df, pd.DataFrame) else df) # Polars vs Pandas mix? FeatureEngineer expects Polars
-        
-        # Let's assume FeatureEngineer can handle conversion or we convert here
-        # Actually FeatureEngineer expects Polars DataFrame.
-        import polars as pl
-        df_pl = pl.from_pandas(df)
-        df_pl = FeatureEngineer.calculate_indicators(df_pl)
-        return df_pl.to_pandas() # Convert back for Gym
-
-    def _create_dummy_data(self) -> pd.DataFrame:
+            df = self._create_dummy_data()
+        else:
+            df = pl.read_csv(self.data_path, try_parse_dates=True)
+
+        df = FeatureEngineer.calculate_indicators(df)
+        feature_names = [c for c in df.columns if c not in NON_FEATURE_COLUMNS]
+        features = df.select(pl.col(feature_names).cast(pl.Float32)).to_numpy()
+        close = df["close"].cast(pl.Float64).to_numpy()
+        return features, close, feature_names
+
+    def _create_dummy_data(self) -> pl.DataFrame:
         # Create dummy OHLCV
         dates = pd.date_range(start="2023-01-01", periods=1000, freq="1min")
         data = {
@@ -50,25 +59,56 @@ class RLTrainer:
             "close": np.random.uniform(4000, 4100, 1000),
             "volume": np.random.uniform(100, 1000, 1000)
         }
-        # Calculate indicators
-        import polars as pl
-        df_pl = pl.DataFrame(data)
-        df_pl = FeatureEngineer.calculate_indicators(df_pl)
-        return df_pl.to_pandas()
-
-    def train(self, total_timesteps=10000):
-        df = self.load_data()
-        
-        # Create environment
-        env = TradingEnvironment(df)
-        env = DummyVecEnv([lambda: env]) # Vectorized env
-
-        # Initialize Agent
-        model = PPO("MlpPolicy", env, verbose=1)
-        
+        return pl.DataFrame(data)
+
+    def train(
+        self,
+        total_timesteps=10000,
+        n_envs: Optional[int] = None,
+        compile_policy: Optional[bool] = None,
+    ):
+        """
+        Train PPO on the loaded data.
+
+        Args:
+            n_envs: Parallel environments (defaults to the CPU count)
+            compile_policy: torch.compile the policy MLP (defaults to on when CUDA is available)
+        """
+        features, close, feature_names = self.load_data()
+
+        # One environment per core, each stepping in its own worker process
+        n_envs = n_envs or os.cpu_count() or 1
+
+        def make_env():
+            return lambda: TradingEnvironment(features, close, feature_names, initial_balance=50000.0)
+
+        env = SubprocVecEnv([make_env() for _ in range(n_envs)])
+
+        # Initialize Agent: wider net and bigger minibatches so updates run as large GEMMs
+        model = PPO(
+            "MlpPolicy",
+            env,
+            n_steps=1024,
+            batch_size=512,
+            n_epochs=10,
+            device="auto",
+            policy_kwargs={"net_arch": [256, 256]},
+            verbose=1,
+        )
+
+        if compile_policy is None:
+            compile_policy = torch.cuda.is_available()
+        if compile_policy and hasattr(torch, "compile"):
+            model.policy.mlp_extractor = torch.compile(model.policy.mlp_extractor)
+
         logger.info("Starting RL training...")
         model.learn(total_timesteps=total_timesteps)
-        
+
+        # Compiled modules prefix their state-dict keys with "_orig_mod.", which
+        # PPO.load can't map back onto a plain policy; save the original module
+        extractor = model.policy.mlp_extractor
+        model.policy.mlp_extractor = getattr(extractor, "_orig_mod", extractor)
+
         # Save
         os.makedirs(os.path.dirname(self.model_output), exist_ok=True)
         model.save(self.model_output)
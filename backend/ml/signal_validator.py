@@ -1,21 +1,66 @@
 """ML-based signal validator using XGBoost/LightGBM."""
 
-from typing import Dict, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+import asyncio
 import os
+import time
+from collections import OrderedDict
 import joblib
+import json
 import numpy as np
 from loguru import logger
 
 from ml.feature_engineering import FeatureEngineer
+from monitoring.error_throttle import ErrorThrottle
+
+if TYPE_CHECKING:
+    from strategies.base_strategy import TradingSignal
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import treelite
+    import tl2cgen
+    TREELITE_AVAILABLE = True
+except ImportError:
+    TREELITE_AVAILABLE = False
 
 class SignalValidator:
     """Validates trading signals using ML model."""
 
+    # Micro-batching limits for validate_signal_batched
+    MAX_BATCH = 64
+    MAX_WAIT_MS = 2.0
+
+    # Result cache: inputs equal after rounding share a result for a few seconds
+    CACHE_SIZE = 4096
+    CACHE_TTL = 5.0
+    CACHE_DECIMALS = 3
+
+    # score_batch adds a thread per this many rows (below it, one thread is faster)
+    BULK_ROWS_PER_THREAD = 1024
+
     def __init__(self, model_path: Optional[str] = "models/signal_validator.pkl"):
         self.model = None
         self.model_path = model_path
         self.feature_names = None
         self.feature_engineer = FeatureEngineer()
+        # Compiled tree predictor (treelite), used ahead of the Python model when available
+        self._compiled = None
+        # Raw XGBoost booster behind the sklearn wrapper, for inplace_predict
+        self._booster = None
+        self._booster_margin = False
+        # Rounded feature row bytes -> (monotonic expiry, result), oldest first
+        self._result_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._errors = ErrorThrottle()
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
 
     def load_model(self) -> None:
         """Load trained ML model."""
@@ -26,11 +71,27 @@ class SignalValidator:
         try:
             loaded_data = joblib.load(self.model_path)
             if isinstance(loaded_data, dict):
-                self.model = loaded_data.get("model")
-                self.feature_names = loaded_data.get("feature_names")
+                model = loaded_data.get("model")
+                feature_names = loaded_data.get("feature_names")
+                dtype = loaded_data.get("feature_dtype", "float32")
+                if dtype != "float32":
+                    logger.error(f"Model expects {dtype} features, validator builds float32; not loading")
+                    return
+                n_expected = getattr(model, "n_features_in_", None)
+                if feature_names and n_expected is not None and n_expected != len(feature_names):
+                    logger.error(
+                        f"Model expects {n_expected} features but {len(feature_names)} names were saved; not loading"
+                    )
+                    return
+                self.model = model
+                self.feature_names = feature_names
             else:
                 self.model = loaded_data
-                
+
+            self._result_cache.clear()
+            self._prepare_booster()
+            self._compiled = self._load_compiled_predictor()
+            self._feature_plan()
             logger.info(f"Signal validator model loaded from {self.model_path}")
         except Exception as e:
             logger.error(f"Error loading model: {e}", exc_info=True)
@@ -41,88 +102,345 @@ class SignalValidator:
         """
         Validate a trading signal using ML model.
 
+        Returns:
+            (is_valid, confidence_score)
+        """
+        # A one-row batch; callers with several signals should use validate_batch
+        return self.validate_batch([signal], [market_features])[0]
+
+    def validate_signal_obj(
+        self, signal: "TradingSignal", market_features: Dict
+    ) -> tuple[bool, float]:
+        """``validate_signal`` for a TradingSignal, read in place rather than via ``asdict``."""
+        return self.validate_batch([signal], [market_features])[0]
+
+    async def validate_signal_batched(
+        self, signal: Dict, market_features: Dict
+    ) -> tuple[bool, float]:
+        """
+        Validate a signal, sharing one model call with concurrent callers.
+
+        Signals arriving within ``MAX_WAIT_MS`` of each other (up to
+        ``MAX_BATCH``) are scored together, which amortizes the model's
+        fixed per-call overhead.
+
         Returns:
             (is_valid, confidence_score)
         """
         if self.model is None:
-            # No model loaded, accept all signals
             return True, signal.get("confidence", 0.5)
 
+        loop = asyncio.get_running_loop()
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = loop.create_task(self._batch_loop(self._batch_queue))
+
+        future = loop.create_future()
+        self._batch_queue.put_nowait((signal, market_features, future))
+        return await future
+
+    async def _batch_loop(self, queue: asyncio.Queue):
+        """Drain ``queue`` into micro-batches and resolve each caller's future."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.MAX_WAIT_MS / 1000.0
+            while len(batch) < self.MAX_BATCH:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            signals, features, futures = zip(*batch)
+            results = self.validate_batch(list(signals), list(features))
+            for future, result in zip(futures, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self):
+        """Stop the micro-batching task, if one was started."""
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            await asyncio.gather(self._batch_task, return_exceptions=True)
+            self._batch_task = None
+
+    def validate_batch(
+        self, signals: List[Dict], market_features: List[Dict]
+    ) -> List[tuple[bool, float]]:
+        """
+        Validate several signals with a single model call.
+
+        Signals may be dicts or TradingSignal objects (attributes are read
+        directly, so callers needn't build a dict per signal).
+
+        Returns:
+            List of (is_valid, confidence_score), one per signal
+        """
+        if self.model is None:
+            return [(True, self._signal_fields(signal)[4]) for signal in signals]
+        if not signals:
+            return []
+
+        try:
+            results = self._validate_fast(signals, market_features)
+        except Exception as e:
+            # Unexpected failure: the traceback is logged, but repeats are only counted
+            self._errors.error(f"Error validating signal batch: {e}", e)
+            results = None
+        if results is None:
+            return [(True, 0.5) for _ in signals]  # Default to accepting if error
+        return results
+
+    def _validate_fast(
+        self, signals: List[Dict], market_features: List[Dict]
+    ) -> Optional[List[tuple[bool, float]]]:
+        """validate_batch's work; None if a signal's values can't be encoded."""
+        n_features = len(self._feature_plan())
+        if len(signals) == 1:
+            features_array = self._feat_buf
+        else:
+            features_array = np.empty((len(signals), n_features), dtype=np.float32)
+        try:
+            for row, signal, features in zip(features_array, signals, market_features):
+                self._prepare_features(signal, features, out=row)
+        except (ValueError, TypeError) as e:
+            # Malformed input (e.g. a non-numeric price), not a bug; no traceback
+            logger.debug(f"Unencodable signal features: {e}")
+            return None
+
+        # Reuse recent results for (near-)identical inputs
+        keys = [row.tobytes() for row in np.round(features_array, self.CACHE_DECIMALS)]
+        now = time.monotonic()
+        results: List[Optional[tuple[bool, float]]] = [None] * len(signals)
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self._result_cache.get(key)
+            if cached is not None and cached[0] > now:
+                results[i] = cached[1]
+            else:
+                misses.append(i)
+        self.cache_hits += len(signals) - len(misses)
+        self.cache_misses += len(misses)
+
+        if misses:
+            rows = features_array if len(misses) == len(signals) else features_array[misses]
+            confidences = self._predict_confidences(rows)
+            expires_at = now + self.CACHE_TTL
+            for i, c in zip(misses, confidences):
+                # Threshold for acceptance
+                # TODO: Make threshold configurable via Settings
+                results[i] = (bool(c > 0.6), float(c))
+                self._cache_result(keys[i], expires_at, results[i])
+        return results
+
+    def score_batch(self, X: np.ndarray) -> np.ndarray:
+        """
+        Confidences for a large feature matrix, e.g. a backtest replay.
+
+        Rows are model inputs in ``feature_names`` order. The booster's
+        thread count is raised for the call in proportion to the row count,
+        then pinned back to one for live scoring.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if self.model is None:
+            return np.full(len(X), 0.5)
+
+        n_threads = min(os.cpu_count() or 1, len(X) // self.BULK_ROWS_PER_THREAD)
+        if self._booster is None or n_threads <= 1:
+            return self._predict_confidences(X)
+
+        self._booster.set_param({"nthread": n_threads})
         try:
-            # Extract features
-            features = self._prepare_features(signal, market_features)
-            
-            # Predict
-            # Ensure features are in 2D array [samples, features]
-            features_array = np.array(features).reshape(1, -1)
-            
-            if hasattr(self.model, "predict_proba"):
-                prediction = self.model.predict_proba(features_array)[0]
-                confidence = float(prediction[1])  # Probability of class 1 (profitable)
+            probabilities = self._booster.inplace_predict(X)
+        finally:
+            self._booster.set_param({"nthread": 1})
+        if self._booster_margin:
+            probabilities = 1.0 / (1.0 + np.exp(-probabilities))
+        return np.asarray(probabilities).reshape(len(X), -1)[:, -1]
+
+    def _predict_confidences(self, features_array: np.ndarray) -> np.ndarray:
+        """Probability that each row's signal is profitable."""
+        n = len(features_array)
+        if self._compiled is not None:
+            # Binary objectives yield P(class 1) directly; two-class softprob puts it last
+            probabilities = self._compiled.predict(tl2cgen.DMatrix(features_array))
+            return np.asarray(probabilities).reshape(n, -1)[:, -1]
+        if self._booster is not None:
+            # Straight from the C-contiguous float32 buffer, no DMatrix
+            probabilities = self._booster.inplace_predict(features_array)
+            if self._booster_margin:
+                probabilities = 1.0 / (1.0 + np.exp(-probabilities))
+            return np.asarray(probabilities).reshape(n, -1)[:, -1]
+        if hasattr(self.model, "predict_proba"):
+            # Probability of class 1 (profitable)
+            probabilities = np.asarray(self.model.predict_proba(features_array))
+            return probabilities.reshape(n, -1)[:, 1]
+        predictions = np.asarray(self.model.predict(features_array))
+        return np.where(predictions == 1, 0.8, 0.2)
+
+    def _cache_result(self, key: bytes, expires_at: float, result: tuple[bool, float]) -> None:
+        """Remember a result, evicting the oldest entry once the cache is full."""
+        cache = self._result_cache
+        cache[key] = (expires_at, result)
+        cache.move_to_end(key)
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _prepare_booster(self) -> None:
+        """
+        Pull out the XGBoost booster and pin inference to one thread.
+
+        Batches here are a handful of rows, where thread spin-up costs more
+        than the tree traversal it parallelizes, and the CPU predictor's
+        per-thread block scratch buffers (rows x features each) would only
+        inflate memory. Use ``score_batch`` for bulk scoring.
+        """
+        self._booster = None
+        self._booster_margin = False
+        try:
+            if hasattr(self.model, "get_booster"):
+                self.model.set_params(n_jobs=1)
+                booster = self.model.get_booster()
+            elif hasattr(self.model, "inplace_predict"):
+                booster = self.model
             else:
-                # Fallback for models without probability
-                prediction = self.model.predict(features_array)[0]
-                confidence = 0.8 if prediction == 1 else 0.2
+                return
+            booster.set_param({"nthread": 1})
+            objective = _json_loads(booster.save_config())["learner"]["objective"]["name"]
+            if objective not in ("binary:logistic", "binary:logitraw", "multi:softprob"):
+                return
+            self._booster_margin = objective == "binary:logitraw"
+            self._booster = booster
+        except Exception as e:
+            logger.warning(f"Could not prepare XGBoost booster: {e}")
 
-            # Threshold for acceptance
-            # TODO: Make threshold configurable via Settings
-            is_valid = confidence > 0.6
+    def _load_compiled_predictor(self):
+        """
+        Compile the tree ensemble to a shared library and load it.
 
-            return is_valid, confidence
+        The library is written next to the model file and reused until the
+        model file is newer. Returns None (keeping the Python model path)
+        when treelite isn't installed, the model isn't XGBoost, or
+        compilation fails.
+        """
+        if not TREELITE_AVAILABLE or not hasattr(self.model, "get_booster"):
+            return None
 
+        libpath = os.path.splitext(self.model_path)[0] + ".so"
+        try:
+            if not os.path.exists(libpath) or os.path.getmtime(libpath) < os.path.getmtime(self.model_path):
+                tl_model = treelite.frontend.from_xgboost(self.model.get_booster())
+                tl2cgen.export_lib(
+                    tl_model, toolchain="gcc", libpath=libpath, params={"parallel_comp": 8}
+                )
+                logger.info(f"Compiled signal validator model to {libpath}")
+            return tl2cgen.Predictor(libpath, nthread=1)
         except Exception as e:
-            logger.error(f"Error validating signal: {e}", exc_info=True)
-            return True, 0.5  # Default to accepting if error
+            logger.warning(f"Compiled predictor unavailable, using XGBoost directly: {e}")
+            return None
+
+    # Default features list if metadata missing
+    DEFAULT_FEATURES = (
+        "current_price",
+        "sma_10_dist", "sma_20_dist", "sma_50_dist", "sma_200_dist",
+        "rsi_14", "macd", "macd_signal", "macd_hist",
+        "atr_14", "bb_width", "bb_percent_b",
+        "vwap_dist", "obv", "volume_ratio",
+        "body_size_norm", "upper_shadow_norm", "lower_shadow_norm",
+    )
 
-    def _prepare_features(self, signal: Dict, market_features: Dict) -> list:
+    # How each feature slot is filled when it isn't in market_features
+    # Kinds index the per-signal fallback values built by _signal_values
+    _ZERO, _SIDE, _ENTRY_DIST, _SL_DIST, _TP_DIST = range(5)
+    _SIGNAL_FEATURE_KINDS = {
+        "side": _SIDE,
+        "entry_dist": _ENTRY_DIST,
+        "sl_dist": _SL_DIST,
+        "tp_dist": _TP_DIST,
+    }
+
+    def _feature_plan(self) -> tuple:
         """
-        Prepare features for model input.
-        Must match the features used during training.
+        ``(slot, kind, key)`` per model input, in training order.
+
+        Built once per feature list (on load, or when ``feature_names`` is
+        replaced) so filling a row is a single pass with no name dispatch.
         """
-        # Combine signal and market features
         # Note: Order matters! Must align with training.
-        
-        # 1. Market Features (from FeatureEngineer)
         # We rely on feature_names if available, otherwise assume fixed order
-        
-        # Default features list if metadata missing
-        default_features = [
-            "current_price", 
-            "sma_10_dist", "sma_20_dist", "sma_50_dist", "sma_200_dist",
-            "rsi_14", "macd", "macd_signal", "macd_hist",
-            "atr_14", "bb_width", "bb_percent_b",
-            "vwap_dist", "obv", "volume_ratio",
-            "body_size_norm", "upper_shadow_norm", "lower_shadow_norm"
-        ]
-        
-        feature_keys = self.feature_names if self.feature_names else default_features
-        
-        # Build feature vector
-        vector = []
-        for key in feature_keys:
-            if key in market_features:
-                vector.append(market_features[key])
-            elif key == "side":
-                # Encode side: BUY=1, SELL=-1
-                side = signal.get("side", "BUY").upper()
-                vector.append(1.0 if side == "BUY" else -1.0)
-            elif key == "entry_dist":
-                # Distance from current price to entry (limit orders)
-                cp = market_features.get("current_price", 0)
-                ep = signal.get("entry_price", cp)
-                vector.append((cp - ep) / (cp + 1e-9))
-            else:
-                # Signal-specific features or fallback
-                # e.g., stop_loss_dist, take_profit_dist relative to entry
-                if key == "sl_dist":
-                    ep = signal.get("entry_price", 0)
-                    sl = signal.get("stop_loss", 0)
-                    vector.append(abs(ep - sl) / (ep + 1e-9))
-                elif key == "tp_dist":
-                    ep = signal.get("entry_price", 0)
-                    tp = signal.get("take_profit", 0)
-                    vector.append(abs(ep - tp) / (ep + 1e-9))
-                else:
-                    vector.append(0.0)
-        
-        return vector
+        feature_keys = self.feature_names if self.feature_names else self.DEFAULT_FEATURES
+        if getattr(self, "_plan_keys", None) is not feature_keys:
+            self._plan = tuple(
+                (i, self._SIGNAL_FEATURE_KINDS.get(key, self._ZERO), key)
+                for i, key in enumerate(feature_keys)
+            )
+            # Whether any slot can fall back to a signal-derived value
+            self._plan_uses_signal = any(kind != self._ZERO for _, kind, _ in self._plan)
+            self._plan_keys = feature_keys
+            # Reused input row for single-signal validation
+            self._feat_buf = np.empty((1, len(feature_keys)), dtype=np.float32)
+        return self._plan
+
+    @staticmethod
+    def _signal_fields(signal) -> tuple:
+        """(side, entry_price, stop_loss, take_profit, confidence) of a signal dict or TradingSignal."""
+        if isinstance(signal, dict):
+            return (
+                signal.get("side", "BUY"),
+                signal.get("entry_price"),
+                signal.get("stop_loss", 0),
+                signal.get("take_profit", 0),
+                signal.get("confidence", 0.5),
+            )
+        return (signal.side, signal.entry_price, signal.stop_loss, signal.take_profit, signal.confidence)
+
+    @classmethod
+    def _signal_values(cls, signal, market_features: Dict) -> tuple:
+        """Signal-derived feature values, indexed by kind (_ZERO, _SIDE, ...)."""
+        side, ep, stop_loss, take_profit, _ = cls._signal_fields(signal)
+        # Encode side: BUY=1, SELL=-1
+        side = 1.0 if side.upper() == "BUY" else -1.0
+
+        # Distance from current price to entry (limit orders)
+        cp = market_features.get("current_price", 0)
+        entry_dist = 0.0 if ep is None else (cp - ep) / (cp + 1e-9)
+
+        # Signal-specific features relative to entry
+        if ep is None:
+            ep = 0
+        inv_ep = 1.0 / (ep + 1e-9)
+        sl_dist = abs(ep - stop_loss) * inv_ep
+        tp_dist = abs(ep - take_profit) * inv_ep
+
+        return (0.0, side, entry_dist, sl_dist, tp_dist)
+
+    def _prepare_features(
+        self, signal: Dict, market_features: Dict, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Prepare features for model input.
+        Must match the features used during training.
+
+        Writes into ``out`` (e.g. a row of a preallocated batch matrix) when
+        given, otherwise into a new float32 vector.
+        """
+        plan = self._feature_plan()
+        if out is None:
+            out = np.empty(len(plan), dtype=np.float32)
+
+        # Market values win; missing ones fall back by table lookup on the slot's kind
+        fallback = (
+            self._signal_values(signal, market_features) if self._plan_uses_signal else (0.0,)
+        )
+        get = market_features.get
+        for i, kind, key in plan:
+            value = get(key)
+            out[i] = fallback[kind] if value is None else value
+
+        return out
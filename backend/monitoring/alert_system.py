@@ -1,9 +1,12 @@
 """Alert system for critical events."""
 
+import asyncio
 import smtplib
+import time
+from collections import OrderedDict, deque
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional, Tuple
 from datetime import datetime
 
 from loguru import logger
@@ -12,11 +15,60 @@ from config.settings import Settings
 
 
 class AlertSystem:
-    """Sends alerts for critical trading events."""
+    """
+    Sends alerts for critical trading events.
+
+    Emails are queued and sent by a background worker, so ``send_alert``
+    never waits on SMTP. Repeats of the same (level, message) within
+    ``DEDUP_WINDOW`` seconds are only logged, not emailed.
+
+    Email goes out over one long-lived SMTP session (TLS and login happen
+    once), kept warm with a NOOP every ``SMTP_KEEPALIVE_INTERVAL`` seconds
+    and redialed when the server drops it.
+    """
+
+    SMTP_KEEPALIVE_INTERVAL = 60.0
+    SMTP_TIMEOUT = 30.0
+    EMAIL_QUEUE_SIZE = 1024
+    DEDUP_WINDOW = 30.0
+    # Distinct recent alerts remembered for deduplication
+    DEDUP_CAPACITY = 256
+    # How long close() waits for queued emails
+    DRAIN_TIMEOUT = 10.0
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.alert_history: List[Dict] = []
+        # Most recent alerts only, so a long-running bot doesn't accumulate them forever
+        self.alert_history: Deque[Dict] = deque(maxlen=settings.alert_history_size or 10_000)
+        self._smtp: Optional[smtplib.SMTP] = None
+        # Serializes use of the shared SMTP session
+        self._smtp_lock = asyncio.Lock()
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._alert_q: asyncio.Queue = asyncio.Queue(maxsize=self.EMAIL_QUEUE_SIZE)
+        self._worker_task: Optional[asyncio.Task] = None
+        # (level, message) -> monotonic time it was last emailed, oldest first
+        self._recent_emails: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
+    async def flush(self) -> None:
+        """Wait until every queued email has been handled."""
+        await self._alert_q.join()
+
+    async def close(self) -> None:
+        """Send queued emails, then stop the workers and close the SMTP session."""
+        if self._worker_task is not None:
+            try:
+                await asyncio.wait_for(self.flush(), self.DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {self._alert_q.qsize()} unsent email alerts")
+            self._worker_task.cancel()
+            await asyncio.gather(self._worker_task, return_exceptions=True)
+            self._worker_task = None
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            await asyncio.gather(self._keepalive_task, return_exceptions=True)
+            self._keepalive_task = None
+        async with self._smtp_lock:
+            await asyncio.to_thread(self._close_smtp)
 
     async def send_alert(
         self, level: str, message: str, data: Dict = None
@@ -48,10 +100,43 @@ class AlertSystem:
 
         # Send email if enabled and level is WARNING or CRITICAL
         if self.settings.alert_email_enabled and level in ["WARNING", "CRITICAL"]:
+            self._queue_email(level, message, data)
+
+    def _queue_email(self, level: str, message: str, data: Optional[Dict]) -> None:
+        """Hand an email to the worker, unless it repeats a recent one."""
+        key = (level, message)
+        now = time.monotonic()
+        last_sent = self._recent_emails.get(key)
+        if last_sent is not None and now - last_sent < self.DEDUP_WINDOW:
+            return
+        self._recent_emails[key] = now
+        self._recent_emails.move_to_end(key)
+        if len(self._recent_emails) > self.DEDUP_CAPACITY:
+            self._recent_emails.popitem(last=False)
+
+        if self._alert_q.full():
+            if level != "CRITICAL":
+                logger.warning(f"Email alert queue full, dropping {level} alert")
+                return
+            # Make room for the critical alert at the expense of the oldest queued one
+            self._alert_q.get_nowait()
+            self._alert_q.task_done()
+            logger.warning("Email alert queue full, dropped oldest alert")
+        self._alert_q.put_nowait((level, message, data))
+
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._email_worker())
+
+    async def _email_worker(self) -> None:
+        """Send queued emails one at a time."""
+        while True:
+            level, message, data = await self._alert_q.get()
             try:
                 await self._send_email(level, message, data)
             except Exception as e:
                 logger.error(f"Failed to send email alert: {e}", exc_info=True)
+            finally:
+                self._alert_q.task_done()
 
     async def alert_daily_loss_limit(self, daily_pnl: float, limit: float) -> None:
         """Alert when approaching daily loss limit."""
@@ -112,14 +197,68 @@ Time: {datetime.now().isoformat()}
             
             msg.attach(MIMEText(body, "plain"))
             
-            with smtplib.SMTP(self.settings.alert_email_smtp_host, self.settings.alert_email_smtp_port) as server:
-                server.starttls()
-                server.login(self.settings.alert_email_username, self.settings.alert_email_password)
-                server.send_message(msg)
-            
+            async with self._smtp_lock:
+                await asyncio.to_thread(self._send_message_sync, msg)
+            if self._keepalive_task is None or self._keepalive_task.done():
+                self._keepalive_task = asyncio.create_task(self._smtp_keepalive())
+
             logger.info(f"Email alert sent to {self.settings.alert_email_to}")
             
         except Exception as e:
             logger.error(f"Error sending email: {e}", exc_info=True)
             raise
 
+    def _ensure_smtp(self) -> smtplib.SMTP:
+        """Return the SMTP session, dialing and logging in if there is none."""
+        if self._smtp is None:
+            server = smtplib.SMTP(
+                self.settings.alert_email_smtp_host,
+                self.settings.alert_email_smtp_port,
+                timeout=self.SMTP_TIMEOUT,
+            )
+            try:
+                server.starttls()
+                server.login(self.settings.alert_email_username, self.settings.alert_email_password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+
+    def _close_smtp(self) -> None:
+        """Drop the SMTP session, politely if the server is still there."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            self._smtp.close()
+        self._smtp = None
+
+    def _send_message_sync(self, msg: MIMEMultipart) -> None:
+        """Send over the shared session (blocking; run in a worker thread)."""
+        try:
+            self._ensure_smtp().send_message(msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # The idle session went stale; redial once
+            self._close_smtp()
+            self._ensure_smtp().send_message(msg)
+        except Exception:
+            self._close_smtp()
+            raise
+
+    def _noop_sync(self) -> None:
+        """Keep the session alive, dropping it if the server no longer answers."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.noop()
+        except Exception:
+            self._close_smtp()
+
+    async def _smtp_keepalive(self) -> None:
+        """Ping the SMTP server periodically so sends don't pay for a new handshake."""
+        while True:
+            await asyncio.sleep(self.SMTP_KEEPALIVE_INTERVAL)
+            async with self._smtp_lock:
+                await asyncio.to_thread(self._noop_sync)
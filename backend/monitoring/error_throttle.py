@@ -0,0 +1,53 @@
+"""Rate-limited error logging for long-running loops."""
+
+import time
+from typing import Callable, Optional, Tuple
+
+from loguru import logger
+
+
+class ErrorThrottle:
+    """
+    Logs a loop's errors with a traceback only when the error changes.
+
+    The first occurrence of an error (keyed by type and message prefix) is
+    logged with its traceback. Repeats are counted and summarized without a
+    traceback every ``every`` occurrences or ``interval`` seconds, so an API
+    outage can't flood the log with identical stack traces.
+    """
+
+    def __init__(
+        self,
+        every: int = 100,
+        interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.every = every
+        self.interval = interval
+        self._clock = clock
+        self._last_key: Optional[Tuple[str, str]] = None
+        self._count = 0
+        self._last_logged = 0.0
+
+    def error(self, message: str, exc: BaseException) -> None:
+        """Log ``message`` for ``exc``, throttling repeats of the same error."""
+        key = (type(exc).__name__, str(exc)[:80])
+        now = self._clock()
+        if key != self._last_key:
+            self._last_key = key
+            self._count = 1
+            self._last_logged = now
+            # The message goes in as an argument: callers embed exception text,
+            # which may contain braces loguru would otherwise try to format
+            logger.opt(exception=exc).error("{}", message)
+            return
+
+        self._count += 1
+        if self._count % self.every == 0 or now - self._last_logged >= self.interval:
+            self._last_logged = now
+            logger.error("{} (repeated {} times)", message, self._count)
+
+    def reset(self) -> None:
+        """Forget the last error, e.g. after the loop recovers."""
+        self._last_key = None
+        self._count = 0
@@ -1,20 +1,49 @@
 """Performance tracking and metrics calculation."""
 
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import Dict, List
 
+import numpy as np
 from loguru import logger
 
 from config.settings import Settings
 
 
 class PerformanceTracker:
-    """Tracks trading performance metrics."""
+    """
+    Tracks trading performance metrics.
+
+    Per-trade P&L and timestamps are kept as NumPy columns so the metric
+    reductions are vectorized; ``trades`` keeps the full records for
+    journal export.
+    """
+
+    INITIAL_CAPACITY = 1024
+    # Trade window whose aggregates are maintained incrementally (the metrics' default)
+    ROLLING_WINDOW = 30
 
     def __init__(self, settings: Settings):
         self.settings = settings
         self.trades: List[Dict] = []
         self.daily_stats: Dict[str, Dict] = {}
+        self._pnl = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        # Trade close times, epoch nanoseconds
+        self._ts = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._n = 0
+
+        # Running aggregates over the last ROLLING_WINDOW trades
+        self._win_count = 0
+        self._pos_sum = 0.0
+        self._neg_sum = 0.0
+
+        # Today's totals; the day ends at a monotonic deadline so reads skip the date math
+        self._today_pnl = 0.0
+        self._today_n = 0
+        self._day_ends_at = 0.0
+        # Today's ISO date and its daily_stats entry, refreshed on rollover
+        self._today_str = ""
+        self._today_stats: Dict = {}
 
     async def update(self) -> None:
         """Update performance metrics."""
@@ -33,6 +62,7 @@ class PerformanceTracker:
         strategy_name: str,
     ) -> None:
         """Record a completed trade."""
+        now = datetime.now()
         trade = {
             "trade_id": trade_id,
             "symbol": symbol,
@@ -42,22 +72,23 @@ class PerformanceTracker:
             "quantity": quantity,
             "pnl": pnl,
             "strategy_name": strategy_name,
-            "timestamp": datetime.now(),
+            "timestamp": now,
         }
 
         self.trades.append(trade)
 
+        if self._n == self._pnl.shape[0]:
+            # Double the columns' capacity
+            self._pnl = np.resize(self._pnl, 2 * self._n)
+            self._ts = np.resize(self._ts, 2 * self._n)
+        self._pnl[self._n] = pnl
+        self._ts[self._n] = int(now.timestamp() * 1e9)
+        self._n += 1
+        self._roll_window(pnl)
+        self._roll_today(now, pnl)
+
         # Update daily stats
-        today = datetime.now().date().isoformat()
-        if today not in self.daily_stats:
-            self.daily_stats[today] = {
-                "trades": 0,
-                "wins": 0,
-                "losses": 0,
-                "total_pnl": 0.0,
-            }
-
-        stats = self.daily_stats[today]
+        stats = self._today_stats
         stats["trades"] += 1
         stats["total_pnl"] += pnl
 
@@ -66,38 +97,75 @@ class PerformanceTracker:
         else:
             stats["losses"] += 1
 
+    def _roll_window(self, pnl: float) -> None:
+        """Add the newest trade to the rolling aggregates, evicting the oldest."""
+        if self._n > self.ROLLING_WINDOW:
+            old = self._pnl[self._n - self.ROLLING_WINDOW - 1]
+            if old > 0:
+                self._win_count -= 1
+                self._pos_sum -= old
+            elif old < 0:
+                self._neg_sum -= old
+        if pnl > 0:
+            self._win_count += 1
+            self._pos_sum += pnl
+        elif pnl < 0:
+            self._neg_sum += pnl
+        if self._n % self.ROLLING_WINDOW == 0:
+            # Re-sum once per lap so add/evict rounding residue can't accumulate
+            window = self._pnl[self._n - self.ROLLING_WINDOW : self._n]
+            self._pos_sum = float(window[window > 0].sum())
+            self._neg_sum = float(window[window < 0].sum())
+
+    def _roll_today(self, now: datetime, pnl: float) -> None:
+        """Add a trade to today's totals, starting a new day if needed."""
+        mono = time.monotonic()
+        if mono >= self._day_ends_at:
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._day_ends_at = mono + (midnight - now).total_seconds()
+            self._today_pnl = 0.0
+            self._today_n = 0
+            self._today_str = now.date().isoformat()
+            self._today_stats = self.daily_stats.setdefault(
+                self._today_str,
+                {"trades": 0, "wins": 0, "losses": 0, "total_pnl": 0.0},
+            )
+        self._today_pnl += pnl
+        self._today_n += 1
+
+    def _recent_pnl(self, period_days: int) -> np.ndarray:
+        """P&L of the last ``period_days`` trades (a view, oldest first)."""
+        return self._pnl[max(0, self._n - period_days) : self._n]
+
     def get_win_rate(self, period_days: int = 30) -> float:
         """Calculate win rate over a period."""
-        if not self.trades:
+        if period_days == self.ROLLING_WINDOW:
+            window = min(self._n, self.ROLLING_WINDOW)
+            return self._win_count / window if window else 0.0
+        recent = self._recent_pnl(period_days)
+        if recent.size == 0:
             return 0.0
-
-        recent_trades = self.trades[-period_days:] if len(self.trades) > period_days else self.trades
-        wins = sum(1 for t in recent_trades if t["pnl"] > 0)
-        total = len(recent_trades)
-
-        return wins / total if total > 0 else 0.0
+        return np.count_nonzero(recent > 0) / recent.size
 
     def get_profit_factor(self, period_days: int = 30) -> float:
         """Calculate profit factor over a period."""
-        if not self.trades:
-            return 0.0
-
-        recent_trades = self.trades[-period_days:] if len(self.trades) > period_days else self.trades
-
-        gross_profit = sum(t["pnl"] for t in recent_trades if t["pnl"] > 0)
-        gross_loss = abs(sum(t["pnl"] for t in recent_trades if t["pnl"] < 0))
+        if period_days == self.ROLLING_WINDOW:
+            # Evicting the last loss can leave ~1e-17 of residue, not an exact 0
+            gross_loss = -self._neg_sum
+            return self._pos_sum / gross_loss if gross_loss > 1e-9 else 0.0
+        recent = self._recent_pnl(period_days)
+        gross_profit = recent[recent > 0].sum()
+        gross_loss = -recent[recent < 0].sum()
 
-        return gross_profit / gross_loss if gross_loss > 0 else 0.0
+        return float(gross_profit / gross_loss) if gross_loss > 0 else 0.0
 
     def get_daily_pnl(self) -> float:
         """Get today's P&L."""
-        today = datetime.now().date().isoformat()
-        return self.daily_stats.get(today, {}).get("total_pnl", 0.0)
+        return self._today_pnl if time.monotonic() < self._day_ends_at else 0.0
 
     def get_trades_today(self) -> int:
         """Get number of trades today."""
-        today = datetime.now().date().isoformat()
-        return self.daily_stats.get(today, {}).get("trades", 0)
+        return self._today_n if time.monotonic() < self._day_ends_at else 0
 
     def get_metrics(self) -> Dict:
         """Get all performance metrics."""
@@ -106,6 +174,6 @@ class PerformanceTracker:
             "profit_factor": self.get_profit_factor(),
             "daily_pnl": self.get_daily_pnl(),
             "trades_today": self.get_trades_today(),
-            "total_trades": len(self.trades),
+            "total_trades": self._n,
         }
 
@@ -1,11 +1,13 @@
 """Trade journal for logging all trades to database."""
 
+import asyncio
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
-from sqlalchemy import Column, Float, Integer, String, DateTime, create_engine
+from sqlalchemy import Column, Float, Index, Integer, String, DateTime, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
 from loguru import logger
 
@@ -18,6 +20,7 @@ class TradeRecord(Base):
     """Database model for trade records."""
 
     __tablename__ = "trades"
+    __table_args__ = (Index("ix_trades_entry_time_symbol", "entry_time", "symbol"),)
 
     id = Column(Integer, primary_key=True)
     trade_id = Column(String, unique=True, index=True)
@@ -33,95 +36,164 @@ class TradeRecord(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+# Trade fields copied from log_trade payloads into rows
+TRADE_FIELDS = (
+    "trade_id", "symbol", "side", "entry_price", "exit_price", "quantity",
+    "pnl", "strategy_name", "entry_time", "exit_time",
+)
+
+
 class TradeJournal:
-    """Manages trade journaling to database."""
+    """
+    Manages trade journaling to database.
+
+    Logged trades are buffered and written by a background flusher in a
+    single multi-row insert every ``FLUSH_INTERVAL`` seconds, or as soon as
+    ``FLUSH_SIZE`` trades are waiting. The flusher starts with the first
+    logged trade even if the database is down, and retries the connection
+    every ``INIT_RETRY_INTERVAL`` seconds until it comes up.
+    """
+
+    FLUSH_INTERVAL = 0.5
+    FLUSH_SIZE = 128
+    INIT_RETRY_INTERVAL = 5.0
+    # Trades held while the database is unreachable; the oldest are dropped beyond this
+    MAX_BUFFERED = 10_000
 
     def __init__(self, settings: Settings):
         self.settings = settings
         self.engine = None
         self.Session = None
         self._initialized = False
+        self._buf: List[Dict] = []
+        self._buf_lock = asyncio.Lock()
+        self._flush_wakeup = asyncio.Event()
+        self._flusher_task: Optional[asyncio.Task] = None
+        # time.monotonic() before which the flusher won't retry initialize()
+        self._next_init_at = 0.0
 
     async def initialize(self) -> None:
         """Initialize database connection."""
         try:
-            # Remove asyncpg from URL for SQLAlchemy
-            db_url = self.settings.database_url.replace("+asyncpg", "")
-            self.engine = create_engine(db_url)
-            self.Session = sessionmaker(bind=self.engine)
+            self.engine = create_async_engine(
+                self.settings.database_url, pool_size=5, max_overflow=10
+            )
+            self.Session = async_sessionmaker(self.engine, expire_on_commit=False)
 
             # Create tables
-            Base.metadata.create_all(self.engine)
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                # create_all skips existing tables, so add indexes introduced since separately
+                for index in TradeRecord.__table__.indexes:
+                    await conn.run_sync(index.create, checkfirst=True)
 
             self._initialized = True
             logger.info("Trade journal initialized")
 
         except Exception as e:
             logger.error(f"Error initializing trade journal: {e}", exc_info=True)
+            self._next_init_at = time.monotonic() + self.INIT_RETRY_INTERVAL
+
+        # Started either way: it retries a failed connect and holds trades meanwhile
+        if self._flusher_task is None:
+            self._flusher_task = asyncio.create_task(self._flusher())
+
+    async def close(self) -> None:
+        """Stop the flusher and write any buffered trades."""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            await asyncio.gather(self._flusher_task, return_exceptions=True)
+            self._flusher_task = None
+        if self._initialized:
+            await self.flush()
+            await self.engine.dispose()
+        elif self._buf:
+            logger.warning(f"Trade journal closed without a database, {len(self._buf)} trades not written")
 
     async def log_trade(self, trade_data: Dict) -> None:
-        """Log a trade to the database."""
-        if not self._initialized:
+        """Queue a trade for the next batch insert."""
+        if self._flusher_task is None:
+            # First trade: connect (or start the flusher that retries the connect)
             await self.initialize()
 
-        try:
-            session = self.Session()
-
-            trade = TradeRecord(
-                trade_id=trade_data.get("trade_id"),
-                symbol=trade_data.get("symbol"),
-                side=trade_data.get("side"),
-                entry_price=trade_data.get("entry_price"),
-                exit_price=trade_data.get("exit_price"),
-                quantity=trade_data.get("quantity"),
-                pnl=trade_data.get("pnl"),
-                strategy_name=trade_data.get("strategy_name"),
-                entry_time=trade_data.get("entry_time"),
-                exit_time=trade_data.get("exit_time"),
-            )
-
-            session.add(trade)
-            session.commit()
-            session.close()
-
-        except Exception as e:
-            logger.error(f"Error logging trade: {e}", exc_info=True)
+        self._buf.append({field: trade_data.get(field) for field in TRADE_FIELDS})
+        self._cap_buffer()
+        if len(self._buf) >= self.FLUSH_SIZE:
+            self._flush_wakeup.set()
+
+    def _cap_buffer(self) -> None:
+        """Drop the oldest buffered trades beyond ``MAX_BUFFERED``."""
+        if len(self._buf) > self.MAX_BUFFERED:
+            dropped = len(self._buf) - self.MAX_BUFFERED
+            del self._buf[:dropped]
+            logger.warning(f"Trade journal buffer full, dropped {dropped} oldest trades")
+
+    async def _flusher(self) -> None:
+        """Flush the buffer on a timer, or early when it fills up."""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_wakeup.wait(), self.FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            if not self._initialized:
+                if time.monotonic() < self._next_init_at:
+                    continue
+                await self.initialize()
+                if not self._initialized:
+                    continue
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Insert all buffered trades in one statement."""
+        if not self._initialized:
+            # Nothing to write to yet; the flusher retries the connection
+            return
+        async with self._buf_lock:
+            rows, self._buf = self._buf, []
+            if not rows:
+                return
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(TradeRecord.__table__.insert(), rows)
+            except Exception as e:
+                logger.error(f"Error logging {len(rows)} trades: {e}", exc_info=True)
+                # Keep them for the next attempt
+                self._buf[:0] = rows
+                self._cap_buffer()
+
+    # Rows fetched per round trip when streaming trades
+    STREAM_BATCH = 500
+
+    async def iter_trades(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> AsyncIterator[Dict]:
+        """Stream trades in entry-time order, ``STREAM_BATCH`` rows at a time."""
+        if not self._initialized:
+            await self.initialize()
+        # Make buffered trades visible to the query
+        await self.flush()
+
+        query = select(TradeRecord)
+        if start_date:
+            query = query.where(TradeRecord.entry_time >= start_date)
+        if end_date:
+            query = query.where(TradeRecord.entry_time <= end_date)
+        query = query.order_by(TradeRecord.entry_time).execution_options(
+            yield_per=self.STREAM_BATCH
+        )
+
+        async with self.Session() as session:
+            result = await session.stream(query)
+            async for t in result.scalars():
+                yield {field: getattr(t, field) for field in TRADE_FIELDS}
 
     async def get_trades(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
     ) -> List[Dict]:
         """Get trades from database."""
-        if not self._initialized:
-            await self.initialize()
-
         try:
-            session = self.Session()
-            query = session.query(TradeRecord)
-
-            if start_date:
-                query = query.filter(TradeRecord.entry_time >= start_date)
-            if end_date:
-                query = query.filter(TradeRecord.entry_time <= end_date)
-
-            trades = query.all()
-
-            return [
-                {
-                    "trade_id": t.trade_id,
-                    "symbol": t.symbol,
-                    "side": t.side,
-                    "entry_price": t.entry_price,
-                    "exit_price": t.exit_price,
-                    "quantity": t.quantity,
-                    "pnl": t.pnl,
-                    "strategy_name": t.strategy_name,
-                    "entry_time": t.entry_time,
-                    "exit_time": t.exit_time,
-                }
-                for t in trades
-            ]
-
+            return [trade async for trade in self.iter_trades(start_date, end_date)]
         except Exception as e:
             logger.error(f"Error getting trades: {e}", exc_info=True)
             return []
-
@@ -0,0 +1,42 @@
+"""CT trading-session clock shared by the risk checks, evaluated once per minute."""
+
+import time as _time
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class TradingClock(NamedTuple):
+    """Session flags for one wall-clock minute in the exchange timezone."""
+
+    # 5:00 PM CT (previous day) to 3:10 PM CT (current day)
+    is_trading_hours: bool
+    # No new trades from 2:45 PM CT, or at/after the hard close
+    is_near_close: bool
+    # At or after the 3:05 PM CT hard close
+    is_hard_close: bool
+    hour: int
+    minute: int
+
+
+@lru_cache(maxsize=8)
+def _now_bucket(minute_epoch: int, tz: tzinfo) -> TradingClock:
+    """Session flags for the minute starting at ``minute_epoch * 60`` (epoch seconds)."""
+    now = datetime.fromtimestamp(minute_epoch * 60, tz)
+    hour = now.hour
+    minute = now.minute
+
+    is_trading_hours = hour >= 17 or hour < 15 or (hour == 15 and minute <= 10)
+    is_hard_close = (hour, minute) >= (15, 5)
+    is_near_close = is_hard_close or (hour == 14 and minute >= 45)
+    return TradingClock(is_trading_hours, is_near_close, is_hard_close, hour, minute)
+
+
+def trading_clock(tz: tzinfo) -> TradingClock:
+    """
+    Session flags for the current minute in ``tz``.
+
+    The flags only change on minute boundaries, so the timezone conversion
+    runs once per minute and every other call is a cache hit.
+    """
+    return _now_bucket(int(_time.time() // 60), tz)
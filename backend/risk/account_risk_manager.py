@@ -1,15 +1,22 @@
-"""Per-account risk manager (non-singleton)."""
+"""
+Per-account risk manager (non-singleton).
+
+As with ``RiskManager``, ``update_pnl`` and ``reset_daily_tracking`` are
+synchronous.
+"""
 
 import asyncio
-from datetime import datetime, time
+from datetime import datetime
 from typing import Dict, Optional
+from zoneinfo import ZoneInfo
 
-import pytz
 from loguru import logger
 
 from accounts.models import AccountProfile
 from config.settings import Settings
 from core.position_tracker import PositionTracker
+from risk._clock import trading_clock
+from risk.risk_manager import DEFAULT_SYMBOL_ID, SYMBOL_IDS, TICK_BY_ID
 
 
 class AccountRiskManager:
@@ -30,7 +37,7 @@ class AccountRiskManager:
         self.settings = settings
         self.profile = profile
         self.position_tracker = position_tracker
-        self.ct_tz = pytz.timezone(settings.timezone)
+        self.ct_tz = ZoneInfo(settings.timezone)
 
         # Risk tracking
         self.high_water_mark: float = profile.account_size
@@ -59,7 +66,7 @@ class AccountRiskManager:
 
         # Check daily loss limit (95% threshold)
         if abs(self.daily_pnl) >= self.profile.daily_loss_limit * 0.95:
-            await self._halt_trading("Approaching daily loss limit")
+            self._halt_trading("Approaching daily loss limit")
             return False
 
         # Check trailing max drawdown (95% threshold)
@@ -67,12 +74,12 @@ class AccountRiskManager:
         max_allowed_loss = self.high_water_mark - self.profile.max_drawdown_limit
 
         if current_balance <= max_allowed_loss * 1.05:  # 5% buffer
-            await self._halt_trading("Approaching trailing max drawdown")
+            self._halt_trading("Approaching trailing max drawdown")
             return False
 
         # Check consecutive losses
         if self.consecutive_losses >= 3:
-            await self._halt_trading("3 consecutive losses - circuit breaker")
+            self._halt_trading("3 consecutive losses - circuit breaker")
             return False
 
         return True
@@ -146,20 +153,13 @@ class AccountRiskManager:
             return contracts
 
         except Exception as e:
-            logger.error(
-                f"Error calculating position size for {self.account_id}: {e}",
-                exc_info=True,
-            )
+            logger.error("Error calculating position size for {}: {}", self.account_id, e)
+            logger.opt(exception=True).debug("Position sizing traceback")
             return 0
 
     def _get_tick_value(self, symbol: str) -> float:
         """Get tick value for a symbol."""
-        tick_values = {
-            "MES": 5.0,  # $5 per tick
-            "MNQ": 2.0,  # $2 per tick
-            "MGC": 1.0,  # $1 per tick
-        }
-        return tick_values.get(symbol, 1.0)
+        return TICK_BY_ID[SYMBOL_IDS.get(symbol, DEFAULT_SYMBOL_ID)]
 
     def _get_max_contracts_for_balance(self, balance: float) -> int:
         """Get max contracts based on scaling plan."""
@@ -185,32 +185,13 @@ class AccountRiskManager:
 
     def _is_trading_hours(self) -> bool:
         """Check if current time is within trading hours."""
-        now = datetime.now(self.ct_tz)
-        hour = now.hour
-        minute = now.minute
-
-        # Trading hours: 5:00 PM CT (previous day) to 3:10 PM CT (current day)
-        if hour >= 17 or hour < 15:
-            return True
-        if hour == 15 and minute <= 10:
-            return True
-        return False
+        return trading_clock(self.ct_tz).is_trading_hours
 
     def _is_near_market_close(self) -> bool:
         """Check if we're too close to market close (3:05 PM CT)."""
-        now = datetime.now(self.ct_tz)
-        close_time = time(15, 5)  # 3:05 PM CT
-
-        if now.time() >= close_time:
-            return True
-
-        # Don't allow new trades after 2:45 PM CT
-        if now.hour == 14 and now.minute >= 45:
-            return True
-
-        return False
+        return trading_clock(self.ct_tz).is_near_close
 
-    async def update_pnl(self, realized_pnl: float) -> None:
+    def update_pnl(self, realized_pnl: float) -> None:
         """Update P&L tracking."""
         self.total_pnl += realized_pnl
         self.daily_pnl += realized_pnl
@@ -238,7 +219,7 @@ class AccountRiskManager:
                     f"[{self.account_id}] Consistency rule approaching: {consistency_ratio:.2%}"
                 )
 
-    async def reset_daily_tracking(self) -> None:
+    def reset_daily_tracking(self) -> None:
         """Reset daily tracking at start of new trading day."""
         today = datetime.now(self.ct_tz).date()
 
@@ -253,7 +234,7 @@ class AccountRiskManager:
             self.trading_halted_reason = ""
             logger.info(f"[{self.account_id}] Daily tracking reset")
 
-    async def _halt_trading(self, reason: str) -> None:
+    def _halt_trading(self, reason: str) -> None:
         """Halt trading with a reason."""
         if not self.trading_halted:
             self.trading_halted = True
@@ -263,5 +244,5 @@ class AccountRiskManager:
     async def liquidate_all_positions(self) -> None:
         """Force liquidate all positions (emergency)."""
         logger.critical(f"[{self.account_id}] EMERGENCY: Liquidating all positions")
-        await self._halt_trading("Emergency liquidation")
+        self._halt_trading("Emergency liquidation")
 
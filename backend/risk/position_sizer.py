@@ -1,13 +1,73 @@
 """Position sizing algorithms (Kelly Criterion, Fixed Fractional)."""
 
-from typing import Dict
+from typing import Dict, Sequence
 
+import numpy as np
 from loguru import logger
 
+from ml._njit import njit
+
+# Tick values by symbol id; the last slot is the default for unknown symbols
+_TICK_IDX: Dict[str, int] = {"MES": 0, "MNQ": 1, "MGC": 2}
+_TICK_ARR = np.array([5.0, 2.0, 1.0, 1.0])
+_DEFAULT_TICK_ID = len(_TICK_IDX)
+
+
+@njit(cache=True, fastmath=True)
+def _kelly_nb(win_rate, avg_win, avg_loss):
+    """Quarter-capped Kelly fraction (see PositionSizer.kelly_criterion)."""
+    if avg_loss == 0.0 or avg_win == 0.0:
+        return 0.0
+    win_loss_ratio = avg_win / avg_loss
+    kelly = (win_rate * (win_loss_ratio + 1.0) - 1.0) / win_loss_ratio
+    return min(max(kelly, 0.0), 0.25)
+
+
+@njit(cache=True)
+def _contracts_for_risk_nb(risk_dollars, risk_per_contract):
+    """Contracts risking at most ``risk_dollars``, at least 1 (0 if nothing is at risk)."""
+    if risk_per_contract <= 0.0:
+        return 0
+    return max(int(risk_dollars / risk_per_contract), 1)
+
+
+@njit(cache=True)
+def _contracts_nb(account_balance, risk_percent, risk_per_contract):
+    """Fixed-fractional contract count (see PositionSizer.fixed_fractional)."""
+    return _contracts_for_risk_nb(account_balance * risk_percent, risk_per_contract)
+
+
+@njit(cache=True)
+def _calc_from_signal_vec(entry, stop, tick_value, account_balance, risk_percent):
+    """
+    Contracts for many signals at once.
+
+    ``entry``, ``stop`` and ``tick_value`` are aligned 1D arrays; signals
+    missing an entry or stop price (0) size to 0.
+    """
+    n = entry.shape[0]
+    out = np.zeros(n, dtype=np.int64)
+    risk_dollars = account_balance * risk_percent
+    for i in range(n):
+        if entry[i] == 0.0 or stop[i] == 0.0:
+            continue
+        out[i] = _contracts_for_risk_nb(risk_dollars, abs(entry[i] - stop[i]) * tick_value[i])
+    return out
+
 
 class PositionSizer:
     """Calculates optimal position sizes using various methods."""
 
+    @staticmethod
+    def tick_values_for(symbols: Sequence[str]) -> np.ndarray:
+        """Tick value per symbol (1.0 for unknown symbols), for calculate_from_signals."""
+        ids = np.fromiter(
+            (_TICK_IDX.get(symbol, _DEFAULT_TICK_ID) for symbol in symbols),
+            dtype=np.intp,
+            count=len(symbols),
+        )
+        return _TICK_ARR[ids]
+
     @staticmethod
     def kelly_criterion(
         win_rate: float, avg_win: float, avg_loss: float
@@ -23,14 +83,7 @@ class PositionSizer:
         Returns:
             Kelly percentage (0.0 to 1.0)
         """
-        if avg_loss == 0:
-            return 0.0
-
-        win_loss_ratio = avg_win / avg_loss
-        kelly = (win_rate * (win_loss_ratio + 1) - 1) / win_loss_ratio
-
-        # Cap at 25% for safety (quarter Kelly)
-        return min(max(kelly, 0.0), 0.25)
+        return float(_kelly_nb(win_rate, avg_win, avg_loss))
 
     @staticmethod
     def fixed_fractional(
@@ -47,13 +100,7 @@ class PositionSizer:
         Returns:
             Number of contracts
         """
-        if risk_amount <= 0:
-            return 0
-
-        risk_dollars = account_balance * risk_percent
-        contracts = int(risk_dollars / risk_amount)
-
-        return max(contracts, 1)  # Minimum 1 contract
+        return int(_contracts_nb(account_balance, risk_percent, risk_amount))
 
     @staticmethod
     def calculate_from_signal(
@@ -78,12 +125,7 @@ class PositionSizer:
             return 0
 
         # Get tick value
-        tick_values = {
-            "MES": 5.0,
-            "MNQ": 2.0,
-            "MGC": 1.0,
-        }
-        tick_value = tick_values.get(symbol, 1.0)
+        tick_value = _TICK_ARR[_TICK_IDX.get(symbol, _DEFAULT_TICK_ID)]
 
         # Calculate stop distance in ticks
         stop_distance = abs(entry_price - stop_loss)
@@ -97,3 +139,31 @@ class PositionSizer:
             account_balance, risk_percent, risk_per_contract
         )
 
+    @staticmethod
+    def calculate_from_signals(
+        entry_prices: np.ndarray,
+        stop_losses: np.ndarray,
+        tick_values: np.ndarray,
+        account_balance: float,
+        risk_percent: float = 0.015,
+    ) -> np.ndarray:
+        """
+        Vectorized ``calculate_from_signal`` for a sweep over candidate signals.
+
+        Args:
+            entry_prices: Entry price per signal (0 if unknown)
+            stop_losses: Stop loss per signal (0 if unknown)
+            tick_values: Tick value of each signal's symbol
+            account_balance: Current account balance
+            risk_percent: Risk percentage per trade (default 1.5%)
+
+        Returns:
+            Number of contracts per signal (int64 array)
+        """
+        return _calc_from_signal_vec(
+            np.asarray(entry_prices, dtype=np.float64),
+            np.asarray(stop_losses, dtype=np.float64),
+            np.asarray(tick_values, dtype=np.float64),
+            float(account_balance),
+            float(risk_percent),
+        )
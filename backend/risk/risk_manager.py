@@ -1,20 +1,49 @@
-"""Central risk manager (Singleton) for enforcing Topstep rules."""
+"""
+Central risk manager (Singleton) for enforcing Topstep rules.
 
-import asyncio
-from datetime import datetime, time
-from typing import Dict, Optional
+``update_pnl`` and ``reset_daily_tracking`` only touch in-memory state and
+are plain methods: call ``rm.update_pnl(x)``, not ``await rm.update_pnl(x)``.
+"""
+
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
 
-import pytz
 from loguru import logger
 
 from config.settings import Settings
 from core.position_tracker import PositionTracker
+from risk._clock import TradingClock, trading_clock
+
+# Symbols interned to small ints; TICK_BY_ID[-1] is the default for unknown symbols
+SYMBOL_IDS: Mapping[str, int] = MappingProxyType({"MES": 0, "MNQ": 1, "MGC": 2})
+# Dollar value per tick, indexed by symbol id
+TICK_BY_ID: Tuple[float, ...] = (5.0, 2.0, 1.0, 1.0)
+DEFAULT_SYMBOL_ID = len(TICK_BY_ID) - 1
+
+
+def symbol_id(symbol: Optional[str]) -> int:
+    """Small-int code for ``symbol`` (``DEFAULT_SYMBOL_ID`` if unknown)."""
+    return SYMBOL_IDS.get(symbol, DEFAULT_SYMBOL_ID)
+
+
+def _signal_field(signal: Union[Dict, Any], name: str) -> Any:
+    """``name`` from a signal dict or a signal object (OrderSignal, TradingSignal); None if unset."""
+    if isinstance(signal, dict):
+        return signal.get(name)
+    return getattr(signal, name, None)
 
 
 class RiskManager:
     """
     Central Risk Manager (Singleton).
 
+    The instance is process-global: the first ``RiskManager(settings,
+    tracker)`` call creates and configures it, later calls return it
+    unchanged. Construct it during startup, before any coroutine uses it.
+
     Enforces:
     - Daily Loss Limit (DLL)
     - Trailing Max Drawdown (MLL)
@@ -24,11 +53,18 @@ class RiskManager:
     """
 
     _instance: Optional["RiskManager"] = None
-    _lock = asyncio.Lock()
+    # Only guards instance creation, which never awaits
+    _init_lock = threading.Lock()
+
+    # Dollar value per tick
+    TICK_VALUES: Mapping[str, float] = MappingProxyType(
+        {symbol: TICK_BY_ID[i] for symbol, i in SYMBOL_IDS.items()}
+    )
 
     def __new__(cls, settings: Settings, position_tracker: PositionTracker):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+        with cls._init_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self, settings: Settings, position_tracker: PositionTracker):
@@ -37,7 +73,11 @@ class RiskManager:
 
         self.settings = settings
         self.position_tracker = position_tracker
-        self.ct_tz = pytz.timezone(settings.timezone)
+        self.ct_tz = ZoneInfo(settings.timezone)
+        self._risk_pct = settings.risk_per_trade_percent / 100
+        # account_size + total_pnl + unrealized P&L; None until next read
+        self._balance_cache: Optional[float] = None
+        position_tracker.add_change_listener(self.invalidate_balance)
 
         # Risk tracking
         self.high_water_mark: float = settings.account_size
@@ -52,119 +92,143 @@ class RiskManager:
         self.current_date: Optional[datetime] = None
         self.daily_start_balance: float = settings.account_size
 
+        # Scaled risk thresholds, refreshed whenever P&L or the high water mark moves
+        self._dll_halt: float = settings.daily_loss_limit * 0.95
+        self._drawdown_halt_balance: float = 0.0
+        self._remaining_daily_risk: float = 0.0
+        self._refresh_thresholds()
+
         self._initialized = True
         logger.info("Risk Manager initialized")
 
     async def can_trade(self) -> bool:
         """Check if trading is allowed."""
+        allowed, halt_reason = self._evaluate_trading_state()
+        if halt_reason is not None:
+            self._halt_trading(halt_reason)
+        return allowed
+
+    def _evaluate_trading_state(self) -> Tuple[bool, Optional[str]]:
+        """
+        (allowed, halt_reason) from local state only, without side effects.
+
+        ``halt_reason`` is set when a threshold was breached and trading
+        should be halted; ``can_trade`` applies it.
+        """
         # Check if trading is halted
         if self.trading_halted:
-            return False
+            return False, None
 
         # Check trading hours
-        if not self._is_trading_hours():
-            return False
+        if not self._window_state().is_trading_hours:
+            return False, None
 
         # Check daily loss limit (95% threshold)
-        if abs(self.daily_pnl) >= self.settings.daily_loss_limit * 0.95:
-            await self._halt_trading("Approaching daily loss limit")
-            return False
+        if abs(self.daily_pnl) >= self._dll_halt:
+            return False, "Approaching daily loss limit"
 
         # Check trailing max drawdown (95% threshold)
-        current_balance = self.settings.account_size + self.total_pnl
-        max_allowed_loss = self.high_water_mark - self.settings.max_drawdown_limit
-
-        if current_balance <= max_allowed_loss * 1.05:  # 5% buffer
-            await self._halt_trading("Approaching trailing max drawdown")
-            return False
+        if self.settings.account_size + self.total_pnl <= self._drawdown_halt_balance:
+            return False, "Approaching trailing max drawdown"
 
         # Check consecutive losses
         if self.consecutive_losses >= 3:
-            await self._halt_trading("3 consecutive losses - circuit breaker")
-            return False
+            return False, "3 consecutive losses - circuit breaker"
 
-        return True
+        return True, None
 
-    async def check_trade_risk(self, signal: Dict) -> bool:
-        """Check if a trade signal passes risk checks."""
+    async def check_trade_risk(self, signal: Union[Dict, Any]) -> bool:
+        """Check if a trade signal (dict or signal object) passes risk checks."""
         if not await self.can_trade():
             return False
 
         # Check position size limits
-        quantity = await self.calculate_position_size(signal)
+        try:
+            quantity = await self.calculate_position_size(signal)
+        except Exception as e:
+            # Traceback only when debug logging is on; bad signals can make this frequent
+            logger.error("Error calculating position size: {}", e)
+            logger.opt(exception=True).debug("Position sizing traceback")
+            return False
         if quantity <= 0:
             return False
 
         # Check if we're too close to market close
-        if self._is_near_market_close():
+        if self._window_state().is_near_close:
             return False
 
         return True
 
-    async def calculate_position_size(self, signal: Dict) -> int:
-        """Calculate position size based on risk parameters."""
-        try:
-            # Get current account balance
-            current_balance = (
-                self.settings.account_size
-                + self.total_pnl
-                + self.position_tracker.get_total_unrealized_pnl()
-            )
+    async def calculate_position_size(self, signal: Union[Dict, Any]) -> int:
+        """
+        Calculate position size based on risk parameters.
+
+        ``signal`` is a payload dict or a signal object read by attribute
+        (e.g. ``OrderSignal``). Signals without an entry or stop price size to
+        0; malformed values (e.g. a non-numeric price) raise. A precomputed
+        ``symbol_id`` (see ``symbol_id()``) is used in place of ``symbol`` when
+        present.
+        """
+        entry_price = _signal_field(signal, "entry_price")
+        stop_loss = _signal_field(signal, "stop_loss")
+        if not entry_price or not stop_loss:
+            return 0
 
-            # Calculate risk per trade (1.5% of balance)
-            risk_per_trade = current_balance * (
-                self.settings.risk_per_trade_percent / 100
-            )
+        # Calculate stop distance
+        stop_distance = abs(entry_price - stop_loss)
 
-            # Calculate stop distance
-            entry_price = signal.get("entry_price", 0)
-            stop_loss = signal.get("stop_loss", 0)
-            stop_distance = abs(entry_price - stop_loss)
+        if stop_distance == 0:
+            return 0
 
-            if stop_distance == 0:
-                return 0
+        # Calculate risk per contract
+        sym_id = _signal_field(signal, "symbol_id")
+        if sym_id is None:
+            sym_id = SYMBOL_IDS.get(_signal_field(signal, "symbol"), DEFAULT_SYMBOL_ID)
+        risk_per_contract = stop_distance * TICK_BY_ID[sym_id]
 
-            # Get tick value for symbol
-            symbol = signal.get("symbol", "")
-            tick_value = self._get_tick_value(symbol)
+        if risk_per_contract == 0:
+            return 0
 
-            # Calculate risk per contract
-            risk_per_contract = stop_distance * tick_value
+        # Get current account balance
+        current_balance = self._current_balance()
 
-            if risk_per_contract == 0:
-                return 0
+        # Calculate risk per trade (1.5% of balance)
+        risk_per_trade = current_balance * self._risk_pct
 
-            # Calculate number of contracts
-            contracts = int(risk_per_trade / risk_per_contract)
+        # Calculate number of contracts
+        contracts = int(risk_per_trade / risk_per_contract)
 
-            # Apply scaling plan limits
-            max_contracts = self._get_max_contracts_for_balance(current_balance)
-            contracts = min(contracts, max_contracts, self.settings.max_position_size)
-            contracts = max(contracts, self.settings.min_position_size)
+        # Apply scaling plan limits
+        max_contracts = self._get_max_contracts_for_balance(current_balance)
+        contracts = min(contracts, max_contracts, self.settings.max_position_size)
+        contracts = max(contracts, self.settings.min_position_size)
 
-            # Check daily loss limit remaining
-            remaining_daily_risk = (
-                self.settings.daily_loss_limit - abs(self.daily_pnl)
-            ) * 0.8  # 80% buffer
+        # Check daily loss limit remaining
+        remaining_daily_risk = self._remaining_daily_risk
 
-            if risk_per_contract * contracts > remaining_daily_risk:
-                contracts = int(remaining_daily_risk / risk_per_contract)
-                contracts = max(contracts, 0)
+        if risk_per_contract * contracts > remaining_daily_risk:
+            contracts = int(remaining_daily_risk / risk_per_contract)
+            contracts = max(contracts, 0)
 
-            return contracts
+        return contracts
 
-        except Exception as e:
-            logger.error(f"Error calculating position size: {e}", exc_info=True)
-            return 0
+    def invalidate_balance(self) -> None:
+        """Forget the cached balance (called on fills and mark-to-market updates)."""
+        self._balance_cache = None
+
+    def _current_balance(self) -> float:
+        """Account balance including unrealized P&L, recomputed only after a change."""
+        if self._balance_cache is None:
+            self._balance_cache = (
+                self.settings.account_size
+                + self.total_pnl
+                + self.position_tracker.get_total_unrealized_pnl()
+            )
+        return self._balance_cache
 
     def _get_tick_value(self, symbol: str) -> float:
         """Get tick value for a symbol."""
-        tick_values = {
-            "MES": 5.0,  # $5 per tick
-            "MNQ": 2.0,  # $2 per tick
-            "MGC": 1.0,  # $1 per tick
-        }
-        return tick_values.get(symbol, 1.0)
+        return TICK_BY_ID[SYMBOL_IDS.get(symbol, DEFAULT_SYMBOL_ID)]
 
     def _get_max_contracts_for_balance(self, balance: float) -> int:
         """Get max contracts based on scaling plan."""
@@ -178,37 +242,23 @@ class RiskManager:
         else:
             return 5
 
+    def _window_state(self) -> TradingClock:
+        """Session flags for the current CT minute (shared, cached per minute)."""
+        return trading_clock(self.ct_tz)
+
     def _is_trading_hours(self) -> bool:
         """Check if current time is within trading hours."""
-        now = datetime.now(self.ct_tz)
-        hour = now.hour
-        minute = now.minute
-
-        # Trading hours: 5:00 PM CT (previous day) to 3:10 PM CT (current day)
-        if hour >= 17 or hour < 15:
-            return True
-        if hour == 15 and minute <= 10:
-            return True
-        return False
+        return self._window_state().is_trading_hours
 
     def _is_near_market_close(self) -> bool:
         """Check if we're too close to market close (3:05 PM CT)."""
-        now = datetime.now(self.ct_tz)
-        close_time = time(15, 5)  # 3:05 PM CT
-
-        if now.time() >= close_time:
-            return True
-
-        # Don't allow new trades after 2:45 PM CT
-        if now.hour == 14 and now.minute >= 45:
-            return True
+        return self._window_state().is_near_close
 
-        return False
-
-    async def update_pnl(self, realized_pnl: float) -> None:
+    def update_pnl(self, realized_pnl: float) -> None:
         """Update P&L tracking."""
         self.total_pnl += realized_pnl
         self.daily_pnl += realized_pnl
+        self._balance_cache = None
 
         # Update high water mark
         current_balance = self.settings.account_size + self.total_pnl
@@ -219,6 +269,8 @@ class RiskManager:
         if self.daily_pnl > self.best_day_profit:
             self.best_day_profit = self.daily_pnl
 
+        self._refresh_thresholds()
+
         # Track consecutive losses
         if realized_pnl < 0:
             self.consecutive_losses += 1
@@ -233,7 +285,7 @@ class RiskManager:
                     f"Consistency rule approaching: {consistency_ratio:.2%}"
                 )
 
-    async def reset_daily_tracking(self) -> None:
+    def reset_daily_tracking(self) -> None:
         """Reset daily tracking at start of new trading day."""
         today = datetime.now(self.ct_tz).date()
 
@@ -246,9 +298,21 @@ class RiskManager:
             self.consecutive_losses = 0
             self.trading_halted = False
             self.trading_halted_reason = ""
+            self._refresh_thresholds()
             logger.info("Daily tracking reset")
 
-    async def _halt_trading(self, reason: str) -> None:
+    def _refresh_thresholds(self) -> None:
+        """Recompute the P&L-dependent thresholds read by can_trade and sizing."""
+        # Trailing max drawdown, with a 5% buffer
+        self._drawdown_halt_balance = (
+            self.high_water_mark - self.settings.max_drawdown_limit
+        ) * 1.05
+        # Daily loss limit remaining, with an 80% buffer
+        self._remaining_daily_risk = (
+            self.settings.daily_loss_limit - abs(self.daily_pnl)
+        ) * 0.8
+
+    def _halt_trading(self, reason: str) -> None:
         """Halt trading with a reason."""
         if not self.trading_halted:
             self.trading_halted = True
@@ -259,5 +323,5 @@ class RiskManager:
         """Force liquidate all positions (emergency)."""
         logger.critical("EMERGENCY: Liquidating all positions")
         # This will be called by order manager
-        await self._halt_trading("Emergency liquidation")
+        self._halt_trading("Emergency liquidation")
 
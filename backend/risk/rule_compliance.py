@@ -1,18 +1,22 @@
 """Topstep rule compliance checker."""
 
-from datetime import datetime, time
-from typing import Dict
+import bisect
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
-import pytz
 from loguru import logger
 
+from risk._clock import trading_clock
+
 
 class RuleCompliance:
     """Checks compliance with Topstep trading rules."""
 
     def __init__(self, settings):
         self.settings = settings
-        self.ct_tz = pytz.timezone(settings.timezone)
+        self.ct_tz = ZoneInfo(settings.timezone)
+        # id(scaling_plan) -> (plan, lower bounds, [(lo, hi, max_contracts)] sorted by lo, fallback)
+        self._plan_cache: Dict[int, Tuple[Dict, List[float], List[Tuple[float, float, int]], int]] = {}
 
     def check_daily_loss_limit(
         self, daily_pnl: float, daily_loss_limit: float
@@ -71,19 +75,18 @@ class RuleCompliance:
         Returns:
             (is_violated, message)
         """
-        now = datetime.now(self.ct_tz)
-        current_time = now.time()
+        clock = trading_clock(self.ct_tz)
 
         # Hard close at 3:05 PM CT
-        if current_time >= time(15, 5):
+        if clock.is_hard_close:
             return True, "Market closed - hard close time (3:05 PM CT)"
 
         # No new trades after 2:45 PM CT
-        if now.hour == 14 and now.minute >= 45:
+        if clock.is_near_close:
             return True, "No new trades allowed after 2:45 PM CT"
 
         # Check trading hours (5:00 PM CT to 3:10 PM CT)
-        if not (now.hour >= 17 or now.hour < 15 or (now.hour == 15 and now.minute <= 10)):
+        if not clock.is_trading_hours:
             return True, "Outside trading hours"
 
         return False, ""
@@ -121,21 +124,41 @@ class RuleCompliance:
 
         return False, ""
 
-    def _get_max_contracts_from_plan(self, balance: float, scaling_plan: Dict) -> int:
-        """Get max contracts from scaling plan."""
+    def _parse_plan(self, scaling_plan: Dict) -> Tuple[Dict, List[float], List[Tuple[float, float, int]], int]:
+        """
+        Parse a plan's ``"lo-hi"`` / ``"lo+"`` keys into numeric tiers, once per plan.
+
+        Plans are cached by identity (the entry keeps the plan alive, so its id
+        can't be reused); a plan mutated in place after first use isn't reparsed.
+        """
+        cached = self._plan_cache.get(id(scaling_plan))
+        if cached is not None and cached[0] is scaling_plan:
+            return cached
+
+        tiers = []
         for threshold_range, max_contracts in scaling_plan.items():
             if "-" in threshold_range:
-                parts = threshold_range.split("-")
-                min_val = float(parts[0])
-                max_val = float(parts[1])
-                if min_val <= balance < max_val:
-                    return max_contracts
+                lo, hi = threshold_range.split("-")
+                tiers.append((float(lo), float(hi), max_contracts))
             elif threshold_range.endswith("+"):
-                min_val = float(threshold_range.replace("+", ""))
-                if balance >= min_val:
-                    return max_contracts
+                tiers.append((float(threshold_range[:-1]), float("inf"), max_contracts))
+        tiers.sort(key=lambda tier: tier[0])
+
+        cached = (scaling_plan, [tier[0] for tier in tiers], tiers, min(scaling_plan.values()))
+        self._plan_cache[id(scaling_plan)] = cached
+        return cached
 
-        return min(scaling_plan.values()) if scaling_plan else 2
+    def _get_max_contracts_from_plan(self, balance: float, scaling_plan: Dict) -> int:
+        """Get max contracts from scaling plan."""
+        if not scaling_plan:
+            return 2
+
+        _, lows, tiers, fallback = self._parse_plan(scaling_plan)
+        # The tier with the highest lower bound <= balance, if balance is below its upper bound
+        i = bisect.bisect_right(lows, balance) - 1
+        if i >= 0 and balance < tiers[i][1]:
+            return tiers[i][2]
+        return fallback
 
     def validate_trade(self, trade_data: Dict) -> tuple[bool, str]:
         """
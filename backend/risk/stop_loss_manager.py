@@ -2,6 +2,7 @@
 
 from typing import Dict, Optional
 
+import numpy as np
 from loguru import logger
 
 
@@ -123,3 +124,65 @@ class StopLossManager:
 
         return r_multiple >= profit_threshold
 
+    # Array variants for backtests: one vectorized pass over many bars/symbols.
+    # ``side`` is an array of the same strings the scalar methods take.
+
+    @staticmethod
+    def calculate_atr_stop_batch(
+        entry_price: np.ndarray,
+        atr: np.ndarray,
+        side: np.ndarray,
+        multiplier: float = 1.5,
+    ) -> np.ndarray:
+        """Element-wise ``calculate_atr_stop``."""
+        stop_distance = np.asarray(atr, dtype=np.float64) * multiplier
+        entry_price = np.asarray(entry_price, dtype=np.float64)
+        return np.where(
+            np.asarray(side) == "BUY", entry_price - stop_distance, entry_price + stop_distance
+        )
+
+    @staticmethod
+    def calculate_trailing_stop_batch(
+        highest_price: np.ndarray,
+        lowest_price: np.ndarray,
+        side: np.ndarray,
+        atr: np.ndarray,
+        multiplier: float = 1.0,
+    ) -> np.ndarray:
+        """Element-wise ``calculate_trailing_stop`` (``side`` is "LONG"/"SHORT")."""
+        trailing_distance = np.asarray(atr, dtype=np.float64) * multiplier
+        return np.where(
+            np.asarray(side) == "LONG",
+            np.asarray(highest_price, dtype=np.float64) - trailing_distance,
+            np.asarray(lowest_price, dtype=np.float64) + trailing_distance,
+        )
+
+    @staticmethod
+    def calculate_take_profit_batch(
+        entry_price: np.ndarray,
+        stop_loss: np.ndarray,
+        side: np.ndarray,
+        risk_reward_ratio: float = 2.0,
+    ) -> np.ndarray:
+        """Element-wise ``calculate_take_profit``."""
+        entry_price = np.asarray(entry_price, dtype=np.float64)
+        reward = np.abs(entry_price - stop_loss) * risk_reward_ratio
+        return np.where(np.asarray(side) == "BUY", entry_price + reward, entry_price - reward)
+
+    @staticmethod
+    def should_trail_stop_batch(
+        current_price: np.ndarray,
+        entry_price: np.ndarray,
+        stop_loss: np.ndarray,
+        side: np.ndarray,
+        profit_threshold: float = 1.5,
+    ) -> np.ndarray:
+        """Element-wise ``should_trail_stop``; boolean array."""
+        current_price = np.asarray(current_price, dtype=np.float64)
+        entry_price = np.asarray(entry_price, dtype=np.float64)
+        risk = np.abs(entry_price - stop_loss)
+        profit = np.where(
+            np.asarray(side) == "BUY", current_price - entry_price, entry_price - current_price
+        )
+        r_multiple = np.divide(profit, risk, out=np.zeros_like(profit), where=risk > 0)
+        return r_multiple >= profit_threshold
@@ -6,11 +6,6 @@ from datetime import datetime, timedelta
 
 from loguru import logger
 
-from config.settings import Settings
-from api.auth_manager import AuthManager
-from backtesting.deep_backtester import DeepBacktester
-from accounts.account_loader import load_accounts
-
 
 async def main():
     """Main CLI entry point."""
@@ -56,6 +51,12 @@ async def main():
 
     args = parser.parse_args()
 
+    # Imported after parsing so --help and argument errors don't load the ML/data stack
+    from config.settings import Settings
+    from api.auth_manager import AuthManager
+    from backtesting.deep_backtester import DeepBacktester
+    from accounts.account_loader import load_accounts
+
     # Initialize
     settings = Settings()
     auth_manager = AuthManager(settings)
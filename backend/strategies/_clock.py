@@ -0,0 +1,46 @@
+"""CT wall clock shared by the strategies, read once per tick."""
+
+import time as _time
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
+
+CT_TZ = ZoneInfo("America/Chicago")
+
+# How long a reading is reused when nothing marks tick boundaries (backtests, tests)
+TICK_TTL = 1.0
+
+# The current tick's reading: monotonic stamp, CT datetime, seconds since CT midnight
+_NOW_CACHE = {"ts": float("-inf"), "now": None, "sod": 0}
+
+
+def seconds_of_day(t: time) -> int:
+    """Seconds since midnight of a wall-clock time, for integer window checks."""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def begin_tick() -> None:
+    """
+    Read the CT clock for a new tick.
+
+    StrategySelector calls this once per tick, so every strategy and symbol
+    in that tick compares against the same instant without converting
+    time zones again.
+    """
+    now = datetime.now(CT_TZ)
+    _NOW_CACHE["ts"] = _time.monotonic()
+    _NOW_CACHE["now"] = now
+    _NOW_CACHE["sod"] = seconds_of_day(now)
+
+
+def ct_now() -> datetime:
+    """The current tick's CT datetime (re-read if older than ``TICK_TTL``)."""
+    if _time.monotonic() - _NOW_CACHE["ts"] > TICK_TTL:
+        begin_tick()
+    return _NOW_CACHE["now"]
+
+
+def ct_seconds() -> int:
+    """The current tick's CT time as seconds since midnight."""
+    if _time.monotonic() - _NOW_CACHE["ts"] > TICK_TTL:
+        begin_tick()
+    return _NOW_CACHE["sod"]
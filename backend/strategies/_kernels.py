@@ -0,0 +1,183 @@
+"""Numba kernels for the strategies' latest-bar indicator gates."""
+
+from functools import lru_cache
+
+import numpy as np
+
+from ml._njit import NUMBA_AVAILABLE, njit, prange
+from ml.indicator_kernels import rsi_wilder
+
+
+@njit(cache=True, fastmath=True)
+def latest_indicators(close):
+    """
+    Indicators at the last bar of ``close``, without building full columns.
+
+    The Bollinger bands use a Welford pass over the last 20 closes (sample
+    std, 2 sigma); RSI is Wilder's over the whole history, so it matches
+    ``FeatureEngineer.calculate_indicators``. Values needing more history
+    than ``close`` has are NaN.
+
+    Returns:
+        (close, bb_lower, bb_upper, rsi_14, sma_50, roc_10)
+    """
+    n = close.shape[0]
+    last = close[n - 1]
+    bb_lower = np.nan
+    bb_upper = np.nan
+    sma_50 = np.nan
+    roc_10 = np.nan
+
+    if n >= 20:
+        mean = 0.0
+        m2 = 0.0
+        for k in range(20):
+            x = close[n - 20 + k]
+            delta = x - mean
+            mean += delta / (k + 1)
+            m2 += delta * (x - mean)
+        sd = np.sqrt(m2 / 19.0)
+        bb_lower = mean - 2.0 * sd
+        bb_upper = mean + 2.0 * sd
+
+    if n >= 50:
+        total = 0.0
+        for k in range(n - 50, n):
+            total += close[k]
+        sma_50 = total / 50.0
+
+    if n >= 11:
+        roc_10 = last / close[n - 11] - 1.0
+
+    rsi, _, _ = rsi_wilder(close, 14)
+    return last, bb_lower, bb_upper, rsi[n - 1], sma_50, roc_10
+
+
+@njit(cache=True, fastmath=True)
+def ema_tails(close, spans):
+    """
+    Last value of the EMA of ``close`` for each span, in one pass.
+
+    Uses the adjusted (normalized-weight) form, matching Polars'
+    ``ewm_mean(span=...)``; only the running state is kept per span.
+
+    Returns:
+        float64 array aligned with ``spans``
+    """
+    k = spans.shape[0]
+    decay = np.empty(k)
+    num = np.zeros(k)
+    den = np.zeros(k)
+    for j in range(k):
+        decay[j] = 1.0 - 2.0 / (spans[j] + 1.0)
+    for i in range(close.shape[0]):
+        x = close[i]
+        for j in range(k):
+            num[j] = x + decay[j] * num[j]
+            den[j] = 1.0 + decay[j] * den[j]
+    return num / den
+
+
+@njit(cache=True, parallel=True)
+def latest_indicators_batch(closes, lengths):
+    """
+    ``latest_indicators`` for many symbols at once, one row per thread.
+
+    ``closes`` is (nsym, nbars) with each symbol's history right-aligned and
+    left-padded; ``lengths[i]`` is how many trailing entries of row ``i``
+    are real bars.
+
+    Returns:
+        (nsym, 6) array of (close, bb_lower, bb_upper, rsi_14, sma_50, roc_10)
+    """
+    nsym, nbars = closes.shape
+    out = np.empty((nsym, 6))
+    for i in prange(nsym):
+        vals = latest_indicators(closes[i, nbars - lengths[i]:])
+        for k in range(6):
+            out[i, k] = vals[k]
+    return out
+
+
+def stack_closes(columns):
+    """Right-align 1-D close arrays into the (closes, lengths) pair the batch kernel takes."""
+    lengths = np.array([len(c) for c in columns], dtype=np.int64)
+    closes = np.full((len(columns), int(lengths.max(initial=0))), np.nan)
+    for i, c in enumerate(columns):
+        if lengths[i]:
+            closes[i, closes.shape[1] - lengths[i]:] = c
+    return closes, lengths
+
+
+def _rule_batch(rule):
+    """Compiled loop applying ``rule`` to every row of a ``latest_indicators_batch`` table."""
+
+    @njit
+    def rule_batch(table):
+        out = np.zeros(table.shape[0], np.int8)
+        for i in range(table.shape[0]):
+            out[i] = rule(table[i, 0], table[i, 1], table[i, 2], table[i, 3], table[i, 4], table[i, 5])
+        return out
+
+    return rule_batch
+
+
+# The rules below close over their thresholds, so each compiled variant has
+# them as constants. Not fastmath: indicator values can be NaN (e.g. RSI of a
+# flat window) and must compare False. Cached per threshold set, so strategies
+# with the same settings share one compilation.
+
+
+@lru_cache(maxsize=None)
+def mean_reversion_rule(rsi_oversold: float, rsi_overbought: float):
+    """
+    Bollinger + RSI entry rule specialized to the given RSI thresholds.
+
+    Returns:
+        (rule, rule_batch): ``rule(close, bb_lower, bb_upper, rsi_14, sma_50,
+        roc_10)`` gives 1 (long), -1 (short) or 0; ``rule_batch(table)`` gives
+        the same per row as an int8 array
+    """
+
+    @njit
+    def rule(close, bb_lower, bb_upper, rsi_14, sma_50, roc_10):
+        if close < bb_lower and rsi_14 < rsi_oversold:
+            return 1
+        if close > bb_upper and rsi_14 > rsi_overbought:
+            return -1
+        return 0
+
+    rule_batch = _rule_batch(rule)
+    if NUMBA_AVAILABLE:
+        rule_batch(np.zeros((1, 6)))
+    return rule, rule_batch
+
+
+@lru_cache(maxsize=None)
+def momentum_rule(roc_threshold: float):
+    """
+    SMA-50 + ROC-10 entry rule specialized to the given ROC threshold.
+
+    Returns:
+        (rule, rule_batch), as for ``mean_reversion_rule``
+    """
+
+    @njit
+    def rule(close, bb_lower, bb_upper, rsi_14, sma_50, roc_10):
+        if close > sma_50 and roc_10 > roc_threshold:
+            return 1
+        if close < sma_50 and roc_10 < -roc_threshold:
+            return -1
+        return 0
+
+    rule_batch = _rule_batch(rule)
+    if NUMBA_AVAILABLE:
+        rule_batch(np.zeros((1, 6)))
+    return rule, rule_batch
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import so the first live call doesn't pay for it
+    latest_indicators(np.zeros(2))
+    ema_tails(np.zeros(2), np.ones(1))
+    latest_indicators_batch(*stack_closes([np.zeros(2)]))
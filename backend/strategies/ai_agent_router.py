@@ -1,6 +1,7 @@
 """AI agent router for per-account AI strategy control."""
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -11,20 +12,42 @@ from accounts.models import AccountConfig
 
 
 class AIAgentRouter:
-    """Routes trading signals through different AI agents based on account config."""
+    """
+    Routes trading signals through different AI agents based on account config.
+
+    Verdicts are memoized per bar: signals that agree on symbol, side,
+    rounded entry/confidence and strategy reuse the model's earlier answer
+    until ``invalidate_cache`` is called for the next bar.
+
+    Models are loaded on the first ``process_signals`` call, so accounts that
+    never produce a signal don't pay for the load.
+    """
+
+    CACHE_SIZE = 1024
 
     def __init__(self, account_config: AccountConfig):
         self.account_config = account_config
         self.agent_type = account_config.ai_agent_type
         self.signal_validator = None
         self.rl_agent = None
+        self._ml_cache: "OrderedDict[Tuple, Tuple[bool, float]]" = OrderedDict()
+        self._rl_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
 
-        # Initialize AI agents based on type
+        # Initialize AI agents based on type; their models load in _ensure_loaded
         if self.agent_type == "ml_confirmation":
             self.signal_validator = SignalValidator()
-            self.signal_validator.load_model()
         elif self.agent_type == "rl_agent":
             self.rl_agent = RLAgent()
+        self._loaded = self.signal_validator is None and self.rl_agent is None
+
+    def _ensure_loaded(self) -> None:
+        """Load the agent's model on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.signal_validator is not None:
+            self.signal_validator.load_model()
+        if self.rl_agent is not None:
             self.rl_agent.load_model()
             self.rl_agent.enabled = True
 
@@ -40,6 +63,9 @@ class AIAgentRouter:
         Returns:
             Filtered/enhanced signals
         """
+        if signals:
+            self._ensure_loaded()
+
         if self.agent_type == "rule_based":
             # No AI filtering, return all signals
             return signals
@@ -49,15 +75,31 @@ class AIAgentRouter:
             if not self.signal_validator:
                 return signals
 
-            validated_signals = []
-            for signal in signals:
-                # Get market features (simplified - would need actual market data)
-                market_features = self._extract_market_features(signal)
-
-                is_valid, confidence = self.signal_validator.validate_signal(
-                    signal.to_dict(), market_features
+            keys = [self._cache_key(signal) for signal in signals]
+            verdicts = [self._cache_get(self._ml_cache, key) for key in keys]
+
+            # Score every signal without a cached verdict (one per key) in a single model call
+            pending: Dict[Tuple, TradingSignal] = {}
+            for signal, key, verdict in zip(signals, keys, verdicts):
+                if verdict is None and key not in pending:
+                    pending[key] = signal
+            if pending:
+                batch = list(pending.values())
+                results = self.signal_validator.validate_batch(
+                    batch,
+                    # Get market features (simplified - would need actual market data)
+                    [self._extract_market_features(signal) for signal in batch],
                 )
+                fresh = dict(zip(pending, results))
+                for key, verdict in fresh.items():
+                    self._cache_put(self._ml_cache, key, verdict)
+                verdicts = [
+                    verdict if verdict is not None else fresh[key]
+                    for key, verdict in zip(keys, verdicts)
+                ]
 
+            validated_signals = []
+            for signal, (is_valid, confidence) in zip(signals, verdicts):
                 if is_valid:
                     signal.confidence = confidence  # Update confidence
                     validated_signals.append(signal)
@@ -71,35 +113,53 @@ class AIAgentRouter:
 
             enhanced_signals = []
             for signal in signals:
-                # Get state for RL agent
-                state = self._extract_state(signal)
+                key = self._cache_key(signal)
+                action = self._cache_get(self._rl_cache, key)
+                if action is None:
+                    # Get state for RL agent
+                    state = self._extract_state(signal)
 
-                # Get action from RL agent
-                action = self.rl_agent.get_action(state)
+                    # Get action from RL agent
+                    action = self.rl_agent.get_action(state)
+                    self._cache_put(self._rl_cache, key, action)
 
                 # Enhance signal with RL recommendations
-                signal_dict = signal.to_dict()
-                signal_dict["quantity"] = action.get("position_size", signal_dict.get("quantity", 1))
-                signal_dict["stop_distance_multiplier"] = action.get("stop_distance_multiplier", 1.5)
-                signal_dict["take_profit_ratio"] = action.get("take_profit_ratio", 2.0)
-
-                # Recreate signal with enhanced parameters
-                enhanced_signal = TradingSignal(
-                    symbol=signal.symbol,
-                    side=signal.side,
-                    entry_price=signal.entry_price,
-                    stop_loss=signal.stop_loss,
-                    take_profit=signal.take_profit,
-                    order_type=signal.order_type,
-                    confidence=signal.confidence,
-                    strategy_name=signal.strategy_name,
-                )
-                enhanced_signals.append(enhanced_signal)
+                signal.quantity = action.get("position_size", signal.quantity or 1)
+                signal.stop_distance_multiplier = action.get("stop_distance_multiplier", 1.5)
+                signal.take_profit_ratio = action.get("take_profit_ratio", 2.0)
+                enhanced_signals.append(signal)
 
             return enhanced_signals
 
         return signals
 
+    def invalidate_cache(self) -> None:
+        """Forget memoized verdicts; call when a new bar starts."""
+        self._ml_cache.clear()
+        self._rl_cache.clear()
+
+    @staticmethod
+    def _cache_key(signal: TradingSignal) -> Tuple:
+        """Signals equal on this key get the same verdict within a bar."""
+        return (
+            signal.symbol,
+            signal.side,
+            round(signal.entry_price or 0.0, 2),
+            round(signal.confidence or 0.0, 2),
+            signal.strategy_name,
+        )
+
+    def _cache_get(self, cache: OrderedDict, key: Tuple) -> Optional[Any]:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: Tuple, value: Any) -> None:
+        cache[key] = value
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
     def _extract_market_features(self, signal: TradingSignal) -> Dict:
         """Extract market features for ML validation."""
         # Simplified - would need actual market data
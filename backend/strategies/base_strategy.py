@@ -1,59 +1,98 @@
 """Base strategy class for all trading strategies."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 
+import numpy as np
 import polars as pl
-from ml.feature_engineering import FeatureEngineer
+from ml.feature_engineering import FeatureEngineer, LazyFeatures
+from monitoring.error_throttle import ErrorThrottle
 
+@dataclass(slots=True)
 class TradingSignal:
     """Represents a trading signal."""
 
-    def __init__(
-        self,
-        symbol: str,
-        side: str,
-        entry_price: float,
-        stop_loss: float,
-        take_profit: float,
-        order_type: str = "MARKET",
-        confidence: float = 1.0,
-        strategy_name: str = "",
-        metadata: Optional[Dict] = None
-    ):
-        self.symbol = symbol
-        self.side = side  # "BUY" or "SELL"
-        self.entry_price = entry_price
-        self.stop_loss = stop_loss
-        self.take_profit = take_profit
-        self.order_type = order_type
-        self.confidence = confidence
-        self.strategy_name = strategy_name
-        self.metadata = metadata or {}
-
-    def to_dict(self) -> Dict:
-        """Convert signal to dictionary."""
-        return {
-            "symbol": self.symbol,
-            "side": self.side,
-            "entry_price": self.entry_price,
-            "stop_loss": self.stop_loss,
-            "take_profit": self.take_profit,
-            "order_type": self.order_type,
-            "confidence": self.confidence,
-            "strategy_name": self.strategy_name,
-            "metadata": self.metadata
-        }
+    # Slotted: allocated per candidate setup per bar, so skip the per-instance __dict__
+    symbol: str
+    side: str  # "BUY" or "SELL"
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    order_type: str = "MARKET"
+    confidence: float = 1.0
+    strategy_name: str = ""
+    metadata: Optional[Dict] = None
+    # Sizing/exit overrides recommended by the RL agent (None = not set)
+    quantity: Optional[int] = None
+    stop_distance_multiplier: Optional[float] = None
+    take_profit_ratio: Optional[float] = None
+
+    def __post_init__(self):
+        if self.metadata is None:
+            self.metadata = {}
+
+    def as_tuple(self) -> tuple:
+        """Signal fields in declaration order, without ``dataclasses.astuple``'s deep copy."""
+        return (
+            self.symbol,
+            self.side,
+            self.entry_price,
+            self.stop_loss,
+            self.take_profit,
+            self.order_type,
+            self.confidence,
+            self.strategy_name,
+            self.metadata,
+            self.quantity,
+            self.stop_distance_multiplier,
+            self.take_profit_ratio,
+        )
+
+    def as_dict(self) -> Dict:
+        """
+        Shallow field dict for payload boundaries (risk checks, order payloads).
+
+        Unlike ``dataclasses.asdict`` it doesn't deep-copy ``metadata``; the
+        dict is rebuilt per call rather than memoized, because the router and
+        ensemble adjust signals (confidence, RL overrides) after creation.
+        """
+        return dict(zip(self.__slots__, self.as_tuple()))
+
+
+@dataclass(slots=True)
+class Bars:
+    """OHLCV columns as float64 arrays (views where Polars allows)."""
+
+    close: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    # None when the frame has no volume column
+    volume: Optional[np.ndarray] = None
 
 
 class BaseStrategy(ABC):
     """Abstract base class for all trading strategies."""
 
+    # Subclasses on the per-tick path declare their own __slots__ too; the
+    # rest still get an instance __dict__ as usual
+    __slots__ = ("name", "symbols", "enabled", "allow_long", "allow_short", "feature_engineer", "_errors")
+
+    # Bar timeframe the strategy analyzes; StrategySelector fetches only the
+    # timeframes its enabled strategies declare
+    timeframe: str = "5m"
+
     def __init__(self, name: str, symbols: List[str]):
         self.name = name
         self.symbols = symbols
         self.enabled = True
+        # Entry sides this strategy may signal (settings.enable_long/short_entries)
+        self.allow_long = True
+        self.allow_short = True
         self.feature_engineer = FeatureEngineer()
+        # analyze() runs per symbol per tick, so a persistent failure must not
+        # format a traceback every time
+        self._errors = ErrorThrottle()
 
     @abstractmethod
     async def analyze(
@@ -71,11 +110,55 @@ class BaseStrategy(ABC):
         """
         pass
 
+    async def analyze_batch(
+        self, symbol_bars: Dict[str, pl.DataFrame]
+    ) -> List[TradingSignal]:
+        """
+        Analyze several symbols in one call.
+
+        The default runs ``analyze`` per symbol; strategies whose indicators
+        vectorize across symbols override it with a single pass.
+
+        Args:
+            symbol_bars: OHLCV DataFrame per symbol
+
+        Returns:
+            Signals found, in ``symbol_bars`` order
+        """
+        signals = []
+        for symbol, bars in symbol_bars.items():
+            try:
+                signal = await self.analyze(symbol, bars)
+            except Exception as e:
+                self._errors.error(f"Error in strategy {self.name} on {symbol}: {e}", e)
+                continue
+            if signal:
+                signals.append(signal)
+        return signals
+
     @abstractmethod
     def is_in_trading_window(self) -> bool:
         """Check if current time is within strategy's trading window."""
         pass
 
+    @staticmethod
+    def _to_soa(bars: pl.DataFrame) -> Bars:
+        """Extract the price/volume columns once, for the array-based helpers."""
+
+        def column(name: str) -> np.ndarray:
+            return bars.get_column(name).cast(pl.Float64).to_numpy()
+
+        return Bars(
+            close=column("close"),
+            high=column("high"),
+            low=column("low"),
+            volume=column("volume") if "volume" in bars.columns else None,
+        )
+
+    def allows(self, direction: int) -> bool:
+        """Whether entries in ``direction`` (1 long, -1 short) are enabled."""
+        return self.allow_long if direction > 0 else self.allow_short
+
     def enable(self) -> None:
         """Enable the strategy."""
         self.enabled = True
@@ -85,7 +168,6 @@ class BaseStrategy(ABC):
         self.enabled = False
         
     def enrich_signal(self, signal: TradingSignal, bars: pl.DataFrame) -> TradingSignal:
-        """Enrich signal with market features for ML."""
-        features = self.feature_engineer.extract_features(bars)
-        signal.metadata["market_features"] = features
+        """Enrich signal with market features for ML (extracted when first read)."""
+        signal.metadata["market_features"] = LazyFeatures(bars)
         return signal
@@ -1,15 +1,54 @@
 """ICT Silver Bullet strategy implementation."""
 
-from datetime import datetime, time
-from typing import Optional
+from collections import deque
+from datetime import time
+from typing import Dict, Optional, Tuple
 
 import polars as pl
-import pytz
-from loguru import logger
 
+from strategies._clock import CT_TZ, ct_seconds, seconds_of_day
 from strategies.base_strategy import BaseStrategy, TradingSignal
 
 
+class _RollingHighLow:
+    """
+    Max high / min low over the last ``window`` pushed bars.
+
+    Monotonic deques of (index, value): each push evicts dominated entries
+    and at most one expired one, so pushes are amortized O(1) and the
+    extremes are always at the front.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.count = 0
+        self.last_ts = None
+        self._hi: deque = deque()  # highs, decreasing
+        self._lo: deque = deque()  # lows, increasing
+
+    def push(self, high: float, low: float) -> None:
+        i = self.count
+        self.count += 1
+        hi = self._hi
+        while hi and hi[-1][1] <= high:
+            hi.pop()
+        hi.append((i, high))
+        if hi[0][0] <= i - self.window:
+            hi.popleft()
+        lo = self._lo
+        while lo and lo[-1][1] >= low:
+            lo.pop()
+        lo.append((i, low))
+        if lo[0][0] <= i - self.window:
+            lo.popleft()
+
+    def high(self) -> float:
+        return self._hi[0][1]
+
+    def low(self) -> float:
+        return self._lo[0][1]
+
+
 class ICTSilverBulletStrategy(BaseStrategy):
     """
     ICT Silver Bullet Strategy.
@@ -24,16 +63,22 @@ class ICTSilverBulletStrategy(BaseStrategy):
     6. Target: 2:1 R:R minimum
     """
 
+    __slots__ = ("ct_tz", "window_start", "window_end", "_window_start_s", "_window_end_s", "_roll")
+
     def __init__(self, symbols: list):
         super().__init__("ICT Silver Bullet", symbols)
-        self.ct_tz = pytz.timezone("America/Chicago")
+        self.ct_tz = CT_TZ
         self.window_start = time(9, 0)  # 9:00 AM CT
         self.window_end = time(10, 0)  # 10:00 AM CT
+        # The same bounds as seconds since midnight, compared against ct_seconds()
+        self._window_start_s = seconds_of_day(self.window_start)
+        self._window_end_s = seconds_of_day(self.window_end)
+        # Per-symbol 60m high/low over the completed bars, advanced one bar at a time
+        self._roll: Dict[str, _RollingHighLow] = {}
 
     def is_in_trading_window(self) -> bool:
         """Check if current time is within 9-10 AM CT window."""
-        now = datetime.now(self.ct_tz).time()
-        return self.window_start <= now <= self.window_end
+        return self._window_start_s <= ct_seconds() <= self._window_end_s
 
     async def analyze(
         self, symbol: str, bars: pl.DataFrame
@@ -46,134 +91,103 @@ class ICTSilverBulletStrategy(BaseStrategy):
             return None
 
         try:
+            # Instance attributes read below, hoisted into locals once per call
+            allow_long, allow_short, name = self.allow_long, self.allow_short, self.name
+
+            # One NumPy view per column (zero-copy for contiguous, null-free data);
+            # scalar reads from these skip Polars' per-element indexing
+            get_column = bars.get_column
+            close_arr = get_column("close").to_numpy()
+            open_arr = get_column("open").to_numpy()
+            high_arr = get_column("high").to_numpy()
+            low_arr = get_column("low").to_numpy()
+
             # Get 60-minute high/low for liquidity sweep detection
-            recent_60m = bars.tail(60)
-            high_60m = recent_60m["high"].max()
-            low_60m = recent_60m["low"].min()
+            high_60m, low_60m = self._high_low_60m(symbol, bars)
 
             # Get latest price
-            current_price = bars["close"].tail(1).item()
+            current_price = close_arr[-1]
 
             # Detect liquidity sweep
             liquidity_swept_high = current_price > high_60m
             liquidity_swept_low = current_price < low_60m
 
-            if not (liquidity_swept_high or liquidity_swept_low):
-                return None
-
             # Detect displacement (3+ consecutive candles in same direction)
-            recent_5 = bars.tail(5)
-            # Check if 3 most recent candles closed higher than previous 3 (simplistic displacement)
+            # Simplistic: the last 3 candles all bullish (or all bearish)
             # Better check: consecutive bullish/bearish candles with large bodies
-            
-            closes = recent_5["close"]
-            opens = recent_5["open"]
-            
-            # Last 3 candles
-            c1 = closes[-1] > opens[-1]
-            c2 = closes[-2] > opens[-2]
-            c3 = closes[-3] > opens[-3]
-            
-            displacement_up = c1 and c2 and c3
-            
-            c1_down = closes[-1] < opens[-1]
-            c2_down = closes[-2] < opens[-2]
-            c3_down = closes[-3] < opens[-3]
-            
-            displacement_down = c1_down and c2_down and c3_down
-
-            if not (displacement_up or displacement_down):
-                return None
-
-            # Detect Fair Value Gap (FVG)
-            fvg = self._detect_fvg(bars.tail(10))
-            if not fvg:
+            closes = close_arr[-3:]
+            opens = open_arr[-3:]
+            displacement_up = (closes > opens).all()
+            displacement_down = (closes < opens).all()
+
+            # Detect Fair Value Gap (FVG) over the last 3 candles (c1 .. c3):
+            # bullish when c1's high is below c3's low, bearish when c1's low
+            # is above c3's high. The limit entry sits at the gap edge nearest
+            # price (c3's low / high), so a retest into the gap fills.
+            c1_high, c1_low = high_arr[-3], low_arr[-3]
+            c3_high, c3_low = high_arr[-1], low_arr[-1]
+            up_gap = c1_high < c3_low
+            down_gap = c1_low > c3_high
+
+            setup_long = allow_long and liquidity_swept_low & displacement_up & up_gap
+            setup_short = allow_short and liquidity_swept_high & displacement_down & down_gap
+            if not (setup_long or setup_short):
                 return None
 
-            signal = None
-            
-            # Determine direction
-            if liquidity_swept_low and displacement_up and fvg["direction"] == "up":
+            if setup_long:
                 # Bullish setup
-                entry_price = fvg["start"]
+                entry_price = float(c3_low)
                 stop_loss = low_60m - 0.25 * 4 * 5 # 5 ticks below liquidity sweep (assuming 0.25 tick)
                 take_profit = entry_price + 2 * (entry_price - stop_loss)  # 2:1 R:R
-
-                signal = TradingSignal(
-                    symbol=symbol,
-                    side="BUY",
-                    entry_price=entry_price,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit,
-                    order_type="LIMIT",
-                    confidence=0.8,
-                    strategy_name=self.name,
-                )
-
-            elif liquidity_swept_high and displacement_down and fvg["direction"] == "down":
+                side = "BUY"
+            else:
                 # Bearish setup
-                entry_price = fvg["start"]
+                entry_price = float(c3_high)
                 stop_loss = high_60m + 0.25 * 4 * 5 # 5 ticks above liquidity sweep
                 take_profit = entry_price - 2 * (stop_loss - entry_price)  # 2:1 R:R
-
-                signal = TradingSignal(
-                    symbol=symbol,
-                    side="SELL",
-                    entry_price=entry_price,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit,
-                    order_type="LIMIT",
-                    confidence=0.8,
-                    strategy_name=self.name,
-                )
-                
-            if signal:
-                return self.enrich_signal(signal, bars)
+                side = "SELL"
+
+            signal = TradingSignal(
+                symbol=symbol,
+                side=side,
+                entry_price=entry_price,
+                stop_loss=stop_loss,
+                take_profit=take_profit,
+                order_type="LIMIT",
+                confidence=0.8,
+                strategy_name=name,
+            )
+            return self.enrich_signal(signal, bars)
 
         except Exception as e:
-            logger.error(f"Error in ICT Silver Bullet analysis: {e}", exc_info=True)
+            self._errors.error(f"Error in ICT Silver Bullet analysis: {e}", e)
 
         return None
 
-    def _detect_fvg(self, bars: pl.DataFrame) -> Optional[dict]:
-        """Detect Fair Value Gap in 3-candle sequence."""
-        if len(bars) < 3:
-            return None
-
-        # Get last 3 candles
-        # c1 is 3rd to last (index -3), c2 is 2nd to last (index -2), c3 is last (index -1)
-        
-        # Need to ensure we are looking at the candles causing displacement
-        # Usually FVG is formed by the big move.
-        
-        c1_high = bars["high"][-3]
-        c1_low = bars["low"][-3]
-        c3_high = bars["high"][-1]
-        c3_low = bars["low"][-1]
-
-        # Bullish FVG: c1 high < c3 low (gap between c1 and c3)
-        if c1_high < c3_low:
-            return {
-                "direction": "up",
-                "start": c1_high, # Entry at top of c1? No, usually entry is at retest of FVG which is between c1_high and c3_low.
-                # Standard ICT entry is at the "start" of the gap relative to price coming back?
-                # Price moves UP. Gap is c1_high to c3_low. Retest comes DOWN.
-                # So entry is c3_low (top of gap) or c1_high (bottom of gap)?
-                # Usually entry limit is placed at the "beginning" of the gap which is c3_low? No, that's immediate.
-                # Usually we wait for retracement into the gap.
-                # Limit entry at c3_low or even deeper (50%).
-                # Let's simplify: Limit at c3_low (top of gap) for aggressive, or c1_high + (c3_low-c1_high)/2 for conservative.
-                # Let's use Top of Gap (c3_low) to ensure fill if it touches.
-                "end": c3_low, # Actually start/end terminology is tricky.
-                "start": c3_low, # Limit Price
-            }
-
-        # Bearish FVG: c1 low > c3 high (gap between c1 and c3)
-        if c1_low > c3_high:
-            return {
-                "direction": "down",
-                "start": c3_high, # Limit Price (bottom of gap)
-                "end": c1_low,
-            }
-
-        return None
+    def _high_low_60m(self, symbol: str, bars: pl.DataFrame) -> Tuple[float, float]:
+        """
+        High/low of the last 60 bars (``len(bars) >= 60``).
+
+        The 59 completed bars before the latest live in a rolling window per
+        symbol, advanced by one push when exactly one bar was appended since
+        the last call and rebuilt otherwise. The latest bar is read fresh,
+        since it may still be forming.
+        """
+        high = bars.get_column("high").to_numpy()
+        low = bars.get_column("low").to_numpy()
+        if "timestamp" not in bars.columns:
+            return high[-60:].max(), low[-60:].min()
+
+        ts = bars.get_column("timestamp").to_numpy()
+        roll = self._roll.get(symbol)
+        if roll is None or roll.last_ts != ts[-2]:
+            if roll is not None and roll.last_ts == ts[-3]:
+                # One new bar: the previous latest is now complete
+                roll.push(high[-2], low[-2])
+            else:
+                roll = self._roll[symbol] = _RollingHighLow(59)
+                for h, lo in zip(high[-60:-1].tolist(), low[-60:-1].tolist()):
+                    roll.push(h, lo)
+            roll.last_ts = ts[-2]
+
+        return max(roll.high(), high[-1]), min(roll.low(), low[-1])
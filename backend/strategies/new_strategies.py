@@ -3,9 +3,23 @@
 from typing import Optional, Dict, List
 import polars as pl
 import numpy as np
-from loguru import logger
+from strategies._kernels import (
+    latest_indicators,
+    latest_indicators_batch,
+    mean_reversion_rule,
+    momentum_rule,
+    stack_closes,
+)
 from strategies.base_strategy import BaseStrategy, TradingSignal
 
+
+def _latest_indicator_table(symbol_bars: Dict[str, pl.DataFrame]) -> np.ndarray:
+    """Latest-bar indicator rows for every symbol, see ``latest_indicators_batch``."""
+    closes, lengths = stack_closes(
+        [bars.get_column("close").cast(pl.Float64).to_numpy() for bars in symbol_bars.values()]
+    )
+    return latest_indicators_batch(closes, lengths)
+
 class StatisticalArbitrageStrategy(BaseStrategy):
     """
     Statistical Arbitrage (Mean Reversion of Spread).
@@ -76,9 +90,22 @@ class EnhancedMeanReversionStrategy(BaseStrategy):
     """
     Enhanced Mean Reversion using Bollinger Bands + RSI + ML.
     """
+
+    __slots__ = ("stop_pct", "target_pct", "_rule", "_rule_batch")
     
-    def __init__(self, symbols: List[str]):
+    def __init__(
+        self,
+        symbols: List[str],
+        rsi_oversold: float = 30.0,
+        rsi_overbought: float = 70.0,
+        stop_pct: float = 0.01,
+        target_pct: float = 0.02,
+    ):
         super().__init__("Enhanced Mean Reversion", symbols)
+        self.stop_pct = stop_pct
+        self.target_pct = target_pct
+        # Entry rule compiled with the RSI thresholds as constants
+        self._rule, self._rule_batch = mean_reversion_rule(float(rsi_oversold), float(rsi_overbought))
         
     def is_in_trading_window(self) -> bool:
         return True
@@ -88,54 +115,71 @@ class EnhancedMeanReversionStrategy(BaseStrategy):
             return None
             
         try:
-            # Calculate indicators
-            df = self.feature_engineer.calculate_indicators(bars)
-            latest = df.tail(1)
-            
-            close = latest["close"][0]
-            bb_lower = latest["bb_lower"][0]
-            bb_upper = latest["bb_upper"][0]
-            rsi = latest["rsi_14"][0]
+            # Only the latest bar's values are needed: one kernel call, no indicator frame
+            values = latest_indicators(bars.get_column("close").cast(pl.Float64).to_numpy())
             
             # Logic:
-            # Long: Price < Lower BB AND RSI < 30
-            # Short: Price > Upper BB AND RSI > 70
-            
-            if close < bb_lower and rsi < 30:
-                signal = TradingSignal(
-                    symbol=symbol,
-                    side="BUY",
-                    entry_price=close,
-                    stop_loss=close * 0.99,
-                    take_profit=close * 1.02,
-                    strategy_name=self.name,
-                    confidence=0.7 # Base confidence
-                )
-                return self.enrich_signal(signal, bars)
-                
-            if close > bb_upper and rsi > 70:
-                signal = TradingSignal(
-                    symbol=symbol,
-                    side="SELL",
-                    entry_price=close,
-                    stop_loss=close * 1.01,
-                    take_profit=close * 0.98,
-                    strategy_name=self.name,
-                    confidence=0.7
-                )
-                return self.enrich_signal(signal, bars)
+            # Long: Price < Lower BB AND RSI < oversold
+            # Short: Price > Upper BB AND RSI > overbought
+            direction = self._rule(*values)
+            if direction and self.allows(direction):
+                return self._build_signal(symbol, bars, direction, values[0])
                 
         except Exception as e:
-            logger.error(f"Mean Reversion Error: {e}")
+            self._errors.error(f"Mean Reversion Error: {e}", e)
             
         return None
 
+    async def analyze_batch(self, symbol_bars: Dict[str, pl.DataFrame]) -> List[TradingSignal]:
+        """Same rules as ``analyze``, with the indicators for all symbols in one kernel call."""
+        ready = {symbol: bars for symbol, bars in symbol_bars.items() if len(bars) >= 20}
+        if not self.enabled or not ready:
+            return []
+
+        try:
+            table = _latest_indicator_table(ready)
+            directions = self._rule_batch(table)
+            return [
+                self._build_signal(symbol, bars, int(directions[i]), float(table[i, 0]))
+                for i, (symbol, bars) in enumerate(ready.items())
+                if directions[i] and self.allows(directions[i])
+            ]
+
+        except Exception as e:
+            self._errors.error(f"Mean Reversion Error: {e}", e)
+
+        return []
+
+    def _build_signal(self, symbol: str, bars: pl.DataFrame, direction: int, close: float) -> TradingSignal:
+        signal = TradingSignal(
+            symbol=symbol,
+            side="BUY" if direction > 0 else "SELL",
+            entry_price=close,
+            stop_loss=close * (1 - direction * self.stop_pct),
+            take_profit=close * (1 + direction * self.target_pct),
+            strategy_name=self.name,
+            confidence=0.7 # Base confidence
+        )
+        return self.enrich_signal(signal, bars)
+
 class MomentumStrategy(BaseStrategy):
     """
     Momentum Strategy using ROC and SMA.
     """
-    def __init__(self, symbols: List[str]):
+
+    __slots__ = ("stop_pct", "target_pct", "_rule", "_rule_batch")
+    def __init__(
+        self,
+        symbols: List[str],
+        roc_threshold: float = 0.001,
+        stop_pct: float = 0.005,
+        target_pct: float = 0.015,
+    ):
         super().__init__("Momentum", symbols)
+        self.stop_pct = stop_pct
+        self.target_pct = target_pct
+        # Entry rule compiled with the ROC threshold as a constant
+        self._rule, self._rule_batch = momentum_rule(float(roc_threshold))
         
     def is_in_trading_window(self) -> bool:
         return True
@@ -145,41 +189,48 @@ class MomentumStrategy(BaseStrategy):
             return None
             
         try:
-            df = self.feature_engineer.calculate_indicators(bars)
-            latest = df.tail(1)
-            
-            close = latest["close"][0]
-            sma_50 = latest["sma_50"][0]
-            roc_10 = latest["roc_10"][0]
+            # Only the latest bar's values are needed: one kernel call, no indicator frame
+            values = latest_indicators(bars.get_column("close").cast(pl.Float64).to_numpy())
             
             # Logic:
-            # Long: Price > SMA 50 AND ROC(10) > 0.001 (positive momentum)
-            # Short: Price < SMA 50 AND ROC(10) < -0.001
-            
-            if close > sma_50 and roc_10 > 0.001:
-                signal = TradingSignal(
-                    symbol=symbol,
-                    side="BUY",
-                    entry_price=close,
-                    stop_loss=close * 0.995,
-                    take_profit=close * 1.015,
-                    strategy_name=self.name
-                )
-                return self.enrich_signal(signal, bars)
-                
-            if close < sma_50 and roc_10 < -0.001:
-                signal = TradingSignal(
-                    symbol=symbol,
-                    side="SELL",
-                    entry_price=close,
-                    stop_loss=close * 1.005,
-                    take_profit=close * 0.985,
-                    strategy_name=self.name
-                )
-                return self.enrich_signal(signal, bars)
+            # Long: Price > SMA 50 AND ROC(10) > threshold (positive momentum)
+            # Short: Price < SMA 50 AND ROC(10) < -threshold
+            direction = self._rule(*values)
+            if direction and self.allows(direction):
+                return self._build_signal(symbol, bars, direction, values[0])
                 
         except Exception as e:
-            logger.error(f"Momentum Error: {e}")
+            self._errors.error(f"Momentum Error: {e}", e)
             
         return None
 
+    async def analyze_batch(self, symbol_bars: Dict[str, pl.DataFrame]) -> List[TradingSignal]:
+        """Same rules as ``analyze``, with the indicators for all symbols in one kernel call."""
+        ready = {symbol: bars for symbol, bars in symbol_bars.items() if len(bars) >= 50}
+        if not self.enabled or not ready:
+            return []
+
+        try:
+            table = _latest_indicator_table(ready)
+            directions = self._rule_batch(table)
+            return [
+                self._build_signal(symbol, bars, int(directions[i]), float(table[i, 0]))
+                for i, (symbol, bars) in enumerate(ready.items())
+                if directions[i] and self.allows(directions[i])
+            ]
+
+        except Exception as e:
+            self._errors.error(f"Momentum Error: {e}", e)
+
+        return []
+
+    def _build_signal(self, symbol: str, bars: pl.DataFrame, direction: int, close: float) -> TradingSignal:
+        signal = TradingSignal(
+            symbol=symbol,
+            side="BUY" if direction > 0 else "SELL",
+            entry_price=close,
+            stop_loss=close * (1 - direction * self.stop_pct),
+            take_profit=close * (1 + direction * self.target_pct),
+            strategy_name=self.name
+        )
+        return self.enrich_signal(signal, bars)
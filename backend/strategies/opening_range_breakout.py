@@ -1,12 +1,13 @@
 """Opening Range Breakout (ORB) strategy implementation."""
 
-from datetime import datetime, time
-from typing import Optional
+from datetime import date, datetime, time
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import polars as pl
-import pytz
-from loguru import logger
 
+from strategies._clock import CT_TZ, ct_now, ct_seconds, seconds_of_day
 from strategies.base_strategy import BaseStrategy, TradingSignal
 
 
@@ -23,97 +24,206 @@ class OpeningRangeBreakoutStrategy(BaseStrategy):
     Best For: MES, MNQ morning session
     """
 
-    def __init__(self, symbols: list):
+    __slots__ = (
+        "ct_tz",
+        "range_start",
+        "range_end",
+        "trading_end",
+        "stop_padding",
+        "reward_risk",
+        "_range_start_s",
+        "_range_end_s",
+        "_trading_end_s",
+        "_sym_idx",
+        "_range_hi",
+        "_range_lo",
+        "_range_day",
+    )
+
+    def __init__(self, symbols: list, stop_padding: float = 0.1, reward_risk: float = 1.5):
         super().__init__("Opening Range Breakout", symbols)
-        self.ct_tz = pytz.timezone("America/Chicago")
+        # Stop sits this fraction of the range beyond it; target at reward_risk:1
+        self.stop_padding = stop_padding
+        self.reward_risk = reward_risk
+        self.ct_tz = CT_TZ
         self.range_start = time(8, 30)  # 8:30 AM CT
         self.range_end = time(8, 45)  # 8:45 AM CT
         self.trading_end = time(10, 0)  # Stop trading after 10 AM CT
-        self.opening_ranges: dict = {}  # Store opening range per symbol
+        # The same bounds as seconds since midnight, compared against ct_seconds()
+        self._range_start_s = seconds_of_day(self.range_start)
+        self._range_end_s = seconds_of_day(self.range_end)
+        self._trading_end_s = seconds_of_day(self.trading_end)
+        # Opening ranges as columns indexed by symbol slot; a range is only valid
+        # on the CT date (ordinal) it was built, 0 meaning none yet
+        self._sym_idx: Dict[str, int] = {}
+        self._range_hi = np.full(len(symbols), np.nan)
+        self._range_lo = np.full(len(symbols), np.nan)
+        self._range_day = np.zeros(len(symbols), dtype=np.int64)
+        for symbol in symbols:
+            self._symbol_index(symbol)
+
+    def _symbol_index(self, symbol: str) -> int:
+        """Slot for ``symbol`` in the range arrays, appended on first sight."""
+        i = self._sym_idx.get(symbol)
+        if i is None:
+            i = self._sym_idx[symbol] = len(self._sym_idx)
+            if i >= len(self._range_hi):
+                self._range_hi = np.append(self._range_hi, np.nan)
+                self._range_lo = np.append(self._range_lo, np.nan)
+                self._range_day = np.append(self._range_day, 0)
+        return i
+
+    @property
+    def opening_ranges(self) -> Dict[str, dict]:
+        """Stored ranges as ``{symbol: {"date", "high", "low"}}`` (a snapshot)."""
+        return {
+            symbol: {
+                "date": date.fromordinal(int(self._range_day[i])),
+                "high": float(self._range_hi[i]),
+                "low": float(self._range_lo[i]),
+            }
+            for symbol, i in self._sym_idx.items()
+            if self._range_day[i]
+        }
+
+    def breakouts(self, prices: np.ndarray, today: date) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bullish / bearish breakout masks for all symbols at once.
+
+        ``prices`` holds the latest price per symbol in slot order (the order
+        of ``symbols`` given at construction); symbols without a range for
+        ``today`` are False in both masks.
+        """
+        ready = self._range_day == today.toordinal()
+        return ready & (prices > self._range_hi), ready & (prices < self._range_lo)
 
     def is_in_trading_window(self) -> bool:
         """Check if current time is within trading window."""
-        now = datetime.now(self.ct_tz).time()
-        return self.range_start <= now <= self.trading_end
+        return self._range_start_s <= ct_seconds() <= self._trading_end_s
 
     async def analyze(
         self, symbol: str, bars: pl.DataFrame
     ) -> Optional[TradingSignal]:
         """Analyze market data for ORB setup."""
-        if not self.enabled or not self.is_in_trading_window():
+        if not self.enabled:
             return None
 
-        if bars.is_empty():
+        # One clock read serves both the trading-window and the range-window check
+        now_s = ct_seconds()
+        range_start_s = self._range_start_s
+        if not range_start_s <= now_s <= self._trading_end_s or bars.is_empty():
             return None
 
         try:
-            now = datetime.now(self.ct_tz).time()
-
-            # Define opening range during 8:30-8:45 AM CT
-            if self.range_start <= now <= self.range_end:
-                # Calculate opening range
-                range_bars = bars.filter(
-                    (pl.col("timestamp").dt.hour() == 8)
-                    & (pl.col("timestamp").dt.minute() >= 30)
-                    & (pl.col("timestamp").dt.minute() <= 45)
-                )
-
-                if not range_bars.is_empty():
-                    range_high = range_bars["high"].max()
-                    range_low = range_bars["low"].min()
-                    self.opening_ranges[symbol] = {
-                        "high": range_high,
-                        "low": range_low,
-                    }
+            today = ct_now().date()
+            day = today.toordinal()
+
+            # Define opening range during 8:30-8:45 AM CT (still forming, so recomputed)
+            if now_s <= self._range_end_s:
+                opening_range = self._opening_range(bars, today)
+                if opening_range is not None:
+                    i = self._symbol_index(symbol)
+                    self._range_hi[i], self._range_lo[i] = opening_range
+                    self._range_day[i] = day
                 return None  # Wait for breakout after range is established
 
-            # After range is established, look for breakouts
-            if symbol not in self.opening_ranges:
+            # After range is established, look for breakouts (today's range only)
+            i = self._sym_idx.get(symbol)
+            if i is None or self._range_day[i] != day:
                 return None
 
-            range_high = self.opening_ranges[symbol]["high"]
-            range_low = self.opening_ranges[symbol]["low"]
-            current_price = bars["close"].tail(1).item()
-
-            # Calculate range size for stop placement
-            range_size = range_high - range_low
-
-            # Bullish breakout
-            if current_price > range_high:
-                entry_price = current_price
-                stop_loss = range_low - range_size * 0.1  # Slightly below range
-                take_profit = entry_price + 1.5 * (entry_price - stop_loss)  # 1.5:1 R:R
-
-                return TradingSignal(
-                    symbol=symbol,
-                    side="BUY",
-                    entry_price=entry_price,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit,
-                    order_type="MARKET",
-                    confidence=0.75,
-                    strategy_name=self.name,
-                )
-
-            # Bearish breakout
-            elif current_price < range_low:
-                entry_price = current_price
-                stop_loss = range_high + range_size * 0.1  # Slightly above range
-                take_profit = entry_price - 1.5 * (stop_loss - entry_price)  # 1.5:1 R:R
-
-                return TradingSignal(
-                    symbol=symbol,
-                    side="SELL",
-                    entry_price=entry_price,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit,
-                    order_type="MARKET",
-                    confidence=0.75,
-                    strategy_name=self.name,
-                )
+            current_price = float(bars.get_column("close").to_numpy()[-1])
+            if current_price > self._range_hi[i] and self.allow_long:
+                return self._breakout_signal(symbol, i, current_price, 1)
+            if current_price < self._range_lo[i] and self.allow_short:
+                return self._breakout_signal(symbol, i, current_price, -1)
 
         except Exception as e:
-            logger.error(f"Error in ORB analysis: {e}", exc_info=True)
+            self._errors.error(f"Error in ORB analysis: {e}", e)
 
         return None
 
+    async def analyze_batch(self, symbol_bars: Dict[str, pl.DataFrame]) -> List[TradingSignal]:
+        """
+        Same rules as ``analyze``; after the range window, all symbols' breakouts
+        are found with one ``breakouts`` call.
+        """
+        if not self.enabled:
+            return []
+        now_s = ct_seconds()
+        if not self._range_start_s <= now_s <= self._trading_end_s:
+            return []
+        if now_s <= self._range_end_s:
+            # Ranges still forming: analyze() records each symbol's range
+            return await super().analyze_batch(symbol_bars)
+
+        try:
+            slots = [
+                (symbol, self._symbol_index(symbol), bars)
+                for symbol, bars in symbol_bars.items()
+                if not bars.is_empty()
+            ]
+            prices = np.full(len(self._range_hi), np.nan)
+            for _, i, bars in slots:
+                prices[i] = bars.get_column("close").to_numpy()[-1]
+            up, down = self.breakouts(prices, ct_now().date())
+
+            allow_long, allow_short = self.allow_long, self.allow_short
+            signals = []
+            for symbol, i, _ in slots:
+                if up[i] and allow_long:
+                    signals.append(self._breakout_signal(symbol, i, float(prices[i]), 1))
+                elif down[i] and allow_short:
+                    signals.append(self._breakout_signal(symbol, i, float(prices[i]), -1))
+            return signals
+
+        except Exception as e:
+            self._errors.error(f"Error in ORB analysis: {e}", e)
+            return []
+
+    def _breakout_signal(self, symbol: str, i: int, current_price: float, direction: int) -> TradingSignal:
+        """Market entry for a breakout of slot ``i``'s range (1 bullish, -1 bearish)."""
+        range_high = float(self._range_hi[i])
+        range_low = float(self._range_lo[i])
+        # Stop sits beyond the far side of the range, padded by a fraction of its size
+        padding = (range_high - range_low) * self.stop_padding
+        stop_loss = range_low - padding if direction > 0 else range_high + padding
+        take_profit = current_price + self.reward_risk * (current_price - stop_loss)
+
+        return TradingSignal(
+            symbol=symbol,
+            side="BUY" if direction > 0 else "SELL",
+            entry_price=current_price,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            order_type="MARKET",
+            confidence=0.75,
+            strategy_name=self.name,
+        )
+
+    def _opening_range(self, bars: pl.DataFrame, today: date) -> Optional[Tuple[float, float]]:
+        """
+        (high, low) of today's 8:30-8:45 CT bars, or None if there are none.
+
+        Bars are in timestamp order, so the range's rows are found by binary
+        search instead of filtering the whole frame.
+        """
+        ts = bars.get_column("timestamp")
+        start = datetime.combine(today, self.range_start, tzinfo=self.ct_tz)
+        # Inclusive of the 8:45 bar
+        end = datetime.combine(
+            today, self.range_end.replace(second=59, microsecond=999999), tzinfo=self.ct_tz
+        )
+        tz = ts.dtype.time_zone
+        if tz is None:
+            # Naive timestamps are CT wall-clock times
+            start, end = start.replace(tzinfo=None), end.replace(tzinfo=None)
+        else:
+            start, end = start.astimezone(ZoneInfo(tz)), end.astimezone(ZoneInfo(tz))
+
+        lo = ts.search_sorted(start, "left")
+        hi = ts.search_sorted(end, "right")
+        if lo >= hi:
+            return None
+        range_bars = bars.slice(lo, hi - lo)
+        return range_bars["high"].max(), range_bars["low"].min()
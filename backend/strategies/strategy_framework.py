@@ -9,27 +9,42 @@ class StrategyEnsemble:
     """
     Manages multiple strategies and combines their signals.
     """
+
+    # Trades per strategy that the weight rebalance looks back over
+    RECENT_TRADES = 5
     
     def __init__(self, strategies: List[BaseStrategy]):
         self.strategies = strategies
         self.weights = {s.name: 1.0 for s in strategies}
-        self.performance_history = {s.name: [] for s in strategies}
+        # Per strategy: ring of the last RECENT_TRADES PnLs, their running sum,
+        # and the number of trades seen (the next slot is count % RECENT_TRADES)
+        self._recent = {s.name: np.zeros(self.RECENT_TRADES) for s in strategies}
+        self._sum5 = {s.name: 0.0 for s in strategies}
+        self._idx = {s.name: 0 for s in strategies}
         
     def update_performance(self, strategy_name: str, pnl: float):
         """Update performance history for a strategy."""
-        if strategy_name in self.performance_history:
-            self.performance_history[strategy_name].append(pnl)
-            self._rebalance_weights()
+        ring = self._recent.get(strategy_name)
+        if ring is None:
+            return
+        i = self._idx[strategy_name]
+        slot = i % self.RECENT_TRADES
+        if slot == 0 and i:
+            # Re-sum once per lap so the running sum can't drift in sign
+            self._sum5[strategy_name] = float(ring.sum())
+        self._sum5[strategy_name] += pnl - ring[slot]
+        ring[slot] = pnl
+        self._idx[strategy_name] = i + 1
+        self._rebalance_weights()
             
     def _rebalance_weights(self):
         """Adjust weights based on recent performance (Sharpe/WinRate)."""
         # Simple logic: Increase weight if last 5 trades net positive
-        for name, history in self.performance_history.items():
-            if not history:
+        for name, count in self._idx.items():
+            if not count:
                 continue
             
-            recent = history[-5:]
-            if sum(recent) > 0:
+            if self._sum5[name] > 0:
                 self.weights[name] = min(2.0, self.weights[name] * 1.1)
             else:
                 self.weights[name] = max(0.5, self.weights[name] * 0.9)
@@ -1,12 +1,15 @@
 """Strategy selector that coordinates multiple strategies."""
 
 import asyncio
-from typing import Dict, List, Optional
+from dataclasses import replace
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from core.data_manager import DataManager
-from strategies.base_strategy import TradingSignal
+from strategies._clock import begin_tick, ct_seconds
+from strategies.base_strategy import BaseStrategy, TradingSignal
 from strategies.ict_silver_bullet import ICTSilverBulletStrategy
 from strategies.opening_range_breakout import OpeningRangeBreakoutStrategy
 from strategies.trend_following import TrendFollowingStrategy
@@ -17,6 +20,11 @@ from accounts.models import AccountConfig
 from typing import Optional
 
 
+def _copy_signal(signal: TradingSignal) -> TradingSignal:
+    """Independent copy of a signal, with its own metadata dict."""
+    return replace(signal, metadata=dict(signal.metadata))
+
+
 class StrategySelector:
     """Selects and coordinates trading strategies."""
 
@@ -52,21 +60,22 @@ class StrategySelector:
             # Default: enable all strategies
             self.strategies = list(all_strategies.values())
 
+        # Last bar per symbol for every fetched timeframe, as of the previous
+        # get_signals call; a change means a new bar
+        self._last_bar_marks: tuple = ()
+        # Per strategy: (CT minute, frames analyzed, unmodified copies of the
+        # signals found), reused while get_bars keeps returning the same frames
+        self._analysis_cache: Dict[BaseStrategy, Tuple[int, tuple, List[TradingSignal]]] = {}
+
         # Initialize AI agent router if account config provided
         self.ai_router = None
         if account_config:
             self.ai_router = AIAgentRouter(account_config)
 
-        # Enable/disable based on settings
-        if not settings.enable_long_entries:
-            for strategy in self.strategies:
-                # Strategies handle this internally
-                pass
-
-        if not settings.enable_short_entries:
-            for strategy in self.strategies:
-                # Strategies handle this internally
-                pass
+        # Entry sides allowed by settings; strategies skip disabled sides in analyze()
+        for strategy in self.strategies:
+            strategy.allow_long = settings.enable_long_entries
+            strategy.allow_short = settings.enable_short_entries
 
     async def start(self) -> None:
         """Start the strategy selector."""
@@ -86,34 +95,81 @@ class StrategySelector:
             return signals
 
         try:
-            for symbol in self.settings.symbols:
-                # Get bars for different timeframes
-                bars_1m = await self.data_manager.get_bars(symbol, "1m", limit=200)
-                bars_5m = await self.data_manager.get_bars(symbol, "5m", limit=200)
-
-                # Run each strategy
-                for strategy in self.strategies:
-                    if not strategy.enabled:
-                        continue
-
-                    try:
-                        # Use 5m bars for most strategies, 1m for scalping
-                        bars = bars_5m if len(bars_5m) > len(bars_1m) else bars_1m
-
-                        signal = await strategy.analyze(symbol, bars)
-                        if signal:
-                            signals.append(signal)
-                            logger.info(
-                                f"Signal generated: {strategy.name} - {symbol} {signal.side}"
-                            )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Error in strategy {strategy.name}: {e}", exc_info=True
-                        )
+            symbols = self.settings.symbols
+            active = [
+                strategy
+                for strategy in self.strategies
+                if strategy.enabled and (strategy.allow_long or strategy.allow_short)
+            ]
+            # Only the timeframes some enabled strategy reads, all symbols in one gather
+            timeframes = sorted({strategy.timeframe for strategy in active})
+            get_bars = self.data_manager.get_bars
+            fetched = iter(await asyncio.gather(
+                *(get_bars(symbol, tf, limit=200) for tf in timeframes for symbol in symbols)
+            ))
+            bars_by_tf = {tf: {symbol: next(fetched) for symbol in symbols} for tf in timeframes}
+
+            # Latest bar per symbol and timeframe; a change means a new bar
+            bar_marks = [
+                bars["timestamp"][-1] if len(bars) and "timestamp" in bars.columns else None
+                for symbol_bars in bars_by_tf.values()
+                for bars in symbol_bars.values()
+            ]
+
+            # One CT clock reading shared by every strategy this tick
+            begin_tick()
+            minute = ct_seconds() // 60
+
+            # get_bars hands back the same frame objects until a new tick lands,
+            # so a strategy whose frames are unchanged this minute (its trading
+            # windows are minute-aligned) would find the same signals again
+            results: List = [None] * len(active)
+            stale = []
+            for i, strategy in enumerate(active):
+                frames = tuple(bars_by_tf[strategy.timeframe].values())
+                cached = self._analysis_cache.get(strategy)
+                if (
+                    cached is not None
+                    and cached[0] == minute
+                    and len(cached[1]) == len(frames)
+                    and all(a is b for a, b in zip(cached[1], frames))
+                ):
+                    results[i] = [_copy_signal(signal) for signal in cached[2]]
+                else:
+                    stale.append((i, strategy, frames))
+
+            # Run each remaining strategy over all symbols in one call, all strategies together
+            fresh = await asyncio.gather(
+                *(strategy.analyze_batch(bars_by_tf[strategy.timeframe]) for _, strategy, _ in stale),
+                return_exceptions=True,
+            )
+            for (i, strategy, frames), result in zip(stale, fresh):
+                results[i] = result
+                if isinstance(result, BaseException):
+                    self._analysis_cache.pop(strategy, None)
+                else:
+                    # Copies, since the router and ensemble adjust signals in place
+                    self._analysis_cache[strategy] = (
+                        minute, frames, [_copy_signal(signal) for signal in result]
+                    )
+
+            for strategy, result in zip(active, results):
+                if isinstance(result, BaseException):
+                    logger.opt(exception=result).error(f"Error in strategy {strategy.name}: {result}")
+                    continue
+                for signal in result:
+                    signals.append(signal)
+                    # Format args, not an f-string: loguru only formats once a handler takes INFO
+                    logger.info(
+                        "Signal generated: {} - {} {}", strategy.name, signal.symbol, signal.side
+                    )
 
             # Process through AI agent if configured
             if self.ai_router:
+                bar_marks = tuple(bar_marks)
+                if bar_marks != self._last_bar_marks:
+                    self._last_bar_marks = bar_marks
+                    self.ai_router.invalidate_cache()
                 signals = await self.ai_router.process_signals(signals)
 
             # Filter signals by confidence and risk
@@ -132,20 +188,32 @@ class StrategySelector:
         if not signals:
             return []
 
-        # Sort by confidence (highest first)
-        signals.sort(key=lambda s: s.confidence, reverse=True)
-
-        # Take only the best signal per symbol
+        # Best signal per symbol, risk-checked concurrently. A rejected signal
+        # hands its symbol to the next best one in the following round, so
+        # the result matches checking candidates in confidence order
         filtered = []
-        symbols_seen = set()
-
-        for signal in signals:
-            if signal.symbol not in symbols_seen:
-                # Check risk before adding
-                signal_dict = signal.to_dict()
-                if await self.risk_manager.check_trade_risk(signal_dict):
+        pending = signals
+        while pending:
+            best: Dict[str, TradingSignal] = {}
+            for signal in pending:
+                prev = best.get(signal.symbol)
+                if prev is None or signal.confidence > prev.confidence:
+                    best[signal.symbol] = signal
+
+            picks = list(best.values())
+            approved = await asyncio.gather(
+                *(self.risk_manager.check_trade_risk(signal.as_dict()) for signal in picks)
+            )
+            done = set()
+            for signal, ok in zip(picks, approved):
+                if ok:
                     filtered.append(signal)
-                    symbols_seen.add(signal.symbol)
+                    done.add(signal.symbol)
+            pending = [
+                signal for signal in pending
+                if signal.symbol not in done and best[signal.symbol] is not signal
+            ]
 
+        # Highest confidence first
+        filtered.sort(key=attrgetter("confidence"), reverse=True)
         return filtered
-
@@ -1,11 +1,49 @@
 """Trend Following strategy implementation."""
 
-from typing import Optional
+from typing import Dict, Optional
 
+import numpy as np
 import polars as pl
-from loguru import logger
 
-from strategies.base_strategy import BaseStrategy, TradingSignal
+from strategies._kernels import ema_tails
+from strategies.base_strategy import Bars, BaseStrategy, TradingSignal
+
+# Trend alignment EMAs, fastest first
+EMA_SPANS = np.array([10.0, 20.0, 50.0, 200.0])
+
+
+class _WindowEma:
+    """
+    Adjusted EMAs (one per span) over a sliding window of completed closes.
+
+    Keeps ``num = sum(d ** (m - 1 - i) * x[i])`` over the ``m`` completed
+    closes, per span decay ``d``. Appending a close is ``x + d * num``, and
+    sliding the window also subtracts the dropped close's weight
+    ``d ** m``, so each new bar is an O(1) update instead of a full pass.
+    """
+
+    def __init__(self, spans: np.ndarray, completed: np.ndarray):
+        self.decay = 1.0 - 2.0 / (spans + 1.0)
+        self.m = len(completed)
+        powers = np.arange(self.m - 1, -1, -1)
+        self.num = (self.decay[:, None] ** powers) @ completed
+        self.first = completed[0]
+        self.last_ts = None
+
+    def push(self, x: float, slide: bool, first: float) -> None:
+        """Append completed close ``x``; with ``slide``, drop the oldest (new oldest is ``first``)."""
+        d = self.decay
+        if slide:
+            self.num = x + d * self.num - d ** self.m * self.first
+        else:
+            self.num = x + d * self.num
+            self.m += 1
+        self.first = first
+
+    def values(self, latest: float) -> np.ndarray:
+        """EMAs with the (possibly still forming) ``latest`` close folded in."""
+        d = self.decay
+        return (latest + d * self.num) * (1.0 - d) / (1.0 - d ** (self.m + 1))
 
 
 class TrendFollowingStrategy(BaseStrategy):
@@ -22,6 +60,8 @@ class TrendFollowingStrategy(BaseStrategy):
 
     def __init__(self, symbols: list):
         super().__init__("Trend Following", symbols)
+        # Per-symbol EMA state over the completed bars, advanced one bar at a time
+        self._ema: Dict[str, _WindowEma] = {}
 
     def is_in_trading_window(self) -> bool:
         """Trend following can trade throughout the day."""
@@ -38,44 +78,31 @@ class TrendFollowingStrategy(BaseStrategy):
             return None
 
         try:
-            # Calculate EMAs
-            ema_10 = bars["close"].ewm_mean(span=10)
-            ema_20 = bars["close"].ewm_mean(span=20)
-            ema_50 = bars["close"].ewm_mean(span=50)
-            ema_200 = bars["close"].ewm_mean(span=200)
-
-            # Get latest values
-            current_price = bars["close"].tail(1).item()
-            ema_10_val = ema_10.tail(1).item()
-            ema_20_val = ema_20.tail(1).item()
-            ema_50_val = ema_50.tail(1).item()
-            ema_200_val = ema_200.tail(1).item()
+            soa = self._to_soa(bars)
+
+            # Latest EMA 10/20/50/200 values
+            close = soa.close
+            current_price = float(close[-1])
+            levels = np.empty(5)
+            levels[0] = current_price
+            levels[1:] = self._ema_values(symbol, bars, close)
+            ema_10_val, ema_20_val, ema_50_val, ema_200_val = levels[1:].tolist()
 
             # Calculate ATR for stop placement
-            atr = self._calculate_atr(bars, period=14)
+            atr = self._calculate_atr(soa, period=14)
             if atr is None:
                 return None
 
-            # Check for uptrend (all EMAs aligned upward)
-            uptrend = (
-                current_price > ema_10_val
-                and ema_10_val > ema_20_val
-                and ema_20_val > ema_50_val
-                and ema_50_val > ema_200_val
-            )
-
-            # Check for downtrend (all EMAs aligned downward)
-            downtrend = (
-                current_price < ema_10_val
-                and ema_10_val < ema_20_val
-                and ema_20_val < ema_50_val
-                and ema_50_val < ema_200_val
-            )
+            # Uptrend: price > EMA 10 > 20 > 50 > 200, i.e. strictly falling from
+            # price to the slowest EMA; downtrend is the mirror image
+            steps = np.diff(levels)
+            uptrend = bool((steps < 0).all())
+            downtrend = bool((steps > 0).all())
 
             # Look for pullback in uptrend
-            if uptrend:
+            if uptrend and self.allow_long:
                 # Check if price pulled back to EMA 20 or 50
-                recent_low = bars["low"].tail(10).min()
+                recent_low = float(soa.low[-10:].min())
                 pullback_to_ema20 = abs(current_price - ema_20_val) / ema_20_val < 0.002
                 pullback_to_ema50 = abs(current_price - ema_50_val) / ema_50_val < 0.002
 
@@ -96,9 +123,9 @@ class TrendFollowingStrategy(BaseStrategy):
                     )
 
             # Look for pullback in downtrend
-            elif downtrend:
+            elif downtrend and self.allow_short:
                 # Check if price pulled back to EMA 20 or 50
-                recent_high = bars["high"].tail(10).max()
+                recent_high = float(soa.high[-10:].max())
                 pullback_to_ema20 = abs(current_price - ema_20_val) / ema_20_val < 0.002
                 pullback_to_ema50 = abs(current_price - ema_50_val) / ema_50_val < 0.002
 
@@ -119,21 +146,46 @@ class TrendFollowingStrategy(BaseStrategy):
                     )
 
         except Exception as e:
-            logger.error(f"Error in Trend Following analysis: {e}", exc_info=True)
+            self._errors.error(f"Error in Trend Following analysis: {e}", e)
 
         return None
 
-    def _calculate_atr(self, bars: pl.DataFrame, period: int = 14) -> Optional[float]:
+    def _ema_values(self, symbol: str, bars: pl.DataFrame, close: np.ndarray) -> np.ndarray:
+        """
+        EMAs over ``bars`` for ``EMA_SPANS`` (``len(bars) >= 3``).
+
+        The completed bars before the latest are folded into a per-symbol
+        ``_WindowEma``, advanced by one push when exactly one bar was
+        appended since the last call and rebuilt otherwise. The latest bar
+        is read fresh, since it may still be forming.
+        """
+        if "timestamp" not in bars.columns:
+            return ema_tails(close, EMA_SPANS)
+
+        ts = bars.get_column("timestamp").to_numpy()
+        n = len(close)
+        state = self._ema.get(symbol)
+        if state is None or state.last_ts != ts[-2] or state.m != n - 1:
+            if state is not None and state.last_ts == ts[-3] and state.m in (n - 1, n - 2):
+                # One new bar: the previous latest is now complete; the window
+                # slid if its length held, else it grew
+                state.push(close[-2], slide=state.m == n - 1, first=close[0])
+            else:
+                state = self._ema[symbol] = _WindowEma(EMA_SPANS, close[:-1])
+            state.last_ts = ts[-2]
+
+        return state.values(close[-1])
+
+    def _calculate_atr(self, bars: Bars, period: int = 14) -> Optional[float]:
         """Calculate Average True Range."""
-        if len(bars) < period + 1:
+        if len(bars.close) < period + 1:
             return None
 
-        high_low = bars["high"] - bars["low"]
-        high_close = (bars["high"] - bars["close"].shift(1)).abs()
-        low_close = (bars["low"] - bars["close"].shift(1)).abs()
-
-        tr = pl.concat([high_low, high_close, low_close], how="horizontal").max(axis=1)
-        atr = tr.rolling_mean(period).tail(1).item()
+        # True range of the last `period` bars only; that's all the mean needs
+        high = bars.high[-period:]
+        low = bars.low[-period:]
+        prev_close = bars.close[-period - 1:-1]
 
-        return atr
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        return float(tr.mean())
 
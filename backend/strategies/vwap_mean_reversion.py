@@ -2,10 +2,11 @@
 
 from typing import Optional
 
+import numpy as np
 import polars as pl
-from loguru import logger
 
-from strategies.base_strategy import BaseStrategy, TradingSignal
+from ml.indicator_kernels import rsi_wilder
+from strategies.base_strategy import Bars, BaseStrategy, TradingSignal
 
 
 class VWAPMeanReversionStrategy(BaseStrategy):
@@ -38,27 +39,30 @@ class VWAPMeanReversionStrategy(BaseStrategy):
             return None
 
         try:
+            soa = self._to_soa(bars)
+            close = soa.close
+
             # Calculate VWAP (Volume Weighted Average Price)
-            vwap = self._calculate_vwap(bars)
+            vwap = self._calculate_vwap(soa)
 
             # Calculate RSI(14)
-            rsi = self._calculate_rsi(bars["close"], period=14)
+            current_rsi = self._calculate_rsi(close, period=14)
 
             # Calculate ATR(14)
-            atr = self._calculate_atr(bars, period=14)
+            atr = self._calculate_atr(soa, period=14)
 
-            if vwap is None or rsi is None or atr is None:
+            if vwap is None or current_rsi is None or atr is None:
                 return None
 
-            current_price = bars["close"].tail(1).item()
-            current_rsi = rsi.tail(1).item()
+            current_price = float(close[-1])
 
             # Check for pullback to VWAP
             price_diff_pct = abs(current_price - vwap) / vwap * 100
 
             # Long setup: Price near VWAP from above, RSI oversold
             if (
-                current_price <= vwap * 1.001  # Within 0.1% of VWAP
+                self.allow_long
+                and current_price <= vwap * 1.001  # Within 0.1% of VWAP
                 and current_rsi < 40  # Oversold
                 and price_diff_pct < 0.2  # Close to VWAP
             ):
@@ -79,7 +83,8 @@ class VWAPMeanReversionStrategy(BaseStrategy):
 
             # Short setup: Price near VWAP from below, RSI overbought
             elif (
-                current_price >= vwap * 0.999  # Within 0.1% of VWAP
+                self.allow_short
+                and current_price >= vwap * 0.999  # Within 0.1% of VWAP
                 and current_rsi > 60  # Overbought
                 and price_diff_pct < 0.2  # Close to VWAP
             ):
@@ -99,47 +104,41 @@ class VWAPMeanReversionStrategy(BaseStrategy):
                 )
 
         except Exception as e:
-            logger.error(f"Error in VWAP Mean Reversion analysis: {e}", exc_info=True)
+            self._errors.error(f"Error in VWAP Mean Reversion analysis: {e}", e)
 
         return None
 
-    def _calculate_vwap(self, bars: pl.DataFrame) -> Optional[float]:
+    def _calculate_vwap(self, bars: Bars) -> Optional[float]:
         """Calculate Volume Weighted Average Price."""
-        if "volume" not in bars.columns:
+        if bars.volume is None:
             return None
 
-        typical_price = (bars["high"] + bars["low"] + bars["close"]) / 3
-        vwap = (typical_price * bars["volume"]).sum() / bars["volume"].sum()
-        return vwap.item()
+        # Sum of (h + l + c) * v as one dot product; the /3 is applied once at the end
+        num = np.dot(bars.high + bars.low + bars.close, bars.volume)
+        return float(num / bars.volume.sum() / 3)
 
-    def _calculate_rsi(self, prices: pl.Series, period: int = 14) -> Optional[pl.Series]:
-        """Calculate Relative Strength Index."""
+    def _calculate_rsi(self, prices: np.ndarray, period: int = 14) -> Optional[float]:
+        """Latest Wilder's Relative Strength Index (NaN for a flat window)."""
         if len(prices) < period + 1:
             return None
 
-        delta = prices.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-
-        avg_gain = gain.rolling_mean(period)
-        avg_loss = loss.rolling_mean(period)
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        # Seeded with the mean of the first `period` moves, then the two-scalar
+        # Wilder recurrence in one compiled pass
+        _, avg_gain, avg_loss = rsi_wilder(prices, period)
+        if avg_loss == 0.0:
+            return 100.0 if avg_gain > 0.0 else float("nan")
+        return 100 - (100 / (1 + avg_gain / avg_loss))
 
-        return rsi
-
-    def _calculate_atr(self, bars: pl.DataFrame, period: int = 14) -> Optional[float]:
+    def _calculate_atr(self, bars: Bars, period: int = 14) -> Optional[float]:
         """Calculate Average True Range."""
-        if len(bars) < period + 1:
+        if len(bars.close) < period + 1:
             return None
 
-        high_low = bars["high"] - bars["low"]
-        high_close = (bars["high"] - bars["close"].shift(1)).abs()
-        low_close = (bars["low"] - bars["close"].shift(1)).abs()
-
-        tr = pl.concat([high_low, high_close, low_close], how="horizontal").max(axis=1)
-        atr = tr.rolling_mean(period).tail(1).item()
+        # True range of the last `period` bars only; that's all the mean needs
+        high = bars.high[-period:]
+        low = bars.low[-period:]
+        prev_close = bars.close[-period - 1:-1]
 
-        return atr
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        return float(tr.mean())
 
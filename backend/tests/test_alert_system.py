@@ -0,0 +1,67 @@
+"""Tests for alert delivery."""
+
+import smtplib
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from config.settings import Settings
+from monitoring.alert_system import AlertSystem
+
+
+def _email_settings():
+    settings = Mock(spec=Settings)
+    settings.alert_email_enabled = True
+    settings.alert_email_smtp_host = "smtp.example.com"
+    settings.alert_email_smtp_port = 587
+    settings.alert_email_username = "bot@example.com"
+    settings.alert_email_password = "secret"
+    settings.alert_email_to = "me@example.com"
+    settings.alert_history_size = 3
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_email_alerts_reuse_smtp_session():
+    """Test that consecutive emails share one login and a dropped session is redialed."""
+    with patch("monitoring.alert_system.smtplib.SMTP") as smtp_cls:
+        server = MagicMock()
+        smtp_cls.return_value = server
+        alerts = AlertSystem(_email_settings())
+
+        await alerts.send_alert("CRITICAL", "first")
+        await alerts.send_alert("WARNING", "second")
+        await alerts.flush()
+        assert smtp_cls.call_count == 1
+        assert server.login.call_count == 1
+        assert server.send_message.call_count == 2
+
+        server.send_message.side_effect = [smtplib.SMTPServerDisconnected(), None]
+        await alerts.send_alert("CRITICAL", "third")
+        await alerts.flush()
+        assert smtp_cls.call_count == 2
+        assert server.send_message.call_count == 4
+
+        await alerts.close()
+        server.quit.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_email_alerts_are_queued_and_deduplicated():
+    """Test that send_alert doesn't wait on SMTP and repeats within the window aren't emailed."""
+    alerts = AlertSystem(_email_settings())
+    alerts._send_email = AsyncMock()
+
+    await alerts.send_alert("CRITICAL", "drawdown")
+    await alerts.send_alert("CRITICAL", "drawdown")
+    await alerts.send_alert("WARNING", "drawdown")
+    await alerts.send_alert("INFO", "not emailed")
+    alerts._send_email.assert_not_called()
+
+    await alerts.close()
+    assert [c.args[:2] for c in alerts._send_email.call_args_list] == [
+        ("CRITICAL", "drawdown"),
+        ("WARNING", "drawdown"),
+    ]
+    # Bounded to the configured size, newest kept
+    assert [a["message"] for a in alerts.alert_history] == ["drawdown", "drawdown", "not emailed"]
@@ -0,0 +1,46 @@
+"""Tests for the market data manager."""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from config.settings import Settings
+from core.data_manager import DataManager
+
+
+@pytest.mark.asyncio
+async def test_cached_tail_columns_are_zero_copy():
+    """A multi-chunk bar frame is served as one chunk, so column reads share memory."""
+    manager = DataManager(Settings())
+    first = pl.DataFrame({"close": np.arange(10.0)})
+    second = pl.DataFrame({"close": np.arange(5.0)})
+    manager.bars["MES"]["1m"] = pl.concat([first, second], rechunk=False)
+
+    tail = await manager.get_bars("MES", "1m", limit=8)
+    assert tail.n_chunks() == 1
+    assert tail["close"].to_list() == [7.0, 8.0, 9.0, 0.0, 1.0, 2.0, 3.0, 4.0]
+    assert np.shares_memory(tail["close"].to_numpy(), tail["close"].to_numpy())
+    assert await manager.get_bars("MES", "1m", limit=8) is tail
+
+
+@pytest.mark.asyncio
+async def test_ticks_resample_to_ohlcv_bars():
+    """Ticks are bucketed to bar starts and aggregated per timeframe."""
+    from datetime import datetime
+
+    manager = DataManager(Settings())
+    t0 = datetime(2024, 1, 2, 9, 30)
+    manager.tick_buffers["MES"] = [
+        {"timestamp": t0.replace(second=5), "price": 10.0},
+        {"timestamp": t0.replace(second=40), "price": 12.0},
+        {"timestamp": t0.replace(minute=31, second=1), "price": 9.0},
+    ]
+    await manager._process_ticks("MES")
+
+    one_min = manager.bars["MES"]["1m"]
+    assert one_min["bar_time"].to_list() == [t0, t0.replace(minute=31)]
+    assert one_min.select("open", "high", "low", "close", "volume").rows() == [
+        (10.0, 12.0, 10.0, 12.0, 2),
+        (9.0, 9.0, 9.0, 9.0, 1),
+    ]
+    assert manager.bars["MES"]["5m"].select("low", "high", "volume").rows() == [(9.0, 12.0, 3)]
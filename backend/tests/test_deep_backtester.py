@@ -0,0 +1,38 @@
+"""Tests for the deep backtester's multi-account runner."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backtesting.deep_backtester import DeepBacktester
+
+
+@pytest.mark.asyncio
+async def test_multi_account_backtest_runs_concurrently():
+    """Test that accounts overlap up to the semaphore and errors stay per-account."""
+    backtester = DeepBacktester.__new__(DeepBacktester)
+    backtester._api_sem = asyncio.Semaphore(2)
+    running = 0
+    peak = 0
+
+    async def fake_run_backtest(account_config, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if account_config.account_id == "bad":
+            raise RuntimeError("no data")
+        return {"account_id": account_config.account_id}
+
+    backtester.run_backtest = fake_run_backtest
+    accounts = [
+        SimpleNamespace(account_id=name, enabled_strategies=[]) for name in ("a", "b", "bad", "c")
+    ]
+    results = await backtester.run_multi_account_backtest(accounts, ["MES"], "5m", None, None)
+
+    assert list(results) == ["a", "b", "bad", "c"]
+    assert results["bad"] == {"error": "no data"}
+    assert results["c"] == {"account_id": "c"}
+    assert peak == 2
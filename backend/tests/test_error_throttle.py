@@ -0,0 +1,50 @@
+"""Tests for rate-limited loop error logging."""
+
+from loguru import logger
+
+from monitoring.error_throttle import ErrorThrottle
+
+
+def test_repeats_are_summarized():
+    """Test that only new errors and every Nth repeat are logged."""
+    messages = []
+    sink = logger.add(lambda m: messages.append(m.record["message"]))
+    try:
+        throttle = ErrorThrottle(every=3, interval=1e9, clock=lambda: 0.0)
+        for _ in range(6):
+            throttle.error("sync failed", ConnectionError("timeout"))
+        throttle.error("sync failed", ValueError("bad payload"))
+        throttle.reset()
+        throttle.error("sync failed", ValueError("bad payload"))
+    finally:
+        logger.remove(sink)
+
+    assert messages == [
+        "sync failed",
+        "sync failed (repeated 3 times)",
+        "sync failed (repeated 6 times)",
+        "sync failed",
+        "sync failed",
+    ]
+
+
+def test_braces_in_message_are_logged_with_traceback():
+    """Test that exception text with braces is logged verbatim, traceback included."""
+    records = []
+    sink = logger.add(lambda m: records.append(m.record))
+    try:
+        try:
+            {"symbol": "MES"}["side"]
+        except KeyError as e:
+            exc = ValueError(f"bad payload {{'side': None}} after {e!r}")
+            exc.__traceback__ = e.__traceback__
+        throttle = ErrorThrottle(every=2, interval=1e9, clock=lambda: 0.0)
+        throttle.error(f"Error in strategy: {exc}", exc)
+        throttle.error(f"Error in strategy: {exc}", exc)
+    finally:
+        logger.remove(sink)
+
+    assert records[0]["message"] == f"Error in strategy: {exc}"
+    assert records[0]["exception"].value is exc
+    assert records[0]["exception"].traceback is not None
+    assert records[1]["message"] == f"Error in strategy: {exc} (repeated 2 times)"
@@ -1,5 +1,6 @@
 """Unit tests for ML components."""
 
+import asyncio
 import pytest
 import numpy as np
 from unittest.mock import MagicMock, patch
@@ -65,3 +66,162 @@ def test_price_predictor():
     pred = pp.predict(data)
     assert pred == 105.0
 
+
+def test_feature_engineering_batch_matches_single(sample_bars):
+    bars_by_symbol = {"MNQ": sample_bars, "MES": sample_bars.head(30) * 0.5}
+    batch = FeatureEngineer.calculate_indicators_batch(bars_by_symbol)
+
+    assert list(batch) == ["MNQ", "MES"]
+    for symbol, bars in bars_by_symbol.items():
+        single = FeatureEngineer.calculate_indicators(bars)
+        assert batch[symbol].columns == single.columns
+        assert np.allclose(
+            batch[symbol].fill_null(0.0).to_numpy(),
+            single.fill_null(0.0).to_numpy(),
+            equal_nan=True,
+        )
+
+def test_streaming_state_matches_batch(sample_bars):
+    from ml.feature_engineering import StreamingFeatureState
+
+    state = StreamingFeatureState.from_bars(sample_bars.head(30))
+    for row in sample_bars.slice(30).iter_rows(named=True):
+        latest = state.update(row["open"], row["high"], row["low"], row["close"], row["volume"])
+
+    expected = FeatureEngineer.calculate_indicators(sample_bars).row(-1, named=True)
+    for name, value in latest.items():
+        assert value == pytest.approx(expected[name]), name
+
+def test_update_indicators_appends_rows(sample_bars):
+    from ml.feature_engineering import StreamingFeatureState
+
+    head = sample_bars.head(40)
+    df = FeatureEngineer.calculate_indicators(head)
+    state = StreamingFeatureState.from_bars(head)
+    df = FeatureEngineer.update_indicators(df, sample_bars.slice(40), state)
+
+    expected = FeatureEngineer.calculate_indicators(sample_bars)
+    assert df.columns == expected.columns
+    assert df.height == expected.height
+    assert np.allclose(
+        df.fill_null(0.0).to_numpy(), expected.fill_null(0.0).to_numpy(), equal_nan=True
+    )
+
+@pytest.mark.asyncio
+async def test_signal_validator_micro_batches():
+    """Concurrent batched validations share one predict_proba call."""
+    sv = SignalValidator()
+    sv.model = MagicMock()
+    sv.model.predict_proba.side_effect = lambda X: np.tile([0.3, 0.7], (len(X), 1))
+
+    results = await asyncio.gather(
+        *(sv.validate_signal_batched({"side": "BUY"}, {"current_price": 100}) for _ in range(5))
+    )
+    await sv.close()
+
+    assert results == [(True, pytest.approx(0.7))] * 5
+    assert sv.model.predict_proba.call_count == 1
+    assert sv.model.predict_proba.call_args[0][0].shape[0] == 5
+
+def test_signal_validator_inplace_predict_matches_predict_proba(tmp_path):
+    """The booster inplace_predict path scores like the sklearn wrapper."""
+    xgb = pytest.importorskip("xgboost")
+    import joblib
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3)).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] > 0).astype(int)
+    model = xgb.XGBClassifier(n_estimators=10, max_depth=3)
+    model.fit(X, y)
+    path = tmp_path / "validator.pkl"
+    joblib.dump({"model": model, "feature_names": ["a", "b", "c"]}, path)
+
+    sv = SignalValidator(model_path=str(path))
+    sv.load_model()
+    assert sv._booster is not None
+
+    features = [dict(zip("abc", map(float, row))) for row in X[:5]]
+    results = sv.validate_batch([{}] * 5, features)
+    expected = model.predict_proba(X[:5])[:, 1]
+    assert np.allclose([conf for _, conf in results], expected, atol=1e-6)
+
+    # Bulk scoring (multi-threaded past BULK_ROWS_PER_THREAD rows) agrees too
+    sv.BULK_ROWS_PER_THREAD = 50
+    assert np.allclose(sv.score_batch(X), model.predict_proba(X)[:, 1], atol=1e-6)
+    assert np.allclose(sv.score_batch(X[:5]), expected, atol=1e-6)
+
+
+def test_signal_validator_rejects_mismatched_model(tmp_path):
+    """A saved model whose input width disagrees with its feature names isn't loaded."""
+    xgb = pytest.importorskip("xgboost")
+    import joblib
+
+    model = xgb.XGBClassifier(n_estimators=2)
+    model.fit(np.random.default_rng(0).normal(size=(20, 3)).astype(np.float32), np.arange(20) % 2)
+    path = tmp_path / "validator.pkl"
+    joblib.dump({"model": model, "feature_names": ["a", "b"], "feature_dtype": "float32"}, path)
+
+    sv = SignalValidator(model_path=str(path))
+    sv.load_model()
+    assert sv.model is None
+
+
+def test_signal_validator_caches_recent_results():
+    """Inputs equal after rounding reuse the previous result."""
+    sv = SignalValidator()
+    sv.model = MagicMock()
+    sv.model.predict_proba.return_value = np.array([[0.3, 0.7]])
+
+    first = sv.validate_signal({"side": "BUY"}, {"current_price": 100.0, "rsi_14": 50.0001})
+    second = sv.validate_signal({"side": "BUY"}, {"current_price": 100.0, "rsi_14": 50.0002})
+    assert first == second
+    assert sv.model.predict_proba.call_count == 1
+    assert (sv.cache_hits, sv.cache_misses) == (1, 1)
+
+    sv.validate_signal({"side": "BUY"}, {"current_price": 100.0, "rsi_14": 51.0})
+    assert sv.model.predict_proba.call_count == 2
+
+
+def test_signal_validator_defaults_on_bad_input():
+    """Unencodable features and model failures both fall back to accepting."""
+    sv = SignalValidator()
+    sv.model = MagicMock()
+    assert sv.validate_signal({"side": "BUY"}, {"current_price": "n/a"}) == (True, 0.5)
+    sv.model.predict_proba.assert_not_called()
+
+    sv.model.predict_proba.side_effect = RuntimeError("boom")
+    assert sv.validate_signal({"side": "BUY"}, {"current_price": 100.0}) == (True, 0.5)
+
+
+def test_signal_validator_reads_trading_signal_directly():
+    """A TradingSignal encodes to the same features as its dict form."""
+    from dataclasses import asdict
+
+    from strategies.base_strategy import TradingSignal
+
+    sv = SignalValidator()
+    signal = TradingSignal("MES", "SELL", 5000.0, 5010.0, 4980.0, confidence=0.8)
+    features = {"current_price": 5001.0}
+    assert sv._signal_values(signal, features) == sv._signal_values(asdict(signal), features)
+    # Without a model the signal's own confidence is passed through
+    assert sv.validate_signal_obj(signal, features) == (True, 0.8)
+
+
+def test_lazy_features_extract_on_first_read(sample_bars):
+    """LazyFeatures defers extract_features until read, and survives asdict."""
+    from dataclasses import asdict
+    from unittest.mock import patch
+
+    from ml.feature_engineering import FeatureEngineer, LazyFeatures
+    from strategies.base_strategy import TradingSignal
+
+    bars = FeatureEngineer.calculate_indicators(sample_bars)
+    with patch.object(FeatureEngineer, "extract_features", wraps=FeatureEngineer.extract_features) as extract:
+        features = LazyFeatures(bars)
+        signal = TradingSignal("MES", "BUY", 100.0, 99.0, 102.0, metadata={"market_features": features})
+        assert asdict(signal)["metadata"]["market_features"] is features
+        assert extract.call_count == 0
+
+        assert features["current_price"] == FeatureEngineer.extract_features(bars)["current_price"]
+        assert features.get("missing", 1.0) == 1.0 and len(features) > 0
+        assert extract.call_count == 2
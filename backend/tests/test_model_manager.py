@@ -0,0 +1,51 @@
+"""Tests for the model registry."""
+
+import json
+
+import pytest
+
+from ml.model_manager import ModelManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Manager with its own models directory."""
+    return ModelManager(models_dir=str(tmp_path / "models"))
+
+
+def test_register_and_activate(manager, tmp_path):
+    """Test that the latest version is used until one is activated."""
+    artifact = tmp_path / "model.json"
+    artifact.write_text("{}")
+
+    assert manager.get_active_model_path("validator") is None
+    manager.register_model("validator", str(artifact), metrics={"auc": 0.6}, version="v1")
+    manager.register_model("validator", str(artifact), version="v2")
+    assert manager.get_active_model_path("validator").endswith("validator_v2.json")
+
+    manager.set_active_version("validator", "v1")
+    assert manager.get_active_model_path("validator").endswith("validator_v1.json")
+    versions = manager.list_versions("validator")
+    assert [(v["version"], v["active"]) for v in versions] == [("v1", True), ("v2", False)]
+    assert versions[0]["metrics"] == {"auc": 0.6}
+
+    with pytest.raises(ValueError):
+        manager.set_active_version("validator", "v3")
+    with pytest.raises(ValueError):
+        manager.set_active_version("missing", "v1")
+    assert manager.get_active_model_path("validator").endswith("validator_v1.json")
+
+
+def test_imports_legacy_json_registry(tmp_path):
+    """Test that an existing registry.json is migrated on first use."""
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "registry.json").write_text(json.dumps({
+        "ppo": [
+            {"version": "a", "timestamp": "t1", "path": "ppo_a.zip", "metrics": {}, "active": True},
+            {"version": "b", "timestamp": "t2", "path": "ppo_b.zip", "metrics": {}, "active": False},
+        ]
+    }))
+
+    manager = ModelManager(models_dir=str(models_dir))
+    assert manager.get_active_model_path("ppo") == "ppo_a.zip"
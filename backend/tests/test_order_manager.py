@@ -0,0 +1,80 @@
+"""Tests for order storage and management."""
+
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from config.settings import Settings
+from core.order_manager import OrderManager, OrderSignal, OrderTable
+
+
+def test_order_table_add_and_view():
+    """Test that rows added to the table read back through the Order view."""
+    table = OrderTable(capacity=2)
+    table.add("A", "MNQ", "BUY", "MARKET", 1)
+    table.add("B", "MES", "SELL", "LIMIT", 2, price=5000.25)
+    table.add("C", "MNQ", "BUY", "STOP_MARKET", 3, stop_price=17000.0)
+
+    assert len(table) == 3
+    order = table.get_row("B")
+    assert order.symbol == "MES"
+    assert order.side == "SELL"
+    assert order.order_type == "LIMIT"
+    assert order.quantity == 2
+    assert order.price == 5000.25
+    assert order.stop_price is None
+    assert order.status == "PENDING"
+    assert table.get_row("missing") is None
+
+
+def test_order_table_filters():
+    """Test status and symbol masks."""
+    table = OrderTable()
+    table.add("A", "MNQ", "BUY", "MARKET", 1, status="FILLED")
+    table.add("B", "MES", "SELL", "MARKET", 1)
+    table.add("C", "MNQ", "SELL", "MARKET", 1)
+
+    assert table.cancel("C")
+    assert not table.cancel("missing")
+
+    assert np.array_equal(table.filter_status("FILLED"), [True, False, False])
+    assert np.array_equal(table.filter_status("CANCELLED"), [False, False, True])
+    assert np.array_equal(table.filter_symbol("MNQ"), [True, False, True])
+    assert [o.order_id for o in table.rows(table.filter_status("PENDING"))] == ["B"]
+
+
+@pytest.mark.asyncio
+async def test_execute_signal_paper_mode():
+    """Test that paper signals are recorded as filled orders."""
+    settings = Mock(spec=Settings)
+    settings.paper_trading_mode = True
+    risk_manager = Mock()
+    risk_manager.check_trade_risk = AsyncMock(return_value=True)
+    risk_manager.calculate_position_size = AsyncMock(return_value=2)
+    manager = OrderManager(settings, Mock(), risk_manager, Mock())
+
+    order_id = await manager.execute_signal(
+        {"symbol": "MNQ", "side": "BUY", "entry_price": 17000.0, "stop_loss": 16990.0}
+    )
+    order = manager.get_order(order_id)
+    assert order.status == "FILLED"
+    assert order.quantity == 2
+    assert order.fill_price == 17000.0
+
+    typed = OrderSignal(symbol="MES", side="SELL")
+    order_id = await manager.execute_signal(typed)
+    assert manager.get_order(order_id).side == "SELL"
+    # Typed signals reach the risk manager as-is, not converted to a dict
+    assert risk_manager.calculate_position_size.call_args.args[0] is typed
+    assert len(manager.get_orders_by_status("FILLED")) == 2
+
+
+def test_order_signal_from_trading_signal():
+    """Test that a strategy signal converts to an OrderSignal without a payload dict."""
+    from strategies.base_strategy import TradingSignal
+
+    signal = TradingSignal("MES", "BUY", 5000.0, 4990.0, 5020.0, order_type="LIMIT")
+    assert OrderSignal.from_signal(signal) == OrderSignal(
+        symbol="MES", side="BUY", order_type="LIMIT", entry_price=5000.0, stop_loss=4990.0
+    )
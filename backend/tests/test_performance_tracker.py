@@ -0,0 +1,65 @@
+"""Tests for performance metrics."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from config.settings import Settings
+from monitoring.performance_tracker import PerformanceTracker
+
+
+def _record(tracker, pnls):
+    for i, pnl in enumerate(pnls):
+        tracker.record_trade(f"T{i}", "MNQ", "BUY", 100.0, 101.0, 1, pnl, "test")
+
+
+def test_win_rate_and_profit_factor_over_recent_trades():
+    """Test that metrics only look at the last period_days trades."""
+    tracker = PerformanceTracker(Mock(spec=Settings))
+    assert tracker.get_win_rate() == 0.0
+    assert tracker.get_profit_factor() == 0.0
+
+    _record(tracker, [-50.0, 30.0, -10.0, 20.0, 0.0])
+
+    assert tracker.get_win_rate() == pytest.approx(2 / 5)
+    assert tracker.get_profit_factor() == pytest.approx(50.0 / 60.0)
+    assert tracker.get_win_rate(period_days=4) == pytest.approx(2 / 4)
+    assert tracker.get_profit_factor(period_days=4) == pytest.approx(50.0 / 10.0)
+    assert tracker.get_daily_pnl() == pytest.approx(-10.0)
+    assert tracker.get_metrics()["total_trades"] == 5
+
+
+def test_trade_columns_grow():
+    """Test recording past the initial capacity."""
+    tracker = PerformanceTracker(Mock(spec=Settings))
+    n = PerformanceTracker.INITIAL_CAPACITY + 10
+    _record(tracker, [1.0 if i % 2 else -1.0 for i in range(n)])
+
+    assert tracker.get_metrics()["total_trades"] == n
+    assert tracker.get_win_rate(period_days=n) == pytest.approx(0.5)
+    assert tracker.get_trades_today() == n
+    assert list(tracker.daily_stats.values())[0]["trades"] == n
+
+
+def test_rolling_aggregates_match_recomputation():
+    """Test the incremental default-window metrics against a full rescan."""
+    tracker = PerformanceTracker(Mock(spec=Settings))
+    pnls = [((i * 37) % 11 - 5) * 10.0 for i in range(100)]
+
+    for i, pnl in enumerate(pnls):
+        _record(tracker, [pnl])
+        recent = pnls[max(0, i + 1 - 30) : i + 1]
+        wins = sum(p > 0 for p in recent)
+        gross_loss = -sum(p for p in recent if p < 0)
+        assert tracker.get_win_rate() == pytest.approx(wins / len(recent))
+        expected_pf = sum(p for p in recent if p > 0) / gross_loss if gross_loss else 0.0
+        assert tracker.get_profit_factor() == pytest.approx(expected_pf)
+
+
+def test_profit_factor_is_zero_once_losses_leave_the_window():
+    """Test that rounding residue from evicted losses doesn't read as a tiny gross loss."""
+    tracker = PerformanceTracker(Mock(spec=Settings))
+    _record(tracker, [-0.1, -0.2] + [5.0] * 30)
+
+    assert tracker.get_profit_factor() == 0.0
+    assert tracker.get_profit_factor(29) == 0.0
@@ -0,0 +1,37 @@
+"""Tests for position sizing."""
+
+import numpy as np
+import pytest
+
+from risk.position_sizer import PositionSizer
+
+
+def test_kelly_and_fixed_fractional():
+    """Test the scalar sizing helpers."""
+    assert PositionSizer.kelly_criterion(0.55, 100.0, 100.0) == pytest.approx(0.1)
+    assert PositionSizer.kelly_criterion(0.9, 300.0, 100.0) == 0.25
+    assert PositionSizer.kelly_criterion(0.2, 100.0, 100.0) == 0.0
+    assert PositionSizer.kelly_criterion(0.5, 100.0, 0.0) == 0.0
+
+    assert PositionSizer.fixed_fractional(50_000.0, 0.015, 100.0) == 7
+    assert PositionSizer.fixed_fractional(1_000.0, 0.015, 100.0) == 1
+    assert PositionSizer.fixed_fractional(50_000.0, 0.015, 0.0) == 0
+
+
+def test_calculate_from_signals_matches_scalar():
+    """Test the vectorized sweep against calculate_from_signal."""
+    signals = [
+        {"symbol": "MES", "entry_price": 5000.0, "stop_loss": 4990.0},
+        {"symbol": "MNQ", "entry_price": 17000.0, "stop_loss": 17025.0},
+        {"symbol": "MGC", "entry_price": 2000.0, "stop_loss": 0},
+        {"symbol": "MGC", "entry_price": 2000.0, "stop_loss": 2000.0},
+    ]
+    contracts = PositionSizer.calculate_from_signals(
+        np.array([s["entry_price"] for s in signals]),
+        np.array([s["stop_loss"] for s in signals]),
+        PositionSizer.tick_values_for([s["symbol"] for s in signals]),
+        50_000.0,
+    )
+    expected = [PositionSizer.calculate_from_signal(s, 50_000.0) for s in signals]
+    assert contracts.tolist() == expected == [15, 15, 0, 0]
+    assert PositionSizer.tick_values_for(["MNQ", "XYZ"]).tolist() == [2.0, 1.0]
@@ -0,0 +1,149 @@
+"""Tests for position tracking and P&L."""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from config.settings import Settings
+from core.position_tracker import PositionTracker
+
+
+@pytest.fixture
+def tracker():
+    """Tracker synced with one long MNQ, one short MNQ and one long MES position."""
+    api_client = Mock()
+    api_client.get_open_positions = AsyncMock(return_value=[
+        {"position_id": "1", "symbol": "MNQ", "side": "LONG", "quantity": 2,
+         "entry_price": 100.0, "current_price": 100.0, "unrealized_pnl": None},
+        {"position_id": "2", "symbol": "MNQ", "side": "SHORT", "quantity": 1,
+         "entry_price": 110.0, "current_price": 110.0, "unrealized_pnl": None},
+        {"position_id": "3", "symbol": "MES", "side": "LONG", "quantity": 1,
+         "entry_price": 50.0, "current_price": 50.0, "unrealized_pnl": None},
+    ])
+    return PositionTracker(Mock(spec=Settings), api_client)
+
+
+@pytest.mark.asyncio
+async def test_update_price_recomputes_symbol_pnl(tracker):
+    """Test that a price update only touches positions in that symbol."""
+    await tracker.sync_positions()
+    tracker.update_price("MNQ", 105.0)
+
+    positions = {p["position_id"]: p for p in await tracker.get_open_positions()}
+    assert positions["1"]["unrealized_pnl"] == 5.0 * 2.0 * 2
+    assert positions["2"]["unrealized_pnl"] == 5.0 * 2.0
+    assert positions["3"]["unrealized_pnl"] == 0.0
+    assert positions["3"]["current_price"] == 50.0
+    assert tracker.get_total_unrealized_pnl() == 30.0
+
+
+@pytest.mark.asyncio
+async def test_sync_removes_closed_positions(tracker):
+    """Test that positions missing from the API are dropped."""
+    await tracker.sync_positions()
+    tracker.api_client.get_open_positions.return_value = (
+        tracker.api_client.get_open_positions.return_value[2:]
+    )
+    await tracker.sync_positions()
+    tracker.update_price("MNQ", 105.0)
+
+    positions = await tracker.get_open_positions()
+    assert [p["position_id"] for p in positions] == ["3"]
+    assert tracker.get_total_unrealized_pnl() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_position_views_follow_columns(tracker):
+    """Test that Position views read through to the tracker's arrays."""
+    await tracker.sync_positions()
+    position = tracker.positions["2"]
+    opened_at = position.opened_at
+    tracker.update_price("MNQ", 100.0)
+
+    assert position.side == "SHORT"
+    assert position.current_price == 100.0
+    assert position.unrealized_pnl == 10.0 * 2.0
+
+    await tracker.sync_positions()
+    assert tracker.positions["2"].opened_at == opened_at
+
+
+@pytest.mark.asyncio
+async def test_sync_reports_changes_and_stop_cancels_loop(tracker):
+    """Test change detection and that stop() awaits the background sync task."""
+    assert await tracker.sync_positions() is True
+    assert await tracker.sync_positions() is False
+
+    await tracker.start()
+    task = tracker._sync_task
+    await tracker.stop()
+    assert task.done()
+    assert tracker._sync_task is None
+
+
+@pytest.mark.asyncio
+async def test_sync_patches_marks_without_rebuild(tracker):
+    """Test that a mark-only change updates prices but keeps the same records."""
+    await tracker.sync_positions()
+    arr = tracker._arr
+    payload = [dict(p) for p in tracker.api_client.get_open_positions.return_value]
+    payload[0]["current_price"] = 101.0
+    payload[0]["unrealized_pnl"] = 4.0
+    tracker.api_client.get_open_positions.return_value = payload
+
+    assert await tracker.sync_positions() is False
+    assert tracker._arr is arr
+    assert tracker.positions["1"].current_price == 101.0
+    assert tracker.get_total_unrealized_pnl() == 4.0
+
+
+@pytest.mark.asyncio
+async def test_positions_json_cached_until_change(tracker):
+    """Test that the JSON snapshot is reused until a price update."""
+    await tracker.sync_positions()
+    encoded = tracker.get_open_positions_json()
+    assert json.loads(encoded) == await tracker.get_open_positions()
+    assert tracker.get_open_positions_json() is encoded
+
+    tracker.update_price("MES", 51.0)
+    assert json.loads(tracker.get_open_positions_json())[2]["current_price"] == 51.0
+
+
+@pytest.mark.asyncio
+async def test_open_positions_are_copies(tracker):
+    """Test that mutating returned positions leaves the cached snapshot intact."""
+    await tracker.sync_positions()
+    positions = await tracker.get_open_positions()
+    positions[0]["current_price"] = -1.0
+    assert (await tracker.get_open_positions())[0]["current_price"] != -1.0
+    assert json.loads(tracker.get_open_positions_json())[0]["current_price"] != -1.0
+
+
+@pytest.mark.asyncio
+async def test_change_listeners_notified(tracker):
+    """Test that listeners hear about syncs and price updates."""
+    listener = Mock()
+    tracker.add_change_listener(listener)
+    await tracker.sync_positions()
+    assert listener.call_count == 1
+
+    tracker.update_price("MES", 51.0)
+    tracker.update_price("ES", 1.0)  # no positions in ES
+    assert listener.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_symbol_ids_cover_only_open_positions(tracker):
+    """Test that symbols of closed positions don't use up record symbol IDs."""
+    api = tracker.api_client.get_open_positions
+    for i in range(300):
+        api.return_value = [
+            {"position_id": "keep", "symbol": "MES", "side": "LONG", "quantity": 1, "entry_price": 50.0},
+            {"position_id": f"p{i}", "symbol": f"CON.F.US.X{i}", "side": "SHORT", "quantity": 1,
+             "entry_price": 10.0},
+        ]
+        await tracker.sync_positions()
+
+    assert len(tracker._id_to_sym) == 2
+    assert {p.symbol for p in tracker.positions.values()} == {"MES", "CON.F.US.X299"}
@@ -0,0 +1,146 @@
+"""Tests for the central risk manager."""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from config.settings import Settings
+from risk._clock import _now_bucket
+from risk.risk_manager import RiskManager, symbol_id
+from risk.rule_compliance import RuleCompliance
+
+
+@pytest.fixture
+def risk_manager():
+    RiskManager._instance = None
+    settings = Settings()
+    position_tracker = Mock()
+    position_tracker.get_total_unrealized_pnl.return_value = 0.0
+    yield RiskManager(settings, position_tracker)
+    RiskManager._instance = None
+
+
+def _at_ct(*args):
+    """Patch the shared clock's wall time to a CT datetime."""
+    when = datetime(*args, tzinfo=ZoneInfo("America/Chicago"))
+    return patch("risk._clock._time.time", return_value=when.timestamp())
+
+
+def test_window_state_cached_within_minute(risk_manager):
+    """Test that the CT session flags are computed once per minute."""
+    _now_bucket.cache_clear()
+    with _at_ct(2024, 3, 5, 14, 44, 30):
+        assert risk_manager._window_state()[:2] == (True, False)
+    with _at_ct(2024, 3, 5, 14, 44, 50):
+        assert risk_manager._is_trading_hours()
+        assert not risk_manager._is_near_market_close()
+    assert _now_bucket.cache_info().misses == 1
+
+    # Past the minute boundary the window is re-evaluated
+    with _at_ct(2024, 3, 5, 14, 45, 0):
+        assert risk_manager._window_state()[:2] == (True, True)
+    with _at_ct(2024, 3, 5, 15, 30, 0):
+        assert risk_manager._window_state()[:2] == (False, True)
+        assert _now_bucket.cache_info().misses == 3
+        assert RuleCompliance(risk_manager.settings).check_time_restriction() == (
+            True,
+            "Market closed - hard close time (3:05 PM CT)",
+        )
+
+
+@pytest.mark.asyncio
+async def test_calculate_position_size(risk_manager):
+    """Test sizing, missing prices, and that malformed input raises."""
+    signal = {"symbol": "MES", "entry_price": 5000.0, "stop_loss": 4999.0}
+    expected = min(
+        int(risk_manager.settings.account_size * risk_manager._risk_pct / 5.0),
+        risk_manager._get_max_contracts_for_balance(risk_manager.settings.account_size),
+        risk_manager.settings.max_position_size,
+    )
+    assert await risk_manager.calculate_position_size(signal) == max(
+        expected, risk_manager.settings.min_position_size
+    )
+    assert await risk_manager.calculate_position_size({"symbol": "MES", "entry_price": None}) == 0
+    # One missing price must not turn into a stop distance of the whole price level
+    assert await risk_manager.calculate_position_size(
+        {"symbol": "MES", "entry_price": None, "stop_loss": 20.0}
+    ) == 0
+    assert await risk_manager.calculate_position_size({"symbol": "MES", "entry_price": 20.0}) == 0
+    # A precomputed symbol id sizes the same as the symbol string
+    by_id = {"symbol_id": symbol_id("MES"), "entry_price": 5000.0, "stop_loss": 4999.0}
+    assert await risk_manager.calculate_position_size(by_id) == await risk_manager.calculate_position_size(signal)
+    # Signal objects are read by attribute, without building a dict
+    from core.order_manager import OrderSignal
+
+    typed = OrderSignal(symbol="MES", side="BUY", entry_price=5000.0, stop_loss=4999.0)
+    assert await risk_manager.calculate_position_size(typed) == await risk_manager.calculate_position_size(signal)
+    assert risk_manager._get_tick_value("MNQ") == 2.0
+    assert risk_manager._get_tick_value("ES") == 1.0
+
+    with pytest.raises(TypeError):
+        await risk_manager.calculate_position_size({"entry_price": "x", "stop_loss": 1.0})
+
+
+@pytest.mark.asyncio
+async def test_can_trade_halts_on_threshold(risk_manager):
+    """Test that a breached threshold halts trading once and stays halted."""
+    stack = _at_ct(2024, 3, 5, 10, 0, 0)
+    stack.start()
+    # Clear of the drawdown buffer, which trips within 5% of the floor
+    risk_manager.total_pnl = 0.1 * risk_manager.settings.account_size
+    assert risk_manager._evaluate_trading_state() == (True, None)
+    assert await risk_manager.can_trade()
+
+    risk_manager.consecutive_losses = 3
+    assert risk_manager._evaluate_trading_state() == (False, "3 consecutive losses - circuit breaker")
+    assert not risk_manager.trading_halted
+    assert not await risk_manager.can_trade()
+    assert risk_manager.trading_halted
+    assert risk_manager._evaluate_trading_state() == (False, None)
+    stack.stop()
+
+
+def test_update_pnl_is_synchronous(risk_manager):
+    """Test that P&L updates apply immediately without awaiting."""
+    risk_manager.update_pnl(-100.0)
+    risk_manager.update_pnl(250.0)
+    assert risk_manager.daily_pnl == 150.0
+    assert risk_manager.consecutive_losses == 0
+    assert risk_manager.high_water_mark == risk_manager.settings.account_size + 150.0
+
+
+@pytest.mark.asyncio
+async def test_balance_cached_until_invalidated(risk_manager):
+    """Test that unrealized P&L is read once per position change."""
+    tracker = risk_manager.position_tracker
+    tracker.add_change_listener.assert_called_once_with(risk_manager.invalidate_balance)
+    signal = {"symbol": "MES", "entry_price": 5000.0, "stop_loss": 4999.0}
+
+    await risk_manager.calculate_position_size(signal)
+    await risk_manager.calculate_position_size(signal)
+    assert tracker.get_total_unrealized_pnl.call_count == 1
+
+    risk_manager.invalidate_balance()
+    tracker.get_total_unrealized_pnl.return_value = -500.0
+    assert risk_manager._current_balance() == risk_manager.settings.account_size - 500.0
+
+    risk_manager.update_pnl(100.0)
+    assert risk_manager._current_balance() == risk_manager.settings.account_size - 400.0
+    assert tracker.get_total_unrealized_pnl.call_count == 3
+
+
+def test_thresholds_follow_pnl(risk_manager):
+    """Test that the precomputed thresholds track P&L updates."""
+    settings = risk_manager.settings
+    risk_manager.update_pnl(-settings.daily_loss_limit * 0.5)
+    assert risk_manager._remaining_daily_risk == pytest.approx(settings.daily_loss_limit * 0.5 * 0.8)
+
+    assert risk_manager._drawdown_halt_balance == pytest.approx(
+        (settings.account_size - settings.max_drawdown_limit) * 1.05
+    )
+
+    with _at_ct(2024, 3, 5, 10, 0, 0):
+        risk_manager.update_pnl(-settings.daily_loss_limit * 0.45)
+        assert risk_manager._evaluate_trading_state() == (False, "Approaching daily loss limit")
@@ -0,0 +1,19 @@
+"""Tests for Topstep rule checks."""
+
+from unittest.mock import Mock
+
+from risk.rule_compliance import RuleCompliance
+
+
+def test_scaling_plan_tiers():
+    """Test range and open-ended tiers, gaps, and reuse of the parsed plan."""
+    compliance = RuleCompliance(Mock(timezone="America/Chicago"))
+    plan = {"1500-3000": 3, "0-1500": 2, "5000+": 5, "3000-4000": 4}
+
+    limits = [compliance._get_max_contracts_from_plan(b, plan) for b in (0, 1500, 3999, 4500, 5000, 1e9)]
+    # 4500 falls in the gap between tiers and gets the smallest limit
+    assert limits == [2, 3, 4, 2, 5, 5]
+    assert len(compliance._plan_cache) == 1
+
+    assert compliance.check_scaling_plan(2000, 4, plan)[0]
+    assert not compliance.check_scaling_plan(2000, 3, plan)[0]
@@ -0,0 +1,73 @@
+"""Tests for the Topstep rule simulator."""
+
+import numpy as np
+
+from backtesting.simulator import TopstepSimulator
+from config.settings import Settings
+
+
+def test_vectorized_checks_match_scalar_checks():
+    """Test that the array rule checks agree with the per-day checks."""
+    simulator = TopstepSimulator(Settings())
+    daily_pnls = np.array([-960.0, 100.0, 250.0])
+    balances = np.array([48000.0, 49000.0, 50500.0])
+    high_water_marks = np.array([50000.0, 50000.0, 50500.0])
+    best_day_profits = np.array([100.0, 900.0, 200.0])
+    total_profits = np.array([0.0, 1000.0, 1000.0])
+
+    checks = simulator.vectorized_checks(
+        daily_pnls, balances, high_water_marks, best_day_profits, total_profits
+    )
+
+    for i in range(len(daily_pnls)):
+        assert checks["daily_violation"][i] == simulator.check_daily_loss_limit(daily_pnls[i], [])[0]
+        assert (
+            checks["drawdown_violation"][i]
+            == simulator.check_trailing_drawdown(balances[i], high_water_marks[i])[0]
+        )
+        assert (
+            checks["consistency_violation"][i]
+            == simulator.check_consistency_rule(best_day_profits[i], total_profits[i])[0]
+        )
+
+
+def test_run_equity_curve():
+    """Test balances, high-water mark and first drawdown violation."""
+    simulator = TopstepSimulator(Settings())
+    balances, high_water, first_violation = simulator.run_equity_curve(
+        np.array([500.0, -1000.0, -1600.0, 200.0]), 50000.0
+    )
+
+    assert np.allclose(balances, [50500.0, 49500.0, 47900.0, 48100.0])
+    assert np.allclose(high_water, [50500.0, 50500.0, 50500.0, 50500.0])
+    assert first_violation == 2
+
+    _, _, first_violation = simulator.run_equity_curve(np.array([100.0, -50.0]), 50000.0)
+    assert first_violation == -1
+
+
+def test_simulate_replay_groups_trades_by_exit_day():
+    """Test that a replay is split into days and every rule is checked across them."""
+    from datetime import datetime
+
+    simulator = TopstepSimulator(Settings())
+    day = lambda d: datetime(2024, 1, d, 10, 0)
+    trades = [
+        {"pnl": 300.0, "exit_time": day(2)},
+        {"pnl": 200.0, "exit_time": day(2)},
+        {"pnl": -2500.0, "exit_time": day(3)},
+        {"pnl": 100.0, "exit_time": day(4)},
+    ]
+    result = simulator.simulate_replay(trades, 50000.0)
+
+    assert result["trading_days"] == 3
+    assert np.allclose(result["daily_pnls"], [500.0, -2500.0, 100.0])
+    assert np.allclose(result["balances"], [50500.0, 48000.0, 48100.0])
+    # Day 2 loses more than the daily limit and falls below the trailing floor
+    assert result["daily_violation"] and result["daily_violation_msg"].startswith("Daily loss")
+    assert result["drawdown_violation"] == (48000.0 <= 50500.0 - simulator.max_drawdown_limit)
+    assert np.array_equal(result["checks"]["daily_violation"], [False, True, False])
+
+    empty = simulator.simulate_replay([], 50000.0)
+    assert empty["trading_days"] == 0 and not empty["drawdown_violation"]
+    assert empty["final_balance"] == 50000.0
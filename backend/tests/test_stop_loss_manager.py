@@ -0,0 +1,32 @@
+"""Tests for stop loss / take profit helpers."""
+
+import numpy as np
+
+from risk.stop_loss_manager import StopLossManager
+
+
+def test_batch_methods_match_scalar():
+    """Test that the array variants agree with the scalar methods."""
+    rng = np.random.default_rng(0)
+    n = 200
+    entry = rng.uniform(4000, 5000, n)
+    atr = rng.uniform(1, 20, n)
+    current = entry + rng.normal(0, 30, n)
+    side = rng.choice(["BUY", "SELL"], n)
+    trail_side = np.where(side == "BUY", "LONG", "SHORT")
+
+    stops = StopLossManager.calculate_atr_stop_batch(entry, atr, side)
+    targets = StopLossManager.calculate_take_profit_batch(entry, stops, side)
+    trail = StopLossManager.should_trail_stop_batch(current, entry, stops, side)
+    trailing = StopLossManager.calculate_trailing_stop_batch(current + 5, current - 5, trail_side, atr)
+
+    for i in range(n):
+        assert stops[i] == StopLossManager.calculate_atr_stop(entry[i], atr[i], side[i])
+        assert np.isclose(targets[i], StopLossManager.calculate_take_profit(entry[i], stops[i], side[i]))
+        assert trail[i] == StopLossManager.should_trail_stop(current[i], entry[i], stops[i], side[i])
+        assert trailing[i] == StopLossManager.calculate_trailing_stop(
+            current[i], current[i] + 5, current[i] - 5, trail_side[i], atr[i]
+        )
+
+    # Zero risk never trails
+    assert not StopLossManager.should_trail_stop_batch([10.0], [5.0], [5.0], ["BUY"])[0]
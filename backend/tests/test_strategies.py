@@ -27,3 +27,624 @@ def test_ict_silver_bullet_strategy(sample_bars):
     # Strategy may or may not generate signal depending on conditions
     assert signal is None or isinstance(signal, object)
 
+
+
+@pytest.mark.asyncio
+async def test_ai_router_memoizes_ml_verdicts_per_bar():
+    """Test that matching signals reuse a verdict until the cache is invalidated."""
+    from unittest.mock import Mock
+
+    from strategies.ai_agent_router import AIAgentRouter
+    from strategies.base_strategy import TradingSignal
+
+    router = AIAgentRouter(Mock(ai_agent_type="rule_based"))
+    router.agent_type = "ml_confirmation"
+    router.signal_validator = Mock()
+    router.signal_validator.validate_batch.side_effect = lambda signals, features: [(True, 0.9)] * len(signals)
+
+    def make_signal():
+        return TradingSignal("MNQ", "BUY", 17000.001, 16990.0, 17020.0, strategy_name="trend")
+
+    other = TradingSignal("MES", "SELL", 5000.0, 5010.0, 4980.0, strategy_name="trend")
+    first = await router.process_signals([make_signal(), make_signal(), other])
+    assert [s.confidence for s in first] == [0.9, 0.9, 0.9]
+    # One model call, one row per distinct signal
+    assert router.signal_validator.validate_batch.call_count == 1
+    assert len(router.signal_validator.validate_batch.call_args[0][0]) == 2
+
+    await router.process_signals([make_signal()])
+    assert router.signal_validator.validate_batch.call_count == 1
+
+    router.invalidate_cache()
+    await router.process_signals([make_signal()])
+    assert router.signal_validator.validate_batch.call_count == 2
+
+
+def test_hot_strategies_have_no_instance_dict():
+    """Test that the per-tick strategies are fully slotted."""
+    from strategies.new_strategies import EnhancedMeanReversionStrategy, MomentumStrategy
+    from strategies.opening_range_breakout import OpeningRangeBreakoutStrategy
+
+    for cls in (ICTSilverBulletStrategy, OpeningRangeBreakoutStrategy, EnhancedMeanReversionStrategy, MomentumStrategy):
+        assert not hasattr(cls(["MES"]), "__dict__")
+
+
+def test_trading_signal_slots():
+    """Test that TradingSignal has no instance dict and still serializes."""
+    from dataclasses import asdict
+
+    from strategies.base_strategy import TradingSignal
+
+    signal = TradingSignal("MES", "BUY", 5000.0, 4990.0, 5020.0, confidence=0.7)
+    assert not hasattr(signal, "__dict__")
+    with pytest.raises(AttributeError):
+        signal.unknown = 1
+
+    data = asdict(signal)
+    assert data["quantity"] is None and data["metadata"] == {}
+    assert signal.as_dict() == data
+    assert signal.as_dict()["metadata"] is signal.metadata
+    assert signal.as_tuple() == tuple(data[name] for name in TradingSignal.__slots__)
+
+
+@pytest.mark.asyncio
+async def test_ai_router_loads_model_on_first_signal():
+    """Test that the validator model is only loaded once signals arrive."""
+    from unittest.mock import Mock, patch
+
+    from strategies.ai_agent_router import AIAgentRouter
+    from strategies.base_strategy import TradingSignal
+
+    with patch("strategies.ai_agent_router.SignalValidator") as validator_cls:
+        validator = validator_cls.return_value
+        validator.validate_batch.side_effect = lambda signals, features: [(True, 0.9)] * len(signals)
+        router = AIAgentRouter(Mock(ai_agent_type="ml_confirmation"))
+        validator.load_model.assert_not_called()
+
+        await router.process_signals([])
+        validator.load_model.assert_not_called()
+
+        signal = TradingSignal("MES", "BUY", 5000.0, 4990.0, 5020.0)
+        await router.process_signals([signal])
+        await router.process_signals([signal])
+        validator.load_model.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ict_fair_value_gap_sets_entry():
+    """Test bullish, bearish and absent fair value gaps after a sweep and displacement."""
+    from unittest.mock import patch
+
+    strategy = ICTSilverBulletStrategy(["MNQ"])
+
+    def bars(opens, closes, highs, lows):
+        pad = 57
+        return pl.DataFrame({
+            "timestamp": list(range(pad + 3)),
+            "open": [100.0] * pad + opens,
+            "close": [100.0] * pad + closes,
+            "high": [100.0] * pad + highs,
+            "low": [100.0] * pad + lows,
+            "volume": [1000.0] * (pad + 3),
+        })
+
+    up = bars([10.0, 11.5, 12.5], [11.0, 12.5, 13.5], [10.0, 12.0, 14.0], [9.0, 11.0, 11.0])
+    down = bars([13.5, 12.5, 11.5], [12.5, 11.5, 10.5], [14.0, 12.0, 10.0], [13.0, 11.0, 9.0])
+    no_gap = bars([10.0, 11.5, 12.5], [11.0, 12.5, 13.5], [10.0, 11.0, 12.0], [9.0, 10.0, 9.5])
+
+    with patch.object(ICTSilverBulletStrategy, "is_in_trading_window", return_value=True), \
+            patch.object(ICTSilverBulletStrategy, "_high_low_60m", return_value=(20.0, 15.0)):
+        signal = await strategy.analyze("MNQ", up)
+        assert (signal.side, signal.entry_price) == ("BUY", 11.0)
+        assert await strategy.analyze("MNQ", no_gap) is None
+
+    with patch.object(ICTSilverBulletStrategy, "is_in_trading_window", return_value=True), \
+            patch.object(ICTSilverBulletStrategy, "_high_low_60m", return_value=(5.0, 1.0)):
+        signal = await strategy.analyze("MNQ", down)
+        assert (signal.side, signal.entry_price) == ("SELL", 10.0)
+        # A bullish gap doesn't trade after a sweep of the highs
+        assert await strategy.analyze("MNQ", up) is None
+
+
+def test_ict_strategy_defined_once():
+    """Test that the ICT module has a single strategy class definition."""
+    import inspect
+
+    from strategies import ict_silver_bullet
+
+    assert inspect.getsource(ict_silver_bullet).count("class ICTSilverBulletStrategy(") == 1
+
+
+def test_ict_rolling_high_low_matches_tail(sample_bars):
+    """Test the rolling 60m high/low against a fresh tail(60) scan."""
+    import numpy as np
+
+    strategy = ICTSilverBulletStrategy(["MNQ"])
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 150))
+    bars = pl.DataFrame({
+        "timestamp": np.arange(150),
+        "high": close + rng.uniform(0, 2, 150),
+        "low": close - rng.uniform(0, 2, 150),
+    })
+
+    # Growing stream, a repeated bar, then a gap that forces a rebuild
+    for end in list(range(60, 120)) + [119, 140, 150]:
+        window = bars.slice(0, end)
+        expected = (window.tail(60)["high"].max(), window.tail(60)["low"].min())
+        assert strategy._high_low_60m("MNQ", window) == expected
+
+
+@pytest.mark.asyncio
+async def test_ict_displacement_gates_signal():
+    """Test that only three same-direction candles after a sweep produce a signal."""
+    from unittest.mock import patch
+
+    strategy = ICTSilverBulletStrategy(["MNQ"])
+    n = 60
+    opens = [100.0] * (n - 3) + [90.0, 92.0, 94.0]
+    closes = [100.0] * (n - 3) + [91.0, 93.0, 95.0]
+    bars = pl.DataFrame({
+        "timestamp": list(range(n)),
+        "open": opens,
+        "close": closes,
+        "high": [c + 0.5 for c in closes],
+        "low": [o - 0.5 for o in opens[:-1]] + [93.0],
+        "volume": [1000.0] * n,
+    })
+
+    with patch.object(ICTSilverBulletStrategy, "is_in_trading_window", return_value=True), \
+            patch.object(ICTSilverBulletStrategy, "_high_low_60m", return_value=(110.0, 96.0)):
+        signal = await strategy.analyze("MNQ", bars)
+        assert signal is not None and signal.side == "BUY"
+        assert signal.entry_price == 93.0
+        assert "market_features" in signal.metadata
+
+        # One bearish candle in the last three breaks the displacement
+        broken = bars.with_columns(pl.Series("open", opens[:-2] + [93.5, 94.0]))
+        assert await strategy.analyze("MNQ", broken) is None
+
+
+@pytest.mark.asyncio
+async def test_momentum_and_mean_reversion_signals(sample_bars):
+    """Test the tail-only indicator gates on trending and capitulating bars."""
+    from strategies.new_strategies import EnhancedMeanReversionStrategy, MomentumStrategy
+
+    signal = await MomentumStrategy(["MNQ"]).analyze("MNQ", sample_bars)
+    assert signal.side == "BUY"
+    assert signal.entry_price == sample_bars["close"][-1]
+
+    falling = [100.0 - i * 0.5 for i in range(59)] + [60.0]
+    bars = pl.DataFrame({
+        "timestamp": list(range(60)),
+        "open": falling,
+        "high": [c + 0.5 for c in falling],
+        "low": [c - 0.5 for c in falling],
+        "close": falling,
+        "volume": [1000.0] * 60,
+    })
+    signal = await EnhancedMeanReversionStrategy(["MNQ"]).analyze("MNQ", bars)
+    assert signal.side == "BUY"
+    assert signal.entry_price == 60.0
+
+
+def test_latest_indicators_match_feature_engineer():
+    """Test the latest-bar kernel against the full indicator frame."""
+    import numpy as np
+
+    from ml.feature_engineering import FeatureEngineer
+    from strategies._kernels import latest_indicators
+
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 120))
+    bars = pl.DataFrame({"open": close, "high": close + 1, "low": close - 1, "close": close})
+    latest = FeatureEngineer.calculate_indicators(bars).tail(1)
+    expected = [latest[c][0] for c in ("close", "bb_lower", "bb_upper", "rsi_14", "sma_50", "roc_10")]
+    assert np.allclose(latest_indicators(close), expected)
+
+    short = latest_indicators(close[:15])
+    assert np.isnan(short[1]) and np.isnan(short[4]) and not np.isnan(short[5])
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_matches_per_symbol_analyze():
+    """Test that the batched strategies emit the same signals as per-symbol analyze."""
+    import numpy as np
+
+    from strategies.new_strategies import EnhancedMeanReversionStrategy, MomentumStrategy
+
+    rng = np.random.default_rng(1)
+    symbol_bars = {}
+    for symbol, (n, drift) in {"MNQ": (120, 0.5), "MES": (80, -0.5), "MGC": (40, 0.0), "MYM": (10, 0.0)}.items():
+        close = 100 + np.cumsum(rng.normal(drift, 0.3, n))
+        symbol_bars[symbol] = pl.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": np.full(n, 1000.0)}
+        )
+
+    for strategy in (EnhancedMeanReversionStrategy(list(symbol_bars)), MomentumStrategy(list(symbol_bars))):
+        expected = []
+        for symbol, bars in symbol_bars.items():
+            signal = await strategy.analyze(symbol, bars)
+            if signal:
+                expected.append(signal.as_tuple()[:8])
+        batch = [s.as_tuple()[:8] for s in await strategy.analyze_batch(symbol_bars)]
+        assert batch == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("time_zone", [None, "America/Chicago", "UTC"])
+async def test_orb_range_is_todays_and_reused(time_zone):
+    """Test that the opening range comes from today's bars only and gates breakouts."""
+    from datetime import datetime, timedelta
+    from unittest.mock import patch
+    from zoneinfo import ZoneInfo
+
+    from strategies import _clock
+    from strategies.opening_range_breakout import OpeningRangeBreakoutStrategy
+
+    ct = ZoneInfo("America/Chicago")
+    # Yesterday's session (wide range) followed by today's bars from 8:20
+    times = [datetime(2024, 3, 4, 8, 30) + timedelta(minutes=i) for i in range(16)]
+    times += [datetime(2024, 3, 5, 8, 20) + timedelta(minutes=i) for i in range(40)]
+    highs = [200.0] * 16 + [101.0] * 40
+    lows = [50.0] * 16 + [99.0] * 40
+    for i, t in enumerate(times):
+        if t.day == 5 and (t.hour, t.minute) == (8, 35):
+            highs[i], lows[i] = 102.0, 98.0
+    ts = pl.Series("timestamp", times)
+    if time_zone is not None:
+        ts = ts.dt.replace_time_zone("America/Chicago").dt.convert_time_zone(time_zone)
+    bars = pl.DataFrame({"timestamp": ts, "high": highs, "low": lows, "close": [100.0] * 56})
+
+    class Clock(datetime):
+        current = datetime(2024, 3, 5, 8, 45, tzinfo=ct)
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    strategy = OpeningRangeBreakoutStrategy(["MES"])
+    with patch.object(_clock, "datetime", Clock):
+        _clock.begin_tick()
+        assert await strategy.analyze("MES", bars) is None
+        assert strategy.opening_ranges["MES"] == {"date": Clock.current.date(), "high": 102.0, "low": 98.0}
+
+        Clock.current = datetime(2024, 3, 5, 9, 0, tzinfo=ct)
+        _clock.begin_tick()
+        breakout = bars.with_columns(pl.Series("close", [100.0] * 55 + [103.0]))
+        signal = await strategy.analyze("MES", breakout)
+        assert signal.side == "BUY"
+        batch = await strategy.analyze_batch({"MES": breakout})
+        assert [s.as_tuple() for s in batch] == [signal.as_tuple()]
+
+        # A stale range from another day is ignored
+        Clock.current = datetime(2024, 3, 6, 9, 0, tzinfo=ct)
+        _clock.begin_tick()
+        assert await strategy.analyze("MES", breakout) is None
+
+
+def test_strategy_clock_reads_once_per_tick():
+    """Test that the CT clock is converted once per tick and shared until the next."""
+    from datetime import datetime
+    from unittest.mock import patch
+
+    from strategies import _clock
+    from strategies.ict_silver_bullet import ICTSilverBulletStrategy
+
+    calls = []
+
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            calls.append(tz)
+            return datetime(2024, 3, 5, 9, 30, 15, tzinfo=tz)
+
+    strategy = ICTSilverBulletStrategy(["MES"])
+    with patch.object(_clock, "datetime", Clock):
+        _clock.begin_tick()
+        assert strategy.is_in_trading_window()
+        assert _clock.ct_seconds() == 9 * 3600 + 30 * 60 + 15
+        assert _clock.ct_now().tzinfo is _clock.CT_TZ
+    assert len(calls) == 1
+
+
+def test_specialized_entry_rules():
+    """Test that the compiled entry rules honour their baked-in thresholds."""
+    import numpy as np
+
+    from strategies._kernels import mean_reversion_rule, momentum_rule
+
+    rule, rule_batch = mean_reversion_rule(30.0, 70.0)
+    assert mean_reversion_rule(30.0, 70.0)[0] is rule
+    assert rule(95.0, 96.0, 104.0, 25.0, np.nan, np.nan) == 1
+    assert rule(105.0, 96.0, 104.0, 75.0, np.nan, np.nan) == -1
+    assert rule(95.0, 96.0, 104.0, np.nan, np.nan, np.nan) == 0
+
+    strict, _ = mean_reversion_rule(20.0, 80.0)
+    assert strict(95.0, 96.0, 104.0, 25.0, np.nan, np.nan) == 0
+
+    rule, rule_batch = momentum_rule(0.001)
+    table = np.array([
+        [101.0, 0, 0, 0, 100.0, 0.002],
+        [99.0, 0, 0, 0, 100.0, -0.002],
+        [101.0, 0, 0, 0, 100.0, 0.0005],
+    ])
+    assert rule_batch(table).tolist() == [1, -1, 0]
+
+
+def test_ensemble_weights_follow_last_five_trades():
+    """Test the ensemble's ring buffer against summing the last five PnLs."""
+    from unittest.mock import Mock
+
+    from strategies.strategy_framework import StrategyEnsemble
+
+    a, b = Mock(), Mock()
+    a.name, b.name = "A", "B"
+    ensemble = StrategyEnsemble([a, b])
+    pnls = [10.0, -3.0, -4.0, -5.0, 1.0, -2.0, 0.5, 7.0, -20.0, 3.0, 3.0, 3.0]
+    weight = 1.0
+    for n, pnl in enumerate(pnls, 1):
+        ensemble.update_performance("A", pnl)
+        assert ensemble._sum5["A"] == pytest.approx(sum(pnls[max(0, n - 5):n]))
+        weight = min(2.0, weight * 1.1) if sum(pnls[max(0, n - 5):n]) > 0 else max(0.5, weight * 0.9)
+        assert ensemble.weights["A"] == pytest.approx(weight)
+    # B has no trades, so it keeps its weight; unknown strategies are ignored
+    ensemble.update_performance("C", 1.0)
+    assert ensemble.weights["B"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_repeated_strategy_errors_are_throttled():
+    """Test that a persistent analyze failure logs once, then periodic summaries."""
+    from loguru import logger
+
+    from strategies.new_strategies import MomentumStrategy
+
+    strategy = MomentumStrategy(["MES"])
+    broken = pl.DataFrame({"close": ["x"] * 60})
+    messages = []
+    sink = logger.add(messages.append, format="{message}")
+    try:
+        for _ in range(10):
+            assert await strategy.analyze("MES", broken) is None
+    finally:
+        logger.remove(sink)
+    assert len(messages) == 1 and messages[0].startswith("Momentum Error")
+
+
+def test_ema_tails_match_polars():
+    """Test the fused EMA kernel against Polars' ewm_mean."""
+    import numpy as np
+
+    from strategies._kernels import ema_tails
+
+    rng = np.random.default_rng(2)
+    close = 100 + np.cumsum(rng.normal(0, 1, 250))
+    spans = np.array([10.0, 20.0, 50.0, 200.0])
+    expected = [pl.Series(close).ewm_mean(span=int(span)).tail(1).item() for span in spans]
+    assert np.allclose(ema_tails(close, spans), expected)
+
+
+def test_trend_following_incremental_emas_match_full_pass():
+    """Test the per-symbol EMA state against a fresh pass over each window."""
+    import numpy as np
+
+    from strategies._kernels import ema_tails
+    from strategies.trend_following import EMA_SPANS, TrendFollowingStrategy
+
+    strategy = TrendFollowingStrategy(["MES"])
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, 400))
+    stream = pl.DataFrame({"timestamp": np.arange(400), "close": close})
+
+    # Growing history, a still-forming last bar, a sliding 200-bar window, then a gap
+    for end in list(range(150, 260)) + [259, 300, 400]:
+        bars = stream.slice(max(0, end - 200), min(end, 200))
+        window = bars.get_column("close").to_numpy().copy()
+        window[-1] += 0.5  # the latest bar's close may change between calls
+        bars = bars.with_columns(pl.Series("close", window))
+        assert np.allclose(strategy._ema_values("MES", bars, window), ema_tails(window, EMA_SPANS))
+
+
+def test_atr_is_mean_of_recent_true_ranges():
+    """Test the strategies' ATR against a direct true-range computation."""
+    from strategies.trend_following import TrendFollowingStrategy
+    from strategies.vwap_mean_reversion import VWAPMeanReversionStrategy
+
+    bars = pl.DataFrame({
+        "high": [10.0, 12.0, 11.0, 15.0, 13.0],
+        "low": [9.0, 10.0, 8.0, 12.0, 12.5],
+        "close": [9.5, 11.0, 10.0, 14.0, 13.0],
+    })
+    # TR of the last 3 bars: max(3, 0, 3) = 3; max(3, 5, 2) = 5; max(0.5, 1, 1.5) = 1.5
+    for strategy in (TrendFollowingStrategy(["MES"]), VWAPMeanReversionStrategy(["MES"])):
+        soa = strategy._to_soa(bars)
+        assert strategy._calculate_atr(soa, period=3) == pytest.approx((3.0 + 5.0 + 1.5) / 3)
+        assert strategy._calculate_atr(soa, period=5) is None
+
+
+@pytest.mark.asyncio
+async def test_selector_runs_strategies_together_and_isolates_failures():
+    """Test that one failing strategy doesn't drop the others' signals."""
+    from unittest.mock import AsyncMock, Mock
+
+    from config.settings import Settings
+    from strategies.base_strategy import TradingSignal
+    from strategies.strategy_selector import StrategySelector
+
+    settings = Settings()
+    bars = {"1m": pl.DataFrame({"close": [1.0]}), "5m": pl.DataFrame({"close": [1.0, 2.0]})}
+    data_manager = Mock()
+    data_manager.get_bars = AsyncMock(side_effect=lambda symbol, tf, limit: bars[tf])
+    risk_manager = Mock()
+    risk_manager.check_trade_risk = AsyncMock(return_value=True)
+    selector = StrategySelector(settings, data_manager, risk_manager)
+
+    good, bad = Mock(enabled=True, timeframe="5m"), Mock(enabled=True, timeframe="5m")
+    good.name, bad.name = "good", "bad"
+    good.analyze_batch = AsyncMock(
+        side_effect=lambda symbol_bars: [TradingSignal(s, "BUY", 1.0, 0.5, 2.0) for s in symbol_bars]
+    )
+    bad.analyze_batch = AsyncMock(side_effect=RuntimeError("boom"))
+    selector.strategies = [bad, good]
+    await selector.start()
+
+    signals = await selector.get_signals()
+    assert sorted(s.symbol for s in signals) == sorted(settings.symbols)
+    assert good.analyze_batch.call_args.args[0][settings.symbols[0]] is bars["5m"]
+    # Only the 5m frames are fetched, since no strategy declares 1m
+    assert data_manager.get_bars.await_count == len(settings.symbols)
+    assert {call.args[1] for call in data_manager.get_bars.await_args_list} == {"5m"}
+
+
+def test_vwap_matches_typical_price_average():
+    """Test the VWAP helper against the volume-weighted typical price."""
+    from strategies.vwap_mean_reversion import VWAPMeanReversionStrategy
+
+    bars = pl.DataFrame({
+        "high": [11.0, 12.0, 13.0],
+        "low": [9.0, 10.0, 11.0],
+        "close": [10.0, 11.0, 12.0],
+        "volume": [100, 300, 600],
+    })
+    expected = (10.0 * 100 + 11.0 * 300 + 12.0 * 600) / 1000
+    strategy = VWAPMeanReversionStrategy(["MES"])
+    assert strategy._calculate_vwap(strategy._to_soa(bars)) == pytest.approx(expected)
+    assert strategy._calculate_vwap(strategy._to_soa(bars.drop("volume"))) is None
+
+
+def test_vwap_strategy_rsi_uses_last_period_moves():
+    """Test the VWAP strategy's Wilder RSI on hand-computed gains and losses."""
+    import math
+
+    import numpy as np
+
+    from strategies.vwap_mean_reversion import VWAPMeanReversionStrategy
+
+    strategy = VWAPMeanReversionStrategy(["MES"])
+    # Moves -40, +2, -1, +1: seed gain 2/3, loss 41/3; one Wilder step -> 7/9, 82/9
+    prices = np.array([50.0, 10.0, 12.0, 11.0, 12.0])
+    assert strategy._calculate_rsi(prices, period=3) == pytest.approx(100 * 7 / 89)
+    assert strategy._calculate_rsi(np.array([1.0, 2.0, 3.0, 4.0]), period=3) == 100.0
+    assert math.isnan(strategy._calculate_rsi(np.ones(4), period=3))
+    assert strategy._calculate_rsi(prices[:3], period=3) is None
+
+
+@pytest.mark.asyncio
+async def test_trend_following_alignment_gates_pullback_entry():
+    """Test that only a fully aligned EMA stack with a pullback to EMA 20/50 signals."""
+    from unittest.mock import patch
+
+    import numpy as np
+
+    from strategies.trend_following import TrendFollowingStrategy
+
+    strategy = TrendFollowingStrategy(["MES"])
+    bars = pl.DataFrame({
+        "high": np.full(200, 101.0),
+        "low": np.full(200, 99.0),
+        "close": np.full(200, 100.0),
+    })
+    cases = {
+        (99.95, 99.9, 99.0, 90.0): "BUY",  # price > 10 > 20 > 50 > 200, near EMA 20
+        (100.05, 100.1, 101.0, 110.0): "SELL",
+        (99.9, 99.95, 99.0, 90.0): None,  # EMA 10 < EMA 20 breaks the stack
+    }
+    for emas, side in cases.items():
+        with patch.object(TrendFollowingStrategy, "_ema_values", return_value=np.array(emas)):
+            signal = await strategy.analyze("MES", bars)
+        assert (signal.side if signal else None) == side
+
+
+@pytest.mark.asyncio
+async def test_filter_signals_keeps_best_approved_per_symbol():
+    """Test that a risk-rejected best signal falls back to the symbol's next best."""
+    from unittest.mock import AsyncMock, Mock
+
+    from config.settings import Settings
+    from strategies.base_strategy import TradingSignal
+    from strategies.strategy_selector import StrategySelector
+
+    risk_manager = Mock()
+    # Reject the MES signal at 0.9 only
+    risk_manager.check_trade_risk = AsyncMock(
+        side_effect=lambda s: not (s["symbol"] == "MES" and s["confidence"] == 0.9)
+    )
+    selector = StrategySelector(Settings(), Mock(), risk_manager)
+
+    signals = [
+        TradingSignal("MES", "BUY", 1.0, 0.5, 2.0, confidence=0.5, strategy_name="low"),
+        TradingSignal("MES", "BUY", 1.0, 0.5, 2.0, confidence=0.9, strategy_name="rejected"),
+        TradingSignal("MES", "SELL", 1.0, 1.5, 0.5, confidence=0.7, strategy_name="fallback"),
+        TradingSignal("MNQ", "BUY", 1.0, 0.5, 2.0, confidence=0.8, strategy_name="mnq"),
+        TradingSignal("MNQ", "BUY", 1.0, 0.5, 2.0, confidence=0.8, strategy_name="mnq-tie"),
+    ]
+    filtered = await selector._filter_signals(signals)
+    assert [s.strategy_name for s in filtered] == ["mnq", "fallback"]
+    assert risk_manager.check_trade_risk.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_disabled_entry_side_is_skipped():
+    """Test that settings.enable_long_entries=False stops long entries."""
+    from unittest.mock import Mock, patch
+
+    import numpy as np
+
+    from config.settings import Settings
+    from strategies.strategy_selector import StrategySelector
+    from strategies.trend_following import TrendFollowingStrategy
+
+    selector = StrategySelector(Settings(enable_long_entries=False), Mock(), Mock())
+    assert all(not s.allow_long and s.allow_short for s in selector.strategies)
+
+    strategy = TrendFollowingStrategy(["MES"])
+    strategy.allow_long = False
+    bars = pl.DataFrame({
+        "high": np.full(200, 101.0),
+        "low": np.full(200, 99.0),
+        "close": np.full(200, 100.0),
+    })
+    cases = {(99.95, 99.9, 99.0, 90.0): None, (100.05, 100.1, 101.0, 110.0): "SELL"}
+    for emas, side in cases.items():
+        with patch.object(TrendFollowingStrategy, "_ema_values", return_value=np.array(emas)):
+            signal = await strategy.analyze("MES", bars)
+        assert (signal.side if signal else None) == side
+
+
+@pytest.mark.asyncio
+async def test_selector_reuses_analysis_until_bars_change():
+    """Test that unchanged bar frames skip re-analysis and hand out fresh signal copies."""
+    from unittest.mock import AsyncMock, Mock, patch
+
+    from config.settings import Settings
+    from strategies.base_strategy import TradingSignal
+    from strategies.strategy_selector import StrategySelector
+
+    settings = Settings(symbols=["MES"])
+    bars = {"5m": pl.DataFrame({"close": [1.0, 2.0]})}
+    data_manager = Mock()
+    data_manager.get_bars = AsyncMock(side_effect=lambda symbol, tf, limit: bars[tf])
+    risk_manager = Mock()
+    risk_manager.check_trade_risk = AsyncMock(return_value=True)
+    selector = StrategySelector(settings, data_manager, risk_manager)
+
+    strategy = Mock(enabled=True, timeframe="5m")
+    strategy.name = "mock"
+    strategy.analyze_batch = AsyncMock(
+        side_effect=lambda symbol_bars: [TradingSignal(s, "BUY", 1.0, 0.5, 2.0, confidence=0.8) for s in symbol_bars]
+    )
+    selector.strategies = [strategy]
+    await selector.start()
+
+    # Pinned to one minute, so the cache can't expire between calls
+    with patch("strategies.strategy_selector.ct_seconds", return_value=36_000):
+        first = await selector.get_signals()
+        first[0].confidence = 0.1  # e.g. adjusted downstream
+        second = await selector.get_signals()
+        assert strategy.analyze_batch.await_count == 1
+        assert second[0] is not first[0] and second[0].confidence == 0.8
+
+        bars["5m"] = pl.DataFrame({"close": [1.0, 2.0, 3.0]})
+        await selector.get_signals()
+        assert strategy.analyze_batch.await_count == 2
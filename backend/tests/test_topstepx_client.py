@@ -0,0 +1,36 @@
+"""Tests for the V1 TopstepX client."""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from unittest.mock import AsyncMock, Mock
+
+from api.auth_manager import AuthManager
+from api.topstepx_client import TopstepXClient
+from config.settings import Settings
+
+
+@pytest.mark.asyncio
+async def test_empty_success_body_is_none_and_not_retried():
+    """Test that a 2xx with no body returns None instead of re-sending the request."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        return web.Response(status=200, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/Order/cancel", handler)
+    async with TestServer(app) as server:
+        settings = Mock(spec=Settings)
+        settings.topstepx_base_url = str(server.make_url(""))
+        auth = Mock(spec=AuthManager)
+        auth.get_headers = AsyncMock(return_value={})
+        client = TopstepXClient(settings, auth)
+        await client.initialize()
+        try:
+            assert await client._request("POST", "/Order/cancel", json={}) is None
+        finally:
+            await client.close()
+
+    assert calls == ["/Order/cancel"]
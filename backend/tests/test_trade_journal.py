@@ -0,0 +1,50 @@
+"""Tests for the buffered trade journal."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+pytest.importorskip("sqlalchemy.ext.asyncio")
+
+from config.settings import Settings
+from monitoring.trade_journal import TradeJournal
+
+
+def _settings(database_url: str = "sqlite+aiosqlite://"):
+    settings = Mock(spec=Settings)
+    settings.database_url = database_url
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_outage_buffer_is_capped_and_connect_retried():
+    """Test that a failed connect still starts the flusher and bounds the buffer."""
+    journal = TradeJournal(_settings())
+    journal.MAX_BUFFERED = 3
+    with patch("monitoring.trade_journal.create_async_engine", side_effect=OSError("db down")) as engine:
+        for i in range(5):
+            await journal.log_trade({"trade_id": str(i)})
+        # Connected once on the first trade, not once per trade
+        assert engine.call_count == 1
+        assert journal._flusher_task is not None and not journal._initialized
+        assert [t["trade_id"] for t in journal._buf] == ["2", "3", "4"]
+        await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_buffered_trades_are_written_and_streamed(tmp_path):
+    """Test that buffered trades land in one insert and stream back in entry order."""
+    pytest.importorskip("aiosqlite")
+    journal = TradeJournal(_settings(f"sqlite+aiosqlite:///{tmp_path / 'journal.db'}"))
+    t0 = datetime(2024, 1, 2, 9, 30)
+    for i in (2, 0, 1):
+        await journal.log_trade(
+            {"trade_id": f"T{i}", "symbol": "MES", "pnl": float(i), "entry_time": t0 + timedelta(minutes=i)}
+        )
+    assert journal._initialized
+
+    trades = await journal.get_trades(start_date=t0 + timedelta(minutes=1))
+    assert [t["trade_id"] for t in trades] == ["T1", "T2"]
+    assert not journal._buf
+    await journal.close()